@@ -12,32 +12,265 @@ Usage:
 """
 
 import argparse
+import asyncio
+import io
 import json
+import os
+import socket
+import socketserver
 import sys
-import time
+import threading
 import traceback
-from datetime import datetime
-from typing import Dict, List, Optional, Any
+from collections import OrderedDict
+from csv import DictWriter
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Any, Tuple
+from urllib.parse import urlencode
 
 try:
     import requests
-    from bs4 import BeautifulSoup
+    import lxml.etree
+    import lxml.html
     import pandas as pd
+    import numpy as np
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry, make_headers
 except ImportError as e:
-    print(f"Error: Required package not installed. Install with: pip3 install requests beautifulsoup4 lxml pandas")
+    print(f"Error: Required package not installed. Install with: pip3 install requests lxml pandas numpy")
     sys.exit(1)
 
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Per-host concurrency limit for bulk fetches
+MAX_CONCURRENT_REQUESTS = 8
+
+# How long fetched pages stay fresh, both on disk and as parsed trees in memory
+CACHE_EXPIRY = timedelta(hours=6)
+
+# Parsed pages kept in memory per scraper
+TREE_CACHE_SIZE = 8
+
+# Bytes read per chunk when stream-parsing large pages
+STREAM_CHUNK_SIZE = 65536
+
+# Daemon mode: default socket and the CLI fields forwarded with each request
+DEFAULT_SOCKET = '/tmp/barttorvik.sock'
+DAEMON_REQUEST_FIELDS = ('command', 'top', 'season', 'seasons', 'team', 'teams', 'team1', 'team2', 'neutral')
+
+def _nullable_float(text: str) -> Optional[float]:
+    """Parse a float cell, treating Barttorvik's '-' placeholder as missing."""
+    return None if text == '-' else float(text)
+
+# Leading columns of the T-Rank ratings table, in page order, with their cell parsers
+RANKINGS_SCHEMA = [
+    ('rank', int),
+    ('team', str),
+    ('t_rank', _nullable_float),
+    ('adj_oe', _nullable_float),
+    ('adj_de', _nullable_float),
+    ('adj_tempo', _nullable_float),
+    ('record', str),
+    ('conf_record', str)
+]
+
+# Body rows of the ratings table, or of the generic tablesorter table as a fallback
+RANKINGS_ROWS_XPATH = '(//table[@id="ratingsTable"]//tr)[position()>1]'
+TABLESORTER_ROWS_XPATH = '(//table[contains(concat(" ", normalize-space(@class), " "), " tablesorter ")][1]//tr)[position()>1]'
+
+# Body rows of every team.php table with a "rank" header, minus each table's first row
+TEAM_STATS_ROWS_XPATH = '//table[.//th[contains(translate(normalize-space(.), "RANK", "rank"), "rank")]]/descendant::tr[position()>1]'
+
+def _compile_row_parser(name: str, schema: List[Tuple[str, Any]]):
+    """Generate a row parser specialized to a fixed column schema.
+    
+    The generated function reads each cell once by position and inlines the
+    int/float/str casts and the '-' check, so the per-row loop does no schema
+    lookups. Other cell parsers are called by name.
+    """
+    inline = {
+        int: 'int({})',
+        float: 'float({})',
+        str: '{}',
+        _nullable_float: "(None if {0} == '-' else float({0}))"
+    }
+    namespace = {}
+    lines = [f'def {name}(cells, season):']
+    fields = []
+    for i, (field, cast) in enumerate(schema):
+        lines.append(f'    t{i} = cells[{i}].text_content().strip()')
+        if cast in inline:
+            fields.append(f'{field!r}: ' + inline[cast].format(f't{i}'))
+        else:
+            namespace[f'cast{i}'] = cast
+            fields.append(f'{field!r}: cast{i}(t{i})')
+    fields.append("'season': season")
+    lines.append('    return {' + ', '.join(fields) + '}')
+    
+    exec(compile('\n'.join(lines), f'<{name}>', 'exec'), namespace)
+    return namespace[name]
+
+_parse_ranking_row = _compile_row_parser('_parse_ranking_row', RANKINGS_SCHEMA)
+
+def _to_records(df: pd.DataFrame) -> List[Dict]:
+    """Convert a DataFrame to row dicts with missing values as None."""
+    return df.astype(object).where(df.notna(), None).to_dict('records')
+
+def _parse_rankings(doc, top: Optional[int], season: str) -> List[Dict]:
+    """Parse the ratings table from a parsed trank.php page."""
+    rows = doc.xpath(RANKINGS_ROWS_XPATH) or doc.xpath(TABLESORTER_ROWS_XPATH)
+    
+    rankings = []
+    for row in rows:
+        cells = row.xpath('./td|./th')
+        if len(cells) < len(RANKINGS_SCHEMA):  # Ensure enough columns
+            continue
+        
+        try:
+            rankings.append(_parse_ranking_row(cells, season))
+        except ValueError:  # Repeated header rows have no numeric rank
+            continue
+        
+        if top and len(rankings) >= top:
+            break
+    
+    return rankings
+
+def _stream_table_rows(chunks, table_id: str):
+    """Yield cell text for each body row of the table with table_id as HTML streams in.
+    
+    Rows are cleared once read, so the retained tree stays a few rows deep
+    regardless of page size. Rows of the first tablesorter table are buffered
+    and yielded instead if the page has no table with that id.
+    """
+    parser = lxml.etree.HTMLPullParser(events=('end',), tag='tr')
+    seen_tables = set()
+    fallback_table = None
+    fallback_rows = []
+    found = False
+    
+    def read_rows():
+        nonlocal fallback_table, found
+        for _, row in parser.read_events():
+            table = next(row.iterancestors('table'), None)
+            if table is not None:
+                is_header = table not in seen_tables  # Skip each table's first row
+                seen_tables.add(table)
+                if table.get('id') == table_id:
+                    if not is_header:
+                        found = True
+                        yield [''.join(cell.itertext()) for cell in row.xpath('./td|./th')]
+                elif not found and 'tablesorter' in (table.get('class') or '').split():
+                    if fallback_table is None:
+                        fallback_table = table
+                    if table is fallback_table and not is_header:
+                        fallback_rows.append([''.join(cell.itertext()) for cell in row.xpath('./td|./th')])
+            
+            # Drop the finished row and any earlier siblings
+            row.clear()
+            while row.getprevious() is not None:
+                del row.getparent()[0]
+    
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from read_rows()
+    parser.close()
+    yield from read_rows()
+    
+    if not found:
+        yield from fallback_rows
+
+def _parse_players(rows, top: Optional[int], season: str) -> List[Dict]:
+    """Parse player table rows (lists of cell text) column-wise.
+    
+    Cell text is pulled into a 2-D string array once; stripping and numeric
+    coercion then run per column (np.char.strip, pd.to_numeric) rather than
+    per cell.
+    """
+    texts = []
+    for cells in rows:
+        if len(cells) >= 5:
+            texts.append(cells)
+            if top and len(texts) >= top:
+                break  # Stop reading the stream early
+    
+    if not texts:
+        return []
+    
+    # Rows missing trailing stat cells are padded with the '-' placeholder, so they come out as missing values
+    width = max(len(cells) for cells in texts)
+    grid = np.char.strip(np.array([cells + ['-'] * (width - len(cells)) for cells in texts], dtype=str))
+    columns = ['player', 'team', 'position', 'rating'] + [f'stat_{j}' for j in range(4, width)]
+    
+    df = pd.DataFrame({name: grid[:, j] for j, name in enumerate(columns)})
+    df = df.mask(df == '-')  # '-' placeholders become missing values
+    
+    # Convert rating/stat columns that are entirely numeric
+    for name in columns[3:]:
+        values = pd.to_numeric(df[name], errors='coerce')
+        if values.notna().sum() == df[name].notna().sum():
+            df[name] = values
+    
+    df.insert(0, 'rank', range(1, len(df) + 1))
+    df.insert(5, 'season', season)
+    
+    return _to_records(df)
+
 class BarttovikScraper:
     """Scraper for Barttorvik T-Rank college basketball data."""
     
-    def __init__(self, debug: bool = False):
+    def __init__(self, debug: bool = False, use_cache: bool = True):
         self.debug = debug
+        self.use_cache = use_cache
         self.base_url = "https://barttorvik.com"
-        self.session = requests.Session()
+        self._tree_cache = OrderedDict()  # url -> (parsed_at, tree), least recently used first
+        self._tree_lock = threading.Lock()  # The bulk paths and edge_finder's workers share one scraper
+        if use_cache and requests_cache is not None:
+            # Persist responses on disk so repeated CLI runs skip the network
+            self.session = requests_cache.CachedSession(
+                'barttorvik_cache',
+                backend='sqlite',
+                use_cache_dir=True,
+                expire_after=CACHE_EXPIRY,
+                allowable_codes=[200],
+                stale_if_error=True,
+                cache_control=True
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            # gzip/deflate always, br when a brotli decoder is installed
+            'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding'],
+            'Connection': 'keep-alive'
         })
         
+        # Keep-alive pool plus exponential backoff with jitter for rate limits and gateway errors
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=1.5,
+                backoff_jitter=0.5,
+                status_forcelist=[429, 502, 503, 504],
+                respect_retry_after_header=True
+            )
+        )
+        self.session.mount('https://', adapter)
+        
     def log(self, message: str):
         """Log debug messages if debug mode enabled."""
         if self.debug:
@@ -47,38 +280,92 @@ class BarttovikScraper:
         """Format output data as JSON, pretty JSON, or CSV."""
         if csv and isinstance(data, list) and len(data) > 0:
             if isinstance(data[0], dict):
-                df = pd.DataFrame(data)
-                return df.to_csv(index=False)
+                # Nested values need pandas; flat rows go straight through the csv module
+                if any(isinstance(value, (dict, list)) for value in data[0].values()):
+                    df = pd.DataFrame(data)
+                    return df.to_csv(index=False)
+                
+                buf = io.StringIO()
+                writer = DictWriter(buf, fieldnames=list(dict.fromkeys(k for row in data for k in row)), lineterminator='\n')
+                writer.writeheader()
+                writer.writerows(data)
+                return buf.getvalue()
+        
+        if orjson is not None:
+            option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(data, default=str, option=option).decode()
         
         if pretty:
             return json.dumps(data, indent=2, default=str)
         else:
             return json.dumps(data, default=str)
     
-    def get_with_retry(self, url: str, max_retries: int = 3) -> Optional[requests.Response]:
-        """Get URL with retry logic for Cloudflare protection."""
-        for attempt in range(max_retries):
-            try:
-                self.log(f"Attempting to fetch {url} (attempt {attempt + 1})")
-                
-                response = self.session.get(url, timeout=30)
-                
-                # Check for Cloudflare challenge
-                if "checking your browser" in response.text.lower() or response.status_code == 503:
-                    self.log("Cloudflare challenge detected, waiting...")
-                    time.sleep(5 * (attempt + 1))  # Exponential backoff
-                    continue
-                
-                response.raise_for_status()
-                return response
-                
-            except requests.RequestException as e:
-                self.log(f"Request failed: {str(e)}")
-                if attempt == max_retries - 1:
-                    raise
-                time.sleep(2)
+    def build_url(self, path: str, params: Dict[str, str] = None) -> str:
+        """Build a canonical page URL so equivalent requests share one cache key."""
+        url = f"{self.base_url}/{path}"
+        if params:
+            url += '?' + urlencode(params)
+        return url
+    
+    def get_with_retry(self, url: str, *, params: Dict[str, str] = None, stream: bool = False) -> Optional[requests.Response]:
+        """Get URL, raising if Cloudflare serves a challenge instead of the page.
+        
+        Retries with exponential backoff and jitter (429/5xx, dropped
+        connections, Retry-After) are handled by the session's HTTPAdapter.
+        Streamed responses are only checked for the cf-mitigated header, since
+        reading the body here would defeat streaming. They also bypass the
+        response cache, which would otherwise read the whole body to store it.
+        """
+        self.log(f"Fetching {url}")
+        
+        if stream and hasattr(self.session, 'cache_disabled'):
+            with self.session.cache_disabled():
+                response = self.session.get(url, params=params, timeout=(5, 30), stream=True)
+        else:
+            response = self.session.get(url, params=params, timeout=(5, 30), stream=stream)
+        
+        # Check for Cloudflare challenge
+        challenged = response.headers.get('cf-mitigated') == 'challenge'
+        if not stream:
+            challenged = challenged or "checking your browser" in response.text.lower()
+        if challenged:
+            if hasattr(self.session, 'cache'):
+                self.session.cache.delete(urls=[response.url])  # Don't replay the challenge page
+            raise requests.HTTPError(f"Cloudflare challenge served for {url}", response=response)
+        
+        response.raise_for_status()
+        return response
+    
+    def _get_tree(self, url: str):
+        """Fetch and parse a page, reusing the parsed tree for recently seen URLs.
+        
+        Cached trees are shared between callers and must not be modified.
+        """
+        with self._tree_lock:
+            cached = self._tree_cache.get(url)
+            if cached and datetime.now() - cached[0] < CACHE_EXPIRY:
+                self._tree_cache.move_to_end(url)
+            else:
+                cached = None
+        if cached:
+            self.log(f"Reusing parsed page for {url}")
+            return cached[1]
         
-        return None
+        response = self.get_with_retry(url)
+        return self._remember_tree(url, response.content)
+    
+    def _remember_tree(self, url: str, content: bytes):
+        """Parse page bytes and keep the tree in the LRU when caching is enabled."""
+        doc = lxml.html.fromstring(content)
+        if self.use_cache:
+            with self._tree_lock:
+                self._tree_cache[url] = (datetime.now(), doc)
+                self._tree_cache.move_to_end(url)
+                if len(self._tree_cache) > TREE_CACHE_SIZE:
+                    self._tree_cache.popitem(last=False)
+        return doc
     
     def get_rankings(self, top: int = None, season: str = None) -> List[Dict]:
         """Get T-Rank team rankings."""
@@ -86,104 +373,123 @@ class BarttovikScraper:
             if season is None:
                 season = str(datetime.now().year)
             
-            url = f"{self.base_url}/trank.php"
-            if season:
-                url += f"?year={season}"
-            
-            response = self.get_with_retry(url)
-            if not response:
-                return []
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find the main rankings table
-            table = soup.find('table', {'id': 'ratingsTable'})
-            if not table:
-                # Try alternative table selectors
-                table = soup.find('table', {'class': 'tablesorter'})
-                if not table:
-                    self.log("Could not find rankings table")
-                    return []
+            url = self.build_url('trank.php', {'year': season})
             
-            rankings = []
-            rows = table.find_all('tr')[1:]  # Skip header
-            
-            for i, row in enumerate(rows):
-                if top and i >= top:
-                    break
-                    
-                cells = row.find_all(['td', 'th'])
-                if len(cells) < 8:  # Ensure enough columns
-                    continue
-                
-                try:
-                    rank_data = {
-                        'rank': int(cells[0].get_text(strip=True)),
-                        'team': cells[1].get_text(strip=True),
-                        't_rank': float(cells[2].get_text(strip=True)) if cells[2].get_text(strip=True) != '-' else None,
-                        'adj_oe': float(cells[3].get_text(strip=True)) if cells[3].get_text(strip=True) != '-' else None,
-                        'adj_de': float(cells[4].get_text(strip=True)) if cells[4].get_text(strip=True) != '-' else None,
-                        'adj_tempo': float(cells[5].get_text(strip=True)) if cells[5].get_text(strip=True) != '-' else None,
-                        'record': cells[6].get_text(strip=True),
-                        'conf_record': cells[7].get_text(strip=True) if len(cells) > 7 else None,
-                        'season': season
-                    }
-                    rankings.append(rank_data)
-                except (ValueError, IndexError) as e:
-                    self.log(f"Error parsing row {i}: {str(e)}")
-                    continue
-            
-            return rankings
+            return self.parse_rankings(self._get_tree(url), top, season)
             
         except Exception as e:
             self.log(f"Error getting rankings: {str(e)}")
             return []
     
+    def parse_rankings(self, doc, top: int = None, season: str = None) -> List[Dict]:
+        """Parse T-Rank rankings from a parsed trank.php page."""
+        rankings = _parse_rankings(doc, top, season)
+        if not rankings:
+            self.log("Could not find rankings table")
+        
+        return rankings
+    
     def get_team_stats(self, team: str, season: str = None) -> Dict:
         """Get detailed stats for a specific team."""
         try:
             if season is None:
                 season = str(datetime.now().year)
             
-            # First get team page URL
-            url = f"{self.base_url}/team.php"
-            params = {'team': team, 'year': season}
-            
-            response = self.get_with_retry(url, params=params)
-            if not response:
-                return {}
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            team_data = {
-                'team': team,
-                'season': season,
-                'stats': {}
-            }
+            url = self.build_url('team.php', {'team': team, 'year': season})
             
-            # Look for stat tables
-            tables = soup.find_all('table')
-            
-            for table in tables:
-                # Try to identify what type of stats table this is
-                headers = [th.get_text(strip=True) for th in table.find_all('th')]
-                
-                if any('rank' in h.lower() for h in headers):
-                    # This looks like a rankings table
-                    rows = table.find_all('tr')[1:]  # Skip header
-                    for row in rows:
-                        cells = row.find_all(['td', 'th'])
-                        if len(cells) >= 2:
-                            stat_name = cells[0].get_text(strip=True)
-                            stat_value = cells[1].get_text(strip=True)
-                            team_data['stats'][stat_name] = stat_value
-            
-            return team_data
+            return self.parse_team_stats(self._get_tree(url), team, season)
             
         except Exception as e:
             self.log(f"Error getting team stats: {str(e)}")
             return {}
     
+    def parse_team_stats(self, doc, team: str, season: str) -> Dict:
+        """Parse stat tables from a parsed team.php page."""
+        rows = doc.xpath(TEAM_STATS_ROWS_XPATH)
+        
+        return {
+            'team': team,
+            'season': season,
+            'stats': {
+                row.xpath('string(./*[1])').strip(): row.xpath('string(./*[2])').strip()
+                for row in rows if len(row) >= 2
+            }
+        }
+    
+    async def _fetch(self, session, url: str, semaphore) -> bytes:
+        """Fetch a single URL under the shared concurrency limit."""
+        async with semaphore:
+            self.log(f"Fetching {url}")
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                response.raise_for_status()
+                return await response.read()
+    
+    async def _fetch_and_parse(self, urls: List[str], parse) -> List[Any]:
+        """Fetch URLs concurrently and parse each body in a worker thread.
+        
+        `parse` is called as parse(index, content). Failed fetches yield None.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+        connector = aiohttp.TCPConnector(limit_per_host=MAX_CONCURRENT_REQUESTS)
+        headers = {'User-Agent': self.session.headers['User-Agent']}
+        
+        async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+            bodies = await asyncio.gather(
+                *(self._fetch(session, url, semaphore) for url in urls),
+                return_exceptions=True
+            )
+            
+        # lxml releases the GIL while building trees, so parse off the event loop
+        pending = {}
+        for i, (url, body) in enumerate(zip(urls, bodies)):
+            if isinstance(body, Exception):
+                self.log(f"Request failed for {url}: {str(body)}")
+            else:
+                pending[i] = loop.run_in_executor(None, parse, i, body)
+        
+        parsed = await asyncio.gather(*pending.values(), return_exceptions=True)
+        
+        results = [None] * len(urls)
+        for i, value in zip(pending, parsed):
+            if isinstance(value, Exception):
+                self.log(f"Error parsing {urls[i]}: {str(value)}")
+            else:
+                results[i] = value
+        
+        return results
+    
+    def get_rankings_bulk(self, seasons: List[str], top: int = None) -> Dict[str, List[Dict]]:
+        """Get T-Rank rankings for several seasons, fetched concurrently."""
+        if aiohttp is None:
+            self.log("aiohttp not installed, fetching seasons sequentially")
+            return {season: self.get_rankings(top, season) for season in seasons}
+        
+        urls = [self.build_url('trank.php', {'year': season}) for season in seasons]
+        
+        def parse(i, content):
+            return self.parse_rankings(self._remember_tree(urls[i], content), top, seasons[i])
+        
+        results = asyncio.run(self._fetch_and_parse(urls, parse))
+        return {season: result or [] for season, result in zip(seasons, results)}
+    
+    def get_team_stats_bulk(self, teams: List[str], season: str = None) -> List[Dict]:
+        """Get detailed stats for several teams, fetched concurrently."""
+        if season is None:
+            season = str(datetime.now().year)
+        
+        if aiohttp is None:
+            self.log("aiohttp not installed, fetching teams sequentially")
+            return [self.get_team_stats(team, season) for team in teams]
+        
+        urls = [self.build_url('team.php', {'team': team, 'year': season}) for team in teams]
+        
+        def parse(i, content):
+            return self.parse_team_stats(self._remember_tree(urls[i], content), teams[i], season)
+        
+        results = asyncio.run(self._fetch_and_parse(urls, parse))
+        return [result or {} for result in results]
+    
     def get_game_prediction(self, team1: str, team2: str, neutral: bool = True) -> Dict:
         """Get game prediction between two teams."""
         try:
@@ -217,54 +523,21 @@ class BarttovikScraper:
             if season is None:
                 season = str(datetime.now().year)
             
-            url = f"{self.base_url}/players.php"
             params = {'year': season}
             if team:
                 params['team'] = team
+            url = self.build_url('players.php', params)
             
-            response = self.get_with_retry(url)
+            response = self.get_with_retry(url, stream=True)
             if not response:
                 return []
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find player stats table
-            table = soup.find('table', {'id': 'playersTable'})
-            if not table:
-                table = soup.find('table', {'class': 'tablesorter'})
-                if not table:
-                    self.log("Could not find player stats table")
-                    return []
-            
-            players = []
-            rows = table.find_all('tr')[1:]  # Skip header
-            
-            for i, row in enumerate(rows):
-                if top and i >= top:
-                    break
-                    
-                cells = row.find_all(['td', 'th'])
-                if len(cells) < 5:
-                    continue
-                
-                try:
-                    player_data = {
-                        'rank': i + 1,
-                        'player': cells[0].get_text(strip=True),
-                        'team': cells[1].get_text(strip=True),
-                        'position': cells[2].get_text(strip=True) if len(cells) > 2 else None,
-                        'rating': cells[3].get_text(strip=True) if len(cells) > 3 else None,
-                        'season': season
-                    }
-                    
-                    # Add additional stats if available
-                    for j, cell in enumerate(cells[4:], 4):
-                        player_data[f'stat_{j}'] = cell.get_text(strip=True)
-                    
-                    players.append(player_data)
-                except (ValueError, IndexError) as e:
-                    self.log(f"Error parsing player row {i}: {str(e)}")
-                    continue
+            # Parse while the body downloads instead of buffering it whole
+            with response:
+                rows = _stream_table_rows(response.iter_content(STREAM_CHUNK_SIZE), 'playersTable')
+                players = _parse_players(rows, top, season)
+            if not players:
+                self.log("Could not find player stats table")
             
             return players
             
@@ -272,6 +545,70 @@ class BarttovikScraper:
             self.log(f"Error getting player stats: {str(e)}")
             return []
 
+def run_command(scraper: BarttovikScraper, args: argparse.Namespace) -> Any:
+    """Run a CLI command against the scraper and return its result."""
+    if args.command == 'rankings':
+        if args.seasons:
+            return scraper.get_rankings_bulk(args.seasons, args.top)
+        return scraper.get_rankings(args.top, args.season)
+    
+    elif args.command == 'team-stats':
+        if args.teams:
+            return scraper.get_team_stats_bulk(args.teams, args.season)
+        if not args.team:
+            raise ValueError("--team or --teams is required for team-stats command")
+        return scraper.get_team_stats(args.team, args.season)
+    
+    elif args.command == 'game-prediction':
+        if not args.team1 or not args.team2:
+            raise ValueError("--team1 and --team2 are required for game-prediction command")
+        return scraper.get_game_prediction(args.team1, args.team2, args.neutral)
+    
+    elif args.command == 'player-stats':
+        return scraper.get_player_stats(args.team, args.season, args.top)
+    
+    return None
+
+def serve(scraper: BarttovikScraper, socket_path: str):
+    """Answer commands over a Unix socket, one JSON request per line.
+    
+    The scraper (HTTP session, Cloudflare cookies, response and parse caches)
+    lives for the whole daemon, so repeat queries skip connection setup.
+    """
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for line in self.rfile:
+                try:
+                    request = argparse.Namespace(**json.loads(line))
+                    reply = {'result': run_command(scraper, request)}
+                except Exception as e:
+                    scraper.log(f"Request failed: {str(e)}")
+                    reply = {'error': str(e)}
+                self.wfile.write(json.dumps(reply, default=str).encode() + b'\n')
+    
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    
+    with socketserver.UnixStreamServer(socket_path, Handler) as server:
+        print(f"Serving on {socket_path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        finally:
+            os.unlink(socket_path)
+
+def send_command(socket_path: str, args: argparse.Namespace) -> Any:
+    """Send a command to a running daemon and return its result."""
+    request = {field: getattr(args, field) for field in DAEMON_REQUEST_FIELDS}
+    
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(json.dumps(request).encode() + b'\n')
+        reply = json.loads(sock.makefile('rb').readline())
+    
+    if 'error' in reply:
+        raise RuntimeError(reply['error'])
+    return reply['result']
+
 def main():
     parser = argparse.ArgumentParser(
         description='Barttorvik T-Rank Data Scraper',
@@ -280,50 +617,54 @@ def main():
 Examples:
   %(prog)s rankings --top 25
   %(prog)s rankings --season 2025
+  %(prog)s rankings --seasons 2024 2025 2026 --top 25
   %(prog)s team-stats --team "Duke"
+  %(prog)s team-stats --teams "Duke" "North Carolina" "Kansas"
   %(prog)s game-prediction --team1 "Duke" --team2 "UNC" --neutral
   %(prog)s player-stats --team "Duke" --top 10
+  %(prog)s --serve --socket /tmp/barttorvik.sock
+  %(prog)s rankings --top 25 --socket /tmp/barttorvik.sock
         '''
     )
     
-    parser.add_argument('command', choices=[
+    parser.add_argument('command', nargs='?', choices=[
         'rankings', 'team-stats', 'game-prediction', 'player-stats'
     ], help='Command to execute')
     
     parser.add_argument('--top', type=int, help='Limit results to top N teams/players')
     parser.add_argument('--season', help='Season year (default: current)')
+    parser.add_argument('--seasons', nargs='+', help='Several season years, fetched concurrently (rankings)')
     parser.add_argument('--team', help='Team name')
+    parser.add_argument('--teams', nargs='+', help='Several team names, fetched concurrently (team-stats)')
     parser.add_argument('--team1', help='First team (for predictions)')
     parser.add_argument('--team2', help='Second team (for predictions)')
     parser.add_argument('--neutral', action='store_true', help='Neutral site game (for predictions)')
     
+    parser.add_argument('--serve', action='store_true', help='Run as a daemon answering commands on --socket')
+    parser.add_argument('--socket', help=f'Unix socket of a running daemon to send the command to (default with --serve: {DEFAULT_SOCKET})')
+    
     parser.add_argument('--pretty', action='store_true', help='Pretty print JSON output')
     parser.add_argument('--csv', action='store_true', help='Output in CSV format')
+    parser.add_argument('--no-cache', action='store_true', help='Bypass the on-disk HTTP response cache')
     parser.add_argument('--debug', action='store_true', help='Enable debug output')
     
     args = parser.parse_args()
     
-    scraper = BarttovikScraper(debug=args.debug)
+    if not args.serve and not args.command:
+        parser.error("a command is required unless --serve is given")
+    
+    scraper = BarttovikScraper(debug=args.debug, use_cache=not args.no_cache)
     result = None
     
     try:
-        if args.command == 'rankings':
-            result = scraper.get_rankings(args.top, args.season)
-            
-        elif args.command == 'team-stats':
-            if not args.team:
-                print("Error: --team is required for team-stats command", file=sys.stderr)
-                sys.exit(1)
-            result = scraper.get_team_stats(args.team, args.season)
-            
-        elif args.command == 'game-prediction':
-            if not args.team1 or not args.team2:
-                print("Error: --team1 and --team2 are required for game-prediction command", file=sys.stderr)
-                sys.exit(1)
-            result = scraper.get_game_prediction(args.team1, args.team2, args.neutral)
-            
-        elif args.command == 'player-stats':
-            result = scraper.get_player_stats(args.team, args.season, args.top)
+        if args.serve:
+            serve(scraper, args.socket or DEFAULT_SOCKET)
+            return
+        
+        if args.socket:
+            result = send_command(args.socket, args)
+        else:
+            result = run_command(scraper, args)
         
         # Output result
         if result is not None:
@@ -342,4 +683,4 @@ Examples:
         sys.exit(1)
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -12,30 +12,69 @@ Usage:
 """
 
 import argparse
+import io
 import json
+import os
 import sys
 import traceback
+from csv import DictWriter
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 
 try:
-    import cbbpy.mens_scraper as cbb
+    import orjson
 except ImportError:
-    print("Error: CBBpy not installed. Install with: pip3 install CBBpy")
-    sys.exit(1)
+    orjson = None
 
 try:
-    import pandas as pd
+    from diskcache import Cache
 except ImportError:
-    print("Error: pandas not installed. Install with: pip3 install pandas")
-    sys.exit(1)
+    Cache = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+# On-disk cache for CBBpy results, keyed by call and date/game
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'cbbpy_tools')
+PAST_DATE_TTL = 86400  # Completed dates rarely change
+LIVE_TTL = 300  # Today's slate and in-progress games
 
 class CBBpyTools:
     """ESPN college basketball data wrapper using CBBpy."""
     
-    def __init__(self, debug: bool = False):
+    def __init__(self, debug: bool = False, use_cache: bool = True):
         self.debug = debug
+        self.cache = Cache(CACHE_DIR) if use_cache and Cache is not None else None
+        self._cbb = None
+        self._pd = None
         
+    @property
+    def cbb(self):
+        """CBBpy scraper module, imported on first use since it pulls in pandas."""
+        if self._cbb is None:
+            try:
+                import cbbpy.mens_scraper as cbb
+            except ImportError:
+                print("Error: CBBpy not installed. Install with: pip3 install CBBpy")
+                sys.exit(1)
+            self._cbb = cbb
+        return self._cbb
+    
+    @property
+    def pd(self):
+        """pandas module, imported on first use."""
+        if self._pd is None:
+            try:
+                import pandas as pd
+            except ImportError:
+                print("Error: pandas not installed. Install with: pip3 install pandas")
+                sys.exit(1)
+            self._pd = pd
+        return self._pd
+    
     def log(self, message: str):
         """Log debug messages if debug mode enabled."""
         if self.debug:
@@ -43,15 +82,99 @@ class CBBpyTools:
     
     def format_output(self, data: Any, pretty: bool = False, csv: bool = False) -> str:
         """Format output data as JSON, pretty JSON, or CSV."""
+        if csv and pa is not None and isinstance(data, pa.Table):
+            buf = io.BytesIO()
+            pa_csv.write_csv(data, buf)
+            return buf.getvalue().decode()
+        
         if csv and isinstance(data, list) and len(data) > 0:
             if isinstance(data[0], dict):
-                df = pd.DataFrame(data)
-                return df.to_csv(index=False)
+                # Nested values need pandas; flat rows go straight through the csv module
+                if any(isinstance(value, (dict, list)) for value in data[0].values()):
+                    df = self.pd.DataFrame(data)
+                    return df.to_csv(index=False)
+                
+                buf = io.StringIO()
+                writer = DictWriter(buf, fieldnames=list(dict.fromkeys(k for row in data for k in row)), lineterminator='\n')
+                writer.writeheader()
+                writer.writerows(data)
+                return buf.getvalue()
+        
+        if orjson is not None:
+            option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(data, default=self.json_default, option=option).decode()
         
         if pretty:
-            return json.dumps(data, indent=2, default=str)
+            return json.dumps(data, indent=2, default=self.json_default)
         else:
-            return json.dumps(data, default=str)
+            return json.dumps(data, default=self.json_default)
+    
+    def json_default(self, obj: Any) -> Any:
+        """Serialize values the JSON encoders don't handle: Arrow tables as row lists, the rest as strings."""
+        if pa is not None and isinstance(obj, pa.Table):
+            return obj.to_pylist()
+        return str(obj)
+    
+    def to_records(self, df: 'pd.DataFrame', columns: Dict[str, tuple]) -> List[Dict]:
+        """Select, rename and default-fill DataFrame columns, then convert to row dicts.
+        
+        `columns` maps source column -> (output name, default). Missing source
+        columns are filled entirely with their default.
+        """
+        names = {src: name for src, (name, _) in columns.items()}
+        defaults = dict(columns.values())
+        
+        out = df.reindex(columns=list(names)).rename(columns=names)
+        return out.fillna(defaults).to_dict('records')
+    
+    def cached(self, key: tuple, fetch, expire: Optional[int]):
+        """Return the cached result for key, or call fetch() and cache it.
+        
+        An expire of None keeps the entry until the cache is cleared.
+        """
+        if self.cache is None:
+            return fetch()
+        
+        result = self.cache.get(key)
+        if result is not None:
+            self.log(f"Cache hit for {key}")
+            return result
+        
+        result = fetch()
+        if result is not None:
+            self.cache.set(key, result, expire=expire)
+        return result
+    
+    def game_ttl(self, game_id: str) -> Optional[int]:
+        """Cache lifetime for per-game data: forever once the game is known final."""
+        if self.cache is not None and self.cache.get(('final', str(game_id))):
+            return None
+        return LIVE_TTL
+    
+    def fetch_games(self, date: str) -> List[Dict]:
+        """Fetch a day's games as row dicts and remember which of them are final."""
+        games_data = self.cbb.get_games_range(date, date)
+        
+        if games_data is None or games_data.empty:
+            return []
+        
+        if self.cache is not None and {'Status', 'Game_ID'} <= set(games_data.columns):
+            final = games_data['Status'].astype(str).str.startswith('Final')
+            for game_id in games_data.loc[final, 'Game_ID']:
+                self.cache.set(('final', str(game_id)), True)
+        
+        return self.to_records(games_data, {
+            'Date': ('date', date),
+            'Home': ('home_team', ''),
+            'Away': ('away_team', ''),
+            'Home_Score': ('home_score', 0),
+            'Away_Score': ('away_score', 0),
+            'Status': ('status', ''),
+            'Game_ID': ('game_id', ''),
+            'Time': ('time', '')
+        })
     
     def get_team_schedule(self, team: str, season: int = None) -> List[Dict]:
         """Get team's full schedule for the season."""
@@ -64,26 +187,21 @@ class CBBpyTools:
             self.log(f"Getting schedule for {team}, season {season}")
             
             # CBBpy function to get schedule
-            schedule = cbb.get_team_schedule(team=team, season=season)
+            schedule = self.cbb.get_team_schedule(team=team, season=season)
             
             if schedule is None or schedule.empty:
                 return []
             
             # Convert to list of dictionaries
-            games = []
-            for _, game in schedule.iterrows():
-                game_dict = {
-                    'date': game.get('Date', ''),
-                    'opponent': game.get('Opponent', ''),
-                    'location': game.get('Location', ''),
-                    'result': game.get('Result', ''),
-                    'team_score': game.get('Tm', 0),
-                    'opponent_score': game.get('Opp', 0),
-                    'game_id': game.get('Game_ID', '')
-                }
-                games.append(game_dict)
-            
-            return games
+            return self.to_records(schedule, {
+                'Date': ('date', ''),
+                'Opponent': ('opponent', ''),
+                'Location': ('location', ''),
+                'Result': ('result', ''),
+                'Tm': ('team_score', 0),
+                'Opp': ('opponent_score', 0),
+                'Game_ID': ('game_id', '')
+            })
             
         except Exception as e:
             self.log(f"Error getting schedule: {str(e)}")
@@ -97,33 +215,14 @@ class CBBpyTools:
             
             self.log(f"Getting games for {date}")
             
-            # CBBpy function to get games
-            games_data = cbb.get_games_range(date, date)
+            # CBBpy function to get games; past dates keep longer than today's live slate
+            ttl = PAST_DATE_TTL if date < datetime.now().strftime('%Y-%m-%d') else LIVE_TTL
+            games = self.cached(('games', date), lambda: self.fetch_games(date), ttl)
             
-            if games_data is None or games_data.empty:
-                return []
-            
-            games = []
-            for _, game in games_data.iterrows():
-                game_dict = {
-                    'date': game.get('Date', date),
-                    'home_team': game.get('Home', ''),
-                    'away_team': game.get('Away', ''),
-                    'home_score': game.get('Home_Score', 0),
-                    'away_score': game.get('Away_Score', 0),
-                    'status': game.get('Status', ''),
-                    'game_id': game.get('Game_ID', ''),
-                    'time': game.get('Time', '')
-                }
-                
-                # Add odds if requested (placeholder - would need additional source)
-                if with_odds:
-                    game_dict['spread'] = None
-                    game_dict['total'] = None
-                    game_dict['home_ml'] = None
-                    game_dict['away_ml'] = None
-                
-                games.append(game_dict)
+            # Add odds if requested (placeholder - would need additional source)
+            if with_odds:
+                for game in games:
+                    game.update(spread=None, total=None, home_ml=None, away_ml=None)
             
             return games
             
@@ -136,63 +235,77 @@ class CBBpyTools:
         try:
             self.log(f"Getting boxscore for game {game_id}")
             
-            boxscore = cbb.get_game_boxscore(game_id)
-            
-            if boxscore is None:
-                return {}
-            
-            # Extract team stats
-            result = {
-                'game_id': game_id,
-                'teams': {},
-                'stats': {}
-            }
-            
-            # Process team stats if available
-            if hasattr(boxscore, 'keys'):
-                for team in boxscore.keys():
-                    if isinstance(boxscore[team], pd.DataFrame):
-                        result['teams'][team] = boxscore[team].to_dict('records')
-            
-            return result
+            return self.cached(('boxscore', str(game_id)), lambda: self.fetch_boxscore(game_id), self.game_ttl(game_id))
             
         except Exception as e:
             self.log(f"Error getting boxscore: {str(e)}")
             return {}
     
+    def fetch_boxscore(self, game_id: str) -> Dict:
+        """Fetch a boxscore, keeping each team's stats as an Arrow table when pyarrow is installed.
+        
+        Tables are only turned into rows when the output is serialized.
+        """
+        boxscore = self.cbb.get_game_boxscore(game_id)
+        
+        if boxscore is None:
+            return {}
+        
+        # Extract team stats
+        result = {
+            'game_id': game_id,
+            'teams': {},
+            'stats': {}
+        }
+        
+        # Process team stats if available
+        if hasattr(boxscore, 'keys'):
+            for team in boxscore.keys():
+                # Only per-team frames; a DataFrame boxscore yields column Series here, which are skipped
+                if not isinstance(boxscore[team], self.pd.DataFrame):
+                    continue
+                if pa is not None:
+                    try:
+                        result['teams'][team] = pa.Table.from_pandas(boxscore[team], preserve_index=False)
+                        continue
+                    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:  # Mixed-type columns
+                        self.log(f"Keeping {team} boxscore as rows: {str(e)}")
+                result['teams'][team] = boxscore[team].to_dict('records')
+        
+        return result
+    
     def get_play_by_play(self, game_id: str) -> List[Dict]:
         """Get play-by-play data for a specific game."""
         try:
             self.log(f"Getting play-by-play for game {game_id}")
             
-            pbp = cbb.get_game_pbp(game_id)
-            
-            if pbp is None or pbp.empty:
-                return []
-            
-            plays = []
-            for _, play in pbp.iterrows():
-                play_dict = {
-                    'time': play.get('Time', ''),
-                    'score': play.get('Score', ''),
-                    'play_text': play.get('Play', ''),
-                    'team': play.get('Team', ''),
-                    'period': play.get('Period', 1)
-                }
-                plays.append(play_dict)
-            
-            return plays
+            return self.cached(('pbp', str(game_id)), lambda: self.fetch_play_by_play(game_id), self.game_ttl(game_id))
             
         except Exception as e:
             self.log(f"Error getting play-by-play: {str(e)}")
             return []
     
+    def fetch_play_by_play(self, game_id: str) -> List[Dict]:
+        """Fetch play-by-play as row dicts."""
+        pbp = self.cbb.get_game_pbp(game_id)
+        
+        if pbp is None or pbp.empty:
+            return []
+        
+        return self.to_records(pbp, {
+            'Time': ('time', ''),
+            'Score': ('score', ''),
+            'Play': ('play_text', ''),
+            'Team': ('team', ''),
+            'Period': ('period', 1)
+        })
+    
     def get_player_info(self, player_name: str) -> Dict:
         """Get information about a specific player."""
         try:
             self.log(f"Getting player info for {player_name}")
             
-            player_data = cbb.get_player_info(player_name)
+            player_data = self.cbb.get_player_info(player_name)
             
             if player_data is None or player_data.empty:
                 return {}
@@ -216,24 +329,19 @@ class CBBpyTools:
             
             self.log(f"Getting {conference} standings for season {season}")
             
-            standings = cbb.get_conference_standings(conference=conference, season=season)
+            standings = self.cbb.get_conference_standings(conference=conference, season=season)
             
             if standings is None or standings.empty:
                 return []
             
-            teams = []
-            for _, team in standings.iterrows():
-                team_dict = {
-                    'team': team.get('Team', ''),
-                    'conference_record': team.get('Conf', ''),
-                    'overall_record': team.get('Overall', ''),
-                    'conference_wins': team.get('W', 0),
-                    'conference_losses': team.get('L', 0),
-                    'win_percentage': team.get('PCT', 0.0)
-                }
-                teams.append(team_dict)
-            
-            return teams
+            return self.to_records(standings, {
+                'Team': ('team', ''),
+                'Conf': ('conference_record', ''),
+                'Overall': ('overall_record', ''),
+                'W': ('conference_wins', 0),
+                'L': ('conference_losses', 0),
+                'PCT': ('win_percentage', 0.0)
+            })
             
         except Exception as e:
             self.log(f"Error getting conference standings: {str(e)}")
@@ -268,11 +376,12 @@ Examples:
     
     parser.add_argument('--pretty', action='store_true', help='Pretty print JSON output')
     parser.add_argument('--csv', action='store_true', help='Output in CSV format')
+    parser.add_argument('--no-cache', action='store_true', help='Bypass the on-disk result cache')
     parser.add_argument('--debug', action='store_true', help='Enable debug output')
     
     args = parser.parse_args()
     
-    cbb_tools = CBBpyTools(debug=args.debug)
+    cbb_tools = CBBpyTools(debug=args.debug, use_cache=not args.no_cache)
     result = None
     
     try:
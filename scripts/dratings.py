@@ -8,35 +8,216 @@ Compares model win probabilities vs implied odds to find betting edges.
 Usage:
     python3 dratings.py predictions --date 2026-03-15
     python3 dratings.py today
+    python3 dratings.py predictions-batch --dates 2026-03-19 2026-03-20 2026-03-21
     python3 dratings.py edge-finder --date today --min-edge 3.0
 """
 
 import argparse
+import functools
+import io
 import json
+import os
+import re
 import sys
 import traceback
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date as Date
+from typing import Dict, List, NamedTuple, Optional, Any
+from urllib.parse import urlencode
 
 try:
     import requests
+    import lxml.etree
     from bs4 import BeautifulSoup
+    import soupsieve
     import pandas as pd
+    import numpy as np
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry, make_headers
 except ImportError:
-    print("Error: Required packages not installed. Install with: pip3 install requests beautifulsoup4 lxml pandas")
+    print("Error: Required packages not installed. Install with: pip3 install requests beautifulsoup4 lxml pandas numpy")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Parsed predictions per date, revalidated with the page's ETag/Last-Modified
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'dratings')
+
+# Bytes read per chunk when stream-parsing prediction pages
+STREAM_CHUNK_SIZE = 65536
+
+# Concurrency limit for multi-date fetches
+MAX_CONCURRENT_REQUESTS = 5
+
+# Signed numbers and percentages in prediction table cells, captured for Series.str.extract
+NUMBER_RE = re.compile(r'([-+]?\d+(?:\.\d+)?)')
+PERCENT_RE = re.compile(r'([-+]?\d+(?:\.\d+)?)\s*%')
+
+# Case-insensitive class-substring selectors for game markup, compiled once
+GAME_SELECTOR = soupsieve.compile("div[class*='game' i], tr[class*='game' i]")
+TEAM_SELECTOR = soupsieve.compile("span[class*='team' i], div[class*='team' i]")
+
+# Prediction value classes: one C-level scan of each class string for any of the terms
+PREDICTION_CLASS_RE = re.compile('prob|spread|total', re.IGNORECASE)
+
+class Game(NamedTuple):
+    """One game's predictions and market data, kept flat until output."""
+    date: str
+    away_team: str
+    home_team: str
+    model_win_prob_away: Optional[float] = None
+    model_win_prob_home: Optional[float] = None
+    predicted_spread: Optional[float] = None
+    predicted_total: Optional[float] = None
+    market_spread: Optional[float] = None
+    market_total: Optional[float] = None
+    away_ml_odds: Optional[int] = None
+    home_ml_odds: Optional[int] = None
+    
+    def to_dict(self) -> Dict:
+        """Nested output form, as printed by the CLI and read by edge_finder."""
+        return {
+            'date': self.date,
+            'away_team': self.away_team,
+            'home_team': self.home_team,
+            'predictions': {
+                'model_win_prob_away': self.model_win_prob_away,
+                'model_win_prob_home': self.model_win_prob_home,
+                'predicted_spread': self.predicted_spread,
+                'predicted_total': self.predicted_total
+            },
+            'market_data': {
+                'market_spread': self.market_spread,
+                'market_total': self.market_total,
+                'away_ml_odds': self.away_ml_odds,
+                'home_ml_odds': self.home_ml_odds
+            }
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Game':
+        """Rebuild a game from its nested output form."""
+        return cls(
+            date=data['date'],
+            away_team=data['away_team'],
+            home_team=data['home_team'],
+            **data.get('predictions', {}),
+            **data.get('market_data', {})
+        )
+
+def _is_game_container(element) -> bool:
+    """Whether an element is a div/tr whose class mentions 'game', as GAME_SELECTOR matches."""
+    return element.tag in ('div', 'tr') and 'game' in (element.get('class') or '').lower()
+
+def _stream_fragments(chunks):
+    """Yield ('game', html, nested) and ('table', html, 0) fragments as a page streams in.
+    
+    Game containers are yielded innermost first, so a list wrapper whose
+    class also mentions 'game' comes after the games inside it; `nested`
+    counts the game fragments yielded from within a container. Top-level
+    fragments are cleared as soon as they close, so the retained tree stays
+    small regardless of page size. Tables inside a game container are left
+    for that container to carry.
+    """
+    parser = lxml.etree.HTMLPullParser(events=('start', 'end'), tag=('div', 'tr', 'table'))
+    open_games = []  # Game fragments yielded so far when each open game container started
+    yielded = 0
+    
+    def read_fragments():
+        nonlocal yielded
+        for event, element in parser.read_events():
+            if _is_game_container(element):
+                if event == 'start':
+                    open_games.append(yielded)
+                    continue
+                nested = yielded - open_games.pop()
+                yielded += 1
+                yield 'game', lxml.etree.tostring(element, method='html', with_tail=False), nested
+            elif event == 'end' and element.tag == 'table' and not open_games:
+                yield 'table', lxml.etree.tostring(element, method='html', with_tail=False), 0
+            else:
+                continue
+            
+            # An enclosing game container still needs its whole subtree
+            if open_games:
+                continue
+            
+            # Drop the finished fragment and any earlier siblings
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+    
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from read_fragments()
+    parser.close()
+    yield from read_fragments()
+
+@functools.lru_cache(maxsize=8)
+def _date_str(ordinal: int) -> str:
+    """YYYY-MM-DD for a proleptic Gregorian ordinal; keying on the day resolves 'today' once per date."""
+    return Date.fromordinal(ordinal).isoformat()
+
+def _odds_to_probabilities(odds) -> np.ndarray:
+    """Convert an array of American odds to implied probabilities; NaN stays NaN."""
+    odds = np.asarray(odds, dtype=float)
+    return np.where(odds > 0, 100, -odds) / (np.abs(odds) + 100)
+
+def _moneyline_edges(model_probs: np.ndarray, ml_odds: np.ndarray):
+    """Implied probabilities and percentage edges for paired model probabilities and moneylines."""
+    market_probs = _odds_to_probabilities(ml_odds)
+    return market_probs, (model_probs - market_probs) / market_probs * 100
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _moneyline_edges(model_probs, ml_odds):
+        """Implied probabilities and percentage edges, compiled to a single native loop."""
+        market_probs = np.empty_like(model_probs)
+        edge_pcts = np.empty_like(model_probs)
+        for i in range(model_probs.size):
+            odds = ml_odds[i]
+            market_probs[i] = (100.0 if odds > 0 else -odds) / (abs(odds) + 100.0)
+            edge_pcts[i] = (model_probs[i] - market_probs[i]) / market_probs[i] * 100.0
+        return market_probs, edge_pcts
+
+# Implied probability for every whole American price from -10000 to +10000, indexed by odds + ODDS_LIMIT
+ODDS_LIMIT = 10000
+_ODDS_PROBABILITY = _odds_to_probabilities(np.arange(-ODDS_LIMIT, ODDS_LIMIT + 1)).tolist()
+
 class DRatingsAnalyzer:
     """Scraper and analyzer for DRatings college basketball predictions."""
     
-    def __init__(self, debug: bool = False):
+    def __init__(self, debug: bool = False, use_cache: bool = True):
         self.debug = debug
+        self.use_cache = use_cache
+        self._predictions = {}  # date -> predictions already fetched this run
         self.base_url = "https://www.dratings.com"
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding']
         })
         
+        # Small keep-alive pool for the single host, retrying transient failures with backoff
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=MAX_CONCURRENT_REQUESTS,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        self.session.mount('https://', adapter)
+        
     def log(self, message: str):
         """Log debug messages if debug mode enabled."""
         if self.debug:
@@ -46,8 +227,16 @@ class DRatingsAnalyzer:
         """Format output data as JSON, pretty JSON, or CSV."""
         if csv and isinstance(data, list) and len(data) > 0:
             if isinstance(data[0], dict):
-                df = pd.DataFrame(data)
-                return df.to_csv(index=False)
+                # Flatten nested predictions/market_data into dotted columns
+                buf = io.StringIO()
+                pd.json_normalize(data).to_csv(buf, index=False, lineterminator='\n')
+                return buf.getvalue()
+        
+        if orjson is not None:
+            option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(data, default=str, option=option).decode()
         
         if pretty:
             return json.dumps(data, indent=2, default=str)
@@ -56,26 +245,28 @@ class DRatingsAnalyzer:
     
     def parse_date(self, date_str: str) -> str:
         """Parse date string and return in YYYY-MM-DD format."""
-        if date_str.lower() == 'today':
-            return datetime.now().strftime('%Y-%m-%d')
-        elif date_str.lower() == 'tomorrow':
-            return (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
+        keyword = date_str.lower()
+        if keyword == 'today':
+            return _date_str(Date.today().toordinal())
+        elif keyword == 'tomorrow':
+            return _date_str(Date.today().toordinal() + 1)
         else:
             return date_str
     
-    def odds_to_probability(self, odds: int) -> float:
-        """Convert American odds to implied probability."""
-        if odds > 0:
-            return 100 / (odds + 100)
-        else:
-            return abs(odds) / (abs(odds) + 100)
+    def odds_to_probability(self, odds):
+        """Convert American odds (a number or an array) to implied probability."""
+        if isinstance(odds, np.ndarray):
+            return _odds_to_probabilities(odds)
+        if isinstance(odds, int) and -ODDS_LIMIT <= odds <= ODDS_LIMIT:
+            return _ODDS_PROBABILITY[odds + ODDS_LIMIT]
+        return (100 if odds > 0 else -odds) / (abs(odds) + 100)
     
     def probability_to_odds(self, prob: float) -> int:
-        """Convert probability to American odds."""
+        """Convert probability to American odds; a 50% price is +100."""
         if prob > 0.5:
-            return int(-prob / (1 - prob) * 100)
+            return round(-prob / (1 - prob) * 100)
         else:
-            return int((1 - prob) / prob * 100)
+            return round((1 - prob) / prob * 100)
     
     def calculate_edge(self, model_prob: float, market_prob: float) -> float:
         """Calculate betting edge percentage."""
@@ -85,215 +276,239 @@ class DRatingsAnalyzer:
     
     def get_predictions(self, date: str = None) -> List[Dict]:
         """Get DRatings predictions for a specific date."""
+        return [game.to_dict() for game in self.get_games(date)]
+    
+    def get_games(self, date: str = None) -> List[Game]:
+        """Get DRatings predictions for a specific date as Game records."""
         try:
-            if date is None:
-                date = datetime.now().strftime('%Y-%m-%d')
-            else:
-                date = self.parse_date(date)
-            
-            self.log(f"Getting DRatings predictions for {date}")
-            
-            # Try to find the college basketball predictions page
-            url = f"{self.base_url}/college-basketball/predictions"
-            
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
+            date = self.parse_date(date or 'today')
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            if date in self._predictions:
+                return self._predictions[date]
             
-            predictions = []
-            
-            # Look for game prediction tables
-            tables = soup.find_all('table')
-            game_containers = soup.find_all(['div', 'tr'], class_=lambda x: x and 'game' in x.lower())
+            self.log(f"Getting DRatings predictions for {date}")
             
-            # Try to parse predictions from various possible structures
-            for container in game_containers:
-                try:
-                    game_data = self.parse_game_container(container, date)
-                    if game_data:
-                        predictions.append(game_data)
-                except Exception as e:
-                    self.log(f"Error parsing game container: {str(e)}")
-                    continue
+            # Revalidate a previous run's result instead of re-downloading and re-parsing
+            cached = self.load_cached(date)
+            headers = {}
+            if cached:
+                if cached.get('etag'):
+                    headers['If-None-Match'] = cached['etag']
+                if cached.get('last_modified'):
+                    headers['If-Modified-Since'] = cached['last_modified']
             
-            # If no games found in containers, try table parsing
-            if not predictions:
-                for table in tables:
-                    try:
-                        table_predictions = self.parse_predictions_table(table, date)
-                        predictions.extend(table_predictions)
-                    except Exception as e:
-                        self.log(f"Error parsing table: {str(e)}")
-                        continue
+            response = self.session.get(self.predictions_url(date), headers=headers, timeout=30, stream=True)
+            with response:
+                if cached and response.status_code == 304:
+                    self.log(f"Predictions for {date} unchanged, using cache")
+                    predictions = [Game.from_dict(game) for game in cached['predictions']]
+                else:
+                    response.raise_for_status()
+                    predictions = self.parse_predictions_stream(response.iter_content(STREAM_CHUNK_SIZE), date)
+                    self.save_cached(date, response, predictions)
             
+            self._predictions[date] = predictions
             return predictions
             
         except Exception as e:
             self.log(f"Error getting predictions: {str(e)}")
             return []
     
-    def parse_game_container(self, container, date: str) -> Optional[Dict]:
-        """Parse individual game prediction container."""
+    def predictions_url(self, date: str) -> str:
+        """URL of the college basketball predictions page for a date."""
+        return f"{self.base_url}/college-basketball/predictions?{urlencode({'date': date})}"
+    
+    def cache_path(self, date: str) -> str:
+        """On-disk cache file for a date's predictions."""
+        return os.path.join(CACHE_DIR, f"predictions-{date}.json")
+    
+    def load_cached(self, date: str) -> Optional[Dict]:
+        """Load a date's cached predictions and validators, if any."""
+        if not self.use_cache:
+            return None
+        
         try:
-            # Extract team names
-            team_elements = container.find_all(['span', 'div'], class_=lambda x: x and 'team' in x.lower())
-            if len(team_elements) < 2:
-                return None
-            
-            away_team = team_elements[0].get_text(strip=True)
-            home_team = team_elements[1].get_text(strip=True)
-            
-            # Extract prediction data
-            prediction_elements = container.find_all(['span', 'div'], class_=lambda x: x and any(term in x.lower() for term in ['prob', 'spread', 'total']))
-            
-            game_data = {
-                'date': date,
-                'away_team': away_team,
-                'home_team': home_team,
-                'predictions': {
-                    'model_win_prob_away': None,
-                    'model_win_prob_home': None,
-                    'predicted_spread': None,
-                    'predicted_total': None
-                },
-                'market_data': {
-                    'market_spread': None,
-                    'market_total': None,
-                    'away_ml_odds': None,
-                    'home_ml_odds': None
-                }
-            }
-            
-            # Extract specific prediction values
-            for elem in prediction_elements:
-                text = elem.get_text(strip=True)
-                # Add parsing logic based on DRatings format
-                # This would need to be refined based on actual site structure
+            with open(self.cache_path(date)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def save_cached(self, date: str, response, predictions: List[Game]):
+        """Cache parsed predictions along with the response's ETag/Last-Modified."""
+        validators = {
+            key: response.headers[header]
+            for key, header in (('etag', 'ETag'), ('last_modified', 'Last-Modified'))
+            if header in response.headers
+        }
+        if not self.use_cache or not validators:
+            return
+        
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            path = self.cache_path(date)
+            with open(path + '.tmp', 'w') as f:
+                json.dump({**validators, 'predictions': [game.to_dict() for game in predictions]}, f)
+            os.replace(path + '.tmp', path)
+        except OSError as e:
+            self.log(f"Could not write predictions cache: {str(e)}")
+    
+    def parse_predictions(self, content: bytes, date: str) -> List[Game]:
+        """Parse game predictions from a predictions page.
+        
+        Games wrapped in a list container whose class also mentions 'game' are each kept:
+        
+        >>> card = '<div class="game-card"><span class="team">{}</span><span class="team">{}</span></div>'
+        >>> page = '<div class="games-list">' + card.format('Duke', 'UNC') + card.format('Kansas', 'Baylor') + '</div>'
+        >>> games = DRatingsAnalyzer(use_cache=False).parse_predictions(page.encode(), '2026-03-19')
+        >>> [(game.away_team, game.home_team) for game in games]
+        [('Duke', 'UNC'), ('Kansas', 'Baylor')]
+        """
+        return self.parse_predictions_stream([content], date)
+    
+    def parse_predictions_stream(self, chunks, date: str) -> List[Game]:
+        """Parse game predictions from a predictions page as its bytes arrive."""
+        predictions = []
+        tables = []
+        found = []  # Per game fragment, in stream order: whether it or a container inside it produced a game
+        
+        # Try to parse predictions from various possible structures
+        for kind, fragment, nested in _stream_fragments(chunks):
+            if kind == 'table':
+                if not predictions:
+                    tables.append(fragment)
+                continue
             
-            return game_data
+            # A container whose inner game containers already produced games only wraps them
+            if nested and any(found[-nested:]):
+                found.append(True)
+                continue
             
-        except Exception as e:
-            self.log(f"Error parsing game container: {str(e)}")
+            # Rows need a table around them to survive the HTML parser
+            if fragment.startswith(b'<tr'):
+                fragment = b'<table>' + fragment + b'</table>'
+            container = GAME_SELECTOR.select_one(BeautifulSoup(fragment, 'lxml'))
+            game_data = self.parse_game_container(container, date) if container is not None else None
+            found.append(game_data is not None)
+            if game_data:
+                predictions.append(game_data)
+                tables.clear()
+        
+        # If no games found in containers, try table parsing
+        if not predictions and tables:
+            predictions = self.parse_predictions_tables(b''.join(tables), date)
+        
+        return predictions
+    
+    def parse_game_container(self, container, date: str) -> Optional[Game]:
+        """Parse individual game prediction container."""
+        # Extract team names
+        team_elements = TEAM_SELECTOR.select(container)
+        if len(team_elements) < 2:
             return None
+        
+        away_team = team_elements[0].get_text(strip=True)
+        home_team = team_elements[1].get_text(strip=True)
+        
+        # Extract prediction data
+        prediction_elements = container.find_all(['span', 'div'], class_=PREDICTION_CLASS_RE)
+        
+        game_data = Game(date, away_team, home_team)
+        
+        # Extract specific prediction values
+        for elem in prediction_elements:
+            text = elem.get_text(strip=True)
+            # Add parsing logic based on DRatings format
+            # This would need to be refined based on actual site structure
+        
+        return game_data
     
-    def parse_predictions_table(self, table, date: str) -> List[Dict]:
-        """Parse predictions from table format."""
+    def parse_predictions_tables(self, content: bytes, date: str) -> List[Game]:
+        """Parse predictions from the page's tables, converting whole columns at once.
+        
+        Columns are positional: away team, home team, away/home win
+        probability (%), predicted spread, predicted total.
+        """
         try:
-            predictions = []
-            rows = table.find_all('tr')[1:]  # Skip header
+            tables = pd.read_html(io.BytesIO(content), flavor='lxml', header=0)
+        except ValueError:  # No tables on the page
+            return []
+        
+        predictions = []
+        for df in tables:
+            if df.shape[1] < 4:
+                continue
             
-            for row in rows:
-                cells = row.find_all(['td', 'th'])
-                if len(cells) < 4:
-                    continue
-                
-                try:
-                    # Basic game data extraction
-                    game_data = {
-                        'date': date,
-                        'away_team': cells[0].get_text(strip=True),
-                        'home_team': cells[1].get_text(strip=True),
-                        'predictions': {
-                            'model_win_prob_away': None,
-                            'model_win_prob_home': None,
-                            'predicted_spread': None,
-                            'predicted_total': None
-                        },
-                        'market_data': {
-                            'market_spread': None,
-                            'market_total': None
-                        }
-                    }
-                    
-                    # Extract numerical data from remaining cells
-                    for i, cell in enumerate(cells[2:], 2):
-                        text = cell.get_text(strip=True)
-                        if '%' in text:
-                            # Probability data
-                            prob_value = float(text.replace('%', '')) / 100
-                            if i == 2:
-                                game_data['predictions']['model_win_prob_away'] = prob_value
-                            elif i == 3:
-                                game_data['predictions']['model_win_prob_home'] = prob_value
-                        elif any(char.isdigit() for char in text):
-                            # Numerical data (spreads, totals, etc.)
-                            try:
-                                num_value = float(text.replace('+', '').replace('-', ''))
-                                if i == 4:
-                                    game_data['predictions']['predicted_spread'] = num_value
-                                elif i == 5:
-                                    game_data['predictions']['predicted_total'] = num_value
-                            except ValueError:
-                                continue
-                    
-                    predictions.append(game_data)
-                    
-                except (ValueError, IndexError) as e:
-                    self.log(f"Error parsing prediction row: {str(e)}")
-                    continue
+            df = df[df.iloc[:, 3].notna()]  # Rows with fewer than four cells
+            text = df.astype(str)
             
-            return predictions
+            def column(i: int, pattern: re.Pattern) -> pd.Series:
+                if i >= df.shape[1]:
+                    return pd.Series(np.nan, index=df.index)
+                return pd.to_numeric(text.iloc[:, i].str.extract(pattern, expand=False)).astype(float)
             
-        except Exception as e:
-            self.log(f"Error parsing predictions table: {str(e)}")
-            return []
+            games = pd.DataFrame({
+                'away_team': df.iloc[:, 0].fillna('').astype(str).str.strip(),
+                'home_team': df.iloc[:, 1].fillna('').astype(str).str.strip(),
+                'model_win_prob_away': column(2, PERCENT_RE) / 100,
+                'model_win_prob_home': column(3, PERCENT_RE) / 100,
+                'predicted_spread': column(4, NUMBER_RE),
+                'predicted_total': column(5, NUMBER_RE)
+            })
+            games = games.astype(object).where(games.notna(), None)
+            
+            predictions.extend(Game(date, **game) for game in games.to_dict('records'))
+        
+        return predictions
     
     def find_edges(self, date: str = None, min_edge: float = 2.0) -> List[Dict]:
         """Find betting edges by comparing model predictions to market odds."""
         try:
-            predictions = self.get_predictions(date)
+            predictions = self.get_games(date)
             
-            edges = []
+            game_edges = [[] for _ in predictions]
             
-            for game in predictions:
-                game_edges = []
-                
-                # Check moneyline edges
-                away_model_prob = game['predictions'].get('model_win_prob_away')
-                home_model_prob = game['predictions'].get('model_win_prob_home')
-                
-                away_ml_odds = game['market_data'].get('away_ml_odds')
-                home_ml_odds = game['market_data'].get('home_ml_odds')
-                
-                if away_model_prob and away_ml_odds:
-                    market_prob = self.odds_to_probability(away_ml_odds)
-                    edge = self.calculate_edge(away_model_prob, market_prob)
-                    if abs(edge) >= min_edge:
-                        game_edges.append({
-                            'type': 'moneyline',
-                            'team': game['away_team'],
-                            'side': 'away',
-                            'model_prob': away_model_prob,
-                            'market_prob': market_prob,
-                            'edge_percent': edge,
-                            'recommended_bet': 'YES' if edge > 0 else 'NO'
-                        })
-                
-                if home_model_prob and home_ml_odds:
-                    market_prob = self.odds_to_probability(home_ml_odds)
-                    edge = self.calculate_edge(home_model_prob, market_prob)
-                    if abs(edge) >= min_edge:
-                        game_edges.append({
-                            'type': 'moneyline',
-                            'team': game['home_team'],
-                            'side': 'home',
-                            'model_prob': home_model_prob,
-                            'market_prob': market_prob,
-                            'edge_percent': edge,
-                            'recommended_bet': 'YES' if edge > 0 else 'NO'
-                        })
-                
-                # Add spread and total edges here (similar logic)
+            # Only game sides that have both a model probability and a moneyline price
+            usable = []
+            for i, game in enumerate(predictions):
+                for side, model_prob, ml_odds in (
+                    ('away', game.model_win_prob_away, game.away_ml_odds),
+                    ('home', game.model_win_prob_home, game.home_ml_odds)
+                ):
+                    if model_prob and ml_odds:
+                        usable.append((i, side, model_prob, ml_odds))
+            
+            # Moneyline edges for all usable sides at once
+            if usable:
+                game_index, sides, model_probs, ml_odds = zip(*usable)
+                market_probs, edge_pcts = _moneyline_edges(
+                    np.array(model_probs, dtype=float),
+                    np.array(ml_odds, dtype=float)
+                )
                 
-                if game_edges:
-                    edge_game = {
-                        'game': f"{game['away_team']} @ {game['home_team']}",
-                        'date': game['date'],
-                        'edges': game_edges,
-                        'max_edge': max(abs(edge['edge_percent']) for edge in game_edges)
-                    }
-                    edges.append(edge_game)
+                for k in np.flatnonzero(np.abs(edge_pcts) >= min_edge):
+                    i, side = game_index[k], sides[k]
+                    edge = float(edge_pcts[k])
+                    game_edges[i].append({
+                        'type': 'moneyline',
+                        'team': getattr(predictions[i], f'{side}_team'),
+                        'side': side,
+                        'model_prob': float(model_probs[k]),
+                        'market_prob': float(market_probs[k]),
+                        'edge_percent': edge,
+                        'recommended_bet': 'YES' if edge > 0 else 'NO'
+                    })
+            
+            # Add spread and total edges here (similar logic)
+            
+            edges = []
+            for game, found in zip(predictions, game_edges):
+                if found:
+                    edges.append({
+                        'game': f"{game.away_team} @ {game.home_team}",
+                        'date': game.date,
+                        'edges': found,
+                        'max_edge': max(abs(edge['edge_percent']) for edge in found)
+                    })
             
             # Sort by maximum edge
             edges.sort(key=lambda x: x['max_edge'], reverse=True)
@@ -304,6 +519,22 @@ class DRatingsAnalyzer:
             self.log(f"Error finding edges: {str(e)}")
             return []
     
+    def get_predictions_batch(self, dates: List[str]) -> Dict[str, List[Dict]]:
+        """Get DRatings predictions for several dates, fetched concurrently.
+        
+        Each date goes through get_predictions, so the in-memory results, the
+        ETag cache and the session's compression and retry settings all apply.
+        """
+        dates = [self.parse_date(date) for date in dates]
+        
+        results = {}
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as pool:
+            # Each worker fetches then parses, so one date's parse overlaps another's download
+            futures = {pool.submit(self.get_predictions, date): date for date in set(dates)}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        return {date: results[date] for date in dates}
+    
     def get_today_games(self) -> List[Dict]:
         """Get today's games with predictions and odds."""
         return self.get_predictions('today')
@@ -316,31 +547,40 @@ def main():
 Examples:
   %(prog)s predictions --date 2026-03-15
   %(prog)s today
+  %(prog)s predictions-batch --dates 2026-03-19 2026-03-20 2026-03-21
   %(prog)s edge-finder --date today --min-edge 3.0
   %(prog)s edge-finder --min-edge 5.0
         '''
     )
     
     parser.add_argument('command', choices=[
-        'predictions', 'today', 'edge-finder'
+        'predictions', 'predictions-batch', 'today', 'edge-finder'
     ], help='Command to execute')
     
     parser.add_argument('--date', help='Date in YYYY-MM-DD format or "today"/"tomorrow"')
+    parser.add_argument('--dates', nargs='+', help='Several dates, fetched concurrently (predictions-batch)')
     parser.add_argument('--min-edge', type=float, default=2.0, help='Minimum edge percentage to report (default: 2.0)')
     
     parser.add_argument('--pretty', action='store_true', help='Pretty print JSON output')
     parser.add_argument('--csv', action='store_true', help='Output in CSV format')
+    parser.add_argument('--no-cache', action='store_true', help='Bypass the on-disk predictions cache')
     parser.add_argument('--debug', action='store_true', help='Enable debug output')
     
     args = parser.parse_args()
     
-    analyzer = DRatingsAnalyzer(debug=args.debug)
+    analyzer = DRatingsAnalyzer(debug=args.debug, use_cache=not args.no_cache)
     result = None
     
     try:
         if args.command == 'predictions':
             result = analyzer.get_predictions(args.date)
             
+        elif args.command == 'predictions-batch':
+            if not args.dates:
+                print("Error: --dates is required for predictions-batch command", file=sys.stderr)
+                sys.exit(1)
+            result = analyzer.get_predictions_batch(args.dates)
+            
         elif args.command == 'today':
             result = analyzer.get_today_games()
             
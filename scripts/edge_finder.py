@@ -12,28 +12,163 @@ Usage:
 """
 
 import argparse
+import contextlib
+import functools
+import heapq
+import importlib
+import io
 import json
+import os
+import queue
+import re
 import sys
+import threading
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from csv import DictWriter
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
-import subprocess
 
 try:
-    import pandas as pd
     import numpy as np
 except ImportError:
-    print("Error: Required packages not installed. Install with: pip3 install pandas numpy")
+    print("Error: Required packages not installed. Install with: pip3 install numpy")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from diskcache import Cache
+except ImportError:
+    Cache = None
+
+try:
+    from rapidfuzz import fuzz, process, utils as fuzz_utils
+except ImportError:
+    process = None
+
+# Per-source results, kept in memory and (with diskcache) on disk across runs
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'edge_finder')
+PAST_DATE_TTL = 6 * 3600  # Past slates rarely change
+LIVE_TTL = 300  # Today's and future slates
+
+# Sibling scripts are imported from here and called in-process
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Source -> (script module, scraper class, call returning that source's games for a date)
+SOURCES = {
+    'barttorvik': ('barttorvik', 'BarttovikScraper', lambda scraper, date: scraper.get_rankings(top=50)),
+    'dratings': ('dratings', 'DRatingsAnalyzer', lambda scraper, date: scraper.get_predictions(date)),
+    'cbbpy': ('cbbpy_tools', 'CBBpyTools', lambda scraper, date: scraper.get_games_today(date)),
+    # Scores only, no predictions; backtest --skip-empty batches its scoreboards to spot days without games
+    'espn': ('espn_scraper', 'ESPNScraper', lambda scraper, date: scraper.get_scores(date))
+}
+
+# College basketball runs November through the April Final Four
+SEASON_MONTHS = frozenset((11, 12, 1, 2, 3, 4))
+
+# Seconds a slate waits on its sources (run in parallel) before giving up on the stragglers
+SOURCE_TIMEOUT = 60
+
+# Days scraped concurrently during a backtest
+MAX_BACKTEST_WORKERS = 8
+
+# Minimum similarity (0-100) of both team names for a fuzzy game match, by token set and by sorted tokens
+FUZZY_MATCH_THRESHOLD = 88
+
+# Consensus metric -> field in each source's 'predictions' dict
+CONSENSUS_METRICS = {
+    'away_win_prob': 'model_win_prob_away',
+    'home_win_prob': 'model_win_prob_home',
+    'spread': 'predicted_spread',
+    'total': 'predicted_total'
+}
+
+# Affixes dropped from team names; ' University' is kept when it starts 'University of ' so that phrase goes whole
+TEAM_NAME_DROP_RE = re.compile(r'University of | University(?! of )|College')
+TEAM_NAME_STATE_RE = re.compile(r' State')
+
+# Normalized name -> canonical name for specific cases
+TEAM_NAME_ALIASES = {
+    'UNC': 'North Carolina',
+    'Duke': 'Duke',
+    'UCLA': 'UCLA',
+    'UConn': 'Connecticut',
+    'ASU': 'Arizona State'
+}
+
+# Market lines used until odds scraping is implemented
+PLACEHOLDER_MARKET = {
+    'away_ml_odds': 110,  # Even money
+    'home_ml_odds': -110,
+    'spread': 2.5,
+    'total': 145.0
+}
+
+# Moneyline sides, in the order their edges are reported
+SIDES = ('away', 'home')
+MAX_KELLY_FRACTION = 0.05  # Cap at 5% of bankroll for safety
+
+# One row per edge; field order is the key order of the dicts built at output time
+EDGE_DTYPE = np.dtype([
+    ('type', 'U10'),
+    ('team', 'O'),  # Python str, so long names aren't truncated to a fixed width
+    ('side', 'U4'),
+    ('model_prob', 'f8'),
+    ('market_prob', 'f8'),
+    ('edge_percent', 'f8'),
+    ('kelly_bet_amount', 'f8'),
+    ('confidence', 'f8'),
+    ('recommended', '?')
+])
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_team_name(team_name: str) -> str:
+    """Normalize a team name for matching across sources; names repeat, so results are cached."""
+    # Remove common prefixes/suffixes, then shorten State
+    name = TEAM_NAME_DROP_RE.sub('', team_name.strip())
+    name = TEAM_NAME_STATE_RE.sub(' St', name)
+    
+    return TEAM_NAME_ALIASES.get(name, name)
+
+def _odds_to_probabilities(odds: np.ndarray) -> np.ndarray:
+    """Element-wise American odds to implied probability."""
+    odds = np.asarray(odds, dtype=float)
+    return np.where(odds > 0, 100 / (odds + 100), np.abs(odds) / (np.abs(odds) + 100))
+
+def _confidences(source_count: np.ndarray, std_dev: np.ndarray) -> np.ndarray:
+    """Element-wise EdgeFinder.calculate_confidence from source counts and standard deviations."""
+    source_score = np.minimum(source_count / 3, 1.0)
+    agreement_score = np.maximum(0, 1 - std_dev * 4)
+    return np.where(source_count == 0, 0, (source_score * 0.6 + agreement_score * 0.4) * 100)
+
+def _edge_records(edges: np.ndarray) -> List[Dict]:
+    """Materialize an EDGE_DTYPE array as a list of dicts."""
+    return [dict(zip(edges.dtype.names, row)) for row in edges.tolist()]
+
+def _json_default(obj: Any) -> Any:
+    """JSON fallback: edge arrays become lists of dicts, anything else its str()."""
+    if isinstance(obj, np.ndarray) and obj.dtype.names:
+        return _edge_records(obj)
+    return str(obj)
+
 class EdgeFinder:
     """Find profitable betting opportunities by comparing model predictions to market odds."""
     
-    def __init__(self, debug: bool = False):
+    def __init__(self, debug: bool = False, use_cache: bool = True):
         self.debug = debug
+        self.use_cache = use_cache
+        self.cache = Cache(CACHE_DIR) if use_cache and Cache is not None else None
+        self._results = {}  # (source, date) -> (expires_at, games)
         self.available_sources = [
             'barttorvik', 'dratings', 'kenpom', 'haslametrics', 'massey'
         ]
+        self._scrapers = {}
+        self._scrapers_lock = threading.Lock()
         
     def log(self, message: str):
         """Log debug messages if debug mode enabled."""
@@ -44,13 +179,23 @@ class EdgeFinder:
         """Format output data as JSON, pretty JSON, or CSV."""
         if csv and isinstance(data, list) and len(data) > 0:
             if isinstance(data[0], dict):
-                df = pd.DataFrame(data)
-                return df.to_csv(index=False)
+                # Stream rows through the csv module; nested consensus/edges cells are written as str(), as pandas did
+                buf = io.StringIO()
+                writer = DictWriter(buf, fieldnames=list(dict.fromkeys(k for row in data for k in row)), lineterminator='\n')
+                writer.writeheader()
+                writer.writerows(data)
+                return buf.getvalue()
+        
+        if orjson is not None:
+            option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(data, default=_json_default, option=option).decode()
         
         if pretty:
-            return json.dumps(data, indent=2, default=str)
+            return json.dumps(data, indent=2, default=_json_default)
         else:
-            return json.dumps(data, default=str)
+            return json.dumps(data, default=_json_default)
     
     def parse_date(self, date_str: str) -> str:
         """Parse date string and return in YYYY-MM-DD format."""
@@ -96,81 +241,100 @@ class EdgeFinder:
         optimal_bet = bankroll * kelly_fraction
         
         # Cap at 5% of bankroll for safety
-        return min(optimal_bet, bankroll * 0.05)
+        return min(optimal_bet, bankroll * MAX_KELLY_FRACTION)
+    
+    def get_scraper(self, source: str):
+        """Import a source's script and create its scraper once, reusing it across calls."""
+        with self._scrapers_lock:
+            if source not in self._scrapers:
+                module_name, class_name, _ = SOURCES[source]
+                if SCRIPTS_DIR not in sys.path:
+                    sys.path.insert(0, SCRIPTS_DIR)
+                module = importlib.import_module(module_name)
+                self._scrapers[source] = getattr(module, class_name)(debug=self.debug, use_cache=self.use_cache)
+            return self._scrapers[source]
     
-    def run_script(self, script_name: str, args: List[str]) -> Dict:
-        """Run one of the other scripts and return parsed JSON result."""
+    def fetch_source(self, source: str, date: str) -> List[Dict]:
+        """Get one source's games for a date; any failure yields an empty list."""
         try:
-            cmd = ['python3', f'scripts/{script_name}.py'] + args
-            self.log(f"Running command: {' '.join(cmd)}")
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-            
-            if result.returncode != 0:
-                self.log(f"Script {script_name} failed: {result.stderr}")
-                return {}
-            
-            try:
-                return json.loads(result.stdout)
-            except json.JSONDecodeError as e:
-                self.log(f"Failed to parse JSON from {script_name}: {str(e)}")
-                return {}
-                
-        except subprocess.TimeoutExpired:
-            self.log(f"Script {script_name} timed out")
-            return {}
-        except Exception as e:
-            self.log(f"Error running {script_name}: {str(e)}")
-            return {}
+            _, _, fetch = SOURCES[source]
+            return fetch(self.get_scraper(source), date) or []
+        except (Exception, SystemExit) as e:  # Scripts exit when their dependencies are missing
+            self.log(f"Error getting predictions from {source}: {e!r}")
+            return []
+    
+    def cached_source(self, source: str, date: str) -> List[Dict]:
+        """Get one source's games for a date, reusing results younger than the date's TTL."""
+        if not self.use_cache:
+            return self.fetch_source(source, date)
+        
+        key = (source, date)
+        entry = self._results.get(key)
+        if entry and entry[0] > time.monotonic():
+            self.log(f"Memory cache hit for {key}")
+            return entry[1]
+        
+        ttl = PAST_DATE_TTL if date < datetime.now().strftime('%Y-%m-%d') else LIVE_TTL
+        games, expire_at = self.cache.get(key, expire_time=True) if self.cache is not None else (None, None)
+        if games is not None:
+            self.log(f"Disk cache hit for {key}")
+            # Keep it in memory only for what's left of the disk entry's lifetime
+            if expire_at is not None:
+                ttl = max(expire_at - time.time(), 0)
+        else:
+            games = self.fetch_source(source, date)
+            if not games:  # Don't pin a failed or empty fetch
+                return games
+            if self.cache is not None:
+                self.cache.set(key, games, expire=ttl)
+        
+        self._results[key] = (time.monotonic() + ttl, games)
+        return games
     
     def get_multi_source_predictions(self, date: str, sources: List[str]) -> Dict[str, List[Dict]]:
-        """Get predictions from multiple sources."""
+        """Get predictions from multiple sources concurrently."""
         predictions = {}
         
+        implemented = [source for source in sources if source in SOURCES]
         for source in sources:
-            self.log(f"Getting predictions from {source}")
-            
-            if source == 'barttorvik':
-                # Get T-Rank predictions (would need to implement game prediction functionality)
-                data = self.run_script('barttorvik', ['rankings', '--top', '50'])
-                predictions[source] = data
-                
-            elif source == 'dratings':
-                data = self.run_script('dratings', ['predictions', '--date', date])
-                predictions[source] = data
-                
-            elif source == 'cbbpy':
-                data = self.run_script('cbbpy_tools', ['games-today', '--date', date])
-                predictions[source] = data
-            
-            # Add other sources as needed
-            else:
+            if source not in SOURCES:
                 self.log(f"Source {source} not implemented yet")
                 predictions[source] = []
         
-        return predictions
+        if implemented:
+            done = queue.Queue()
+            
+            def run(source):
+                games = []
+                try:
+                    games = self.cached_source(source, date)
+                finally:
+                    done.put((source, games))
+            
+            # Daemon threads rather than an executor, whose workers are joined at interpreter exit:
+            # a hung source must not keep the CLI from exiting once its slate is printed
+            for source in implemented:
+                self.log(f"Getting predictions from {source}")
+                threading.Thread(target=run, args=(source,), daemon=True).start()
+            
+            deadline = time.monotonic() + SOURCE_TIMEOUT
+            for _ in implemented:
+                try:
+                    source, games = done.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                predictions[source] = games
+            
+            for source in implemented:
+                if source not in predictions:
+                    self.log(f"Source {source} timed out after {SOURCE_TIMEOUT}s")
+                    predictions[source] = []
+        
+        return {source: predictions[source] for source in sources}
     
     def normalize_team_names(self, team_name: str) -> str:
         """Normalize team names for matching across sources."""
-        # Common normalizations
-        name = team_name.strip()
-        
-        # Remove common prefixes/suffixes
-        name = name.replace('University of ', '')
-        name = name.replace(' University', '')
-        name = name.replace(' State', ' St')
-        name = name.replace('College', '')
-        
-        # Handle specific cases
-        name_mapping = {
-            'UNC': 'North Carolina',
-            'Duke': 'Duke',
-            'UCLA': 'UCLA',
-            'UConn': 'Connecticut',
-            'ASU': 'Arizona State'
-        }
-        
-        return name_mapping.get(name, name)
+        return _normalize_team_name(team_name)
     
     def match_games_across_sources(self, predictions: Dict[str, List[Dict]]) -> List[Dict]:
         """Match games across different prediction sources."""
@@ -186,6 +350,17 @@ class EdgeFinder:
         if not base_source:
             return []
         
+        # Index every other source by normalized (away, home) once; first listing wins
+        indexed = {}
+        for source, games in predictions.items():
+            if source == base_source:
+                continue
+            index = indexed[source] = {}
+            for game in games:
+                if 'away_team' in game and 'home_team' in game:
+                    key = (self.normalize_team_names(game['away_team']), self.normalize_team_names(game['home_team']))
+                    index.setdefault(key, game)
+        
         for base_game in predictions[base_source]:
             # Extract team names from base game
             if 'away_team' in base_game and 'home_team' in base_game:
@@ -202,20 +377,55 @@ class EdgeFinder:
                 'consensus': {}
             }
             
-            # Find matching games in other sources
-            for source, games in predictions.items():
-                if source == base_source:
-                    continue
-                
-                for game in games:
-                    if self.is_same_game(game, away_team, home_team):
-                        matched_game['predictions'][source] = game
-                        break
+            # Look up the same game in other sources
+            for source, index in indexed.items():
+                game = index.get((away_team, home_team))
+                if game is not None:
+                    matched_game['predictions'][source] = game
             
             matched_games.append(matched_game)
         
+        if process is not None:
+            self.fuzzy_match_games(matched_games, indexed)
+        
         return matched_games
     
+    def fuzzy_match_games(self, matched_games: List[Dict], indexed: Dict[str, Dict[Tuple[str, str], Dict]]):
+        """Fill in sources whose team names didn't match exactly, scoring all pairs in one call per side.
+        
+        A candidate must score at least FUZZY_MATCH_THRESHOLD on both the away
+        and the home name, so swapped home/away listings don't match. Each
+        source game is used at most once. Token-set similarity is 100 whenever
+        one name's words are a subset of the other's (Kansas / Kansas St), so
+        the sorted-token similarity must clear the threshold as well.
+        """
+        def scores(names, choices):
+            return np.minimum(*(
+                process.cdist(names, choices, scorer=scorer, processor=fuzz_utils.default_process,
+                              dtype=np.uint8, workers=-1)
+                for scorer in (fuzz.token_set_ratio, fuzz.token_sort_ratio)
+            ))
+        
+        for source, index in indexed.items():
+            pending = [game for game in matched_games if source not in game['predictions']]
+            taken = {id(game['predictions'][source]) for game in matched_games if source in game['predictions']}
+            candidates = [(key, game) for key, game in index.items() if id(game) not in taken]
+            if not pending or not candidates:
+                continue
+            
+            # Weaker of the two sides' similarities, for every (pending game, candidate) pair
+            similarity = np.minimum(
+                scores([game['away_team'] for game in pending], [key[0] for key, _ in candidates]),
+                scores([game['home_team'] for game in pending], [key[1] for key, _ in candidates])
+            )
+            
+            for row, game in enumerate(pending):
+                best = int(np.argmax(similarity[row]))
+                if similarity[row, best] >= FUZZY_MATCH_THRESHOLD:
+                    game['predictions'][source] = candidates[best][1]
+                    similarity[:, best] = 0
+                    self.log(f"Fuzzy matched {game['away_team']} @ {game['home_team']} in {source}")
+    
     def is_same_game(self, game: Dict, target_away: str, target_home: str) -> bool:
         """Check if a game matches the target teams."""
         if 'away_team' in game and 'home_team' in game:
@@ -226,41 +436,55 @@ class EdgeFinder:
     
     def calculate_consensus_prediction(self, matched_game: Dict) -> Dict:
         """Calculate consensus prediction from multiple sources."""
-        predictions = matched_game['predictions']
-        consensus = {
-            'away_win_prob': [],
-            'home_win_prob': [],
-            'spread': [],
-            'total': []
-        }
-        
-        # Collect predictions from all sources
-        for source, prediction in predictions.items():
-            if isinstance(prediction, dict):
-                # Extract win probabilities
-                if 'predictions' in prediction:
-                    pred_data = prediction['predictions']
-                    if 'model_win_prob_away' in pred_data and pred_data['model_win_prob_away']:
-                        consensus['away_win_prob'].append(pred_data['model_win_prob_away'])
-                    if 'model_win_prob_home' in pred_data and pred_data['model_win_prob_home']:
-                        consensus['home_win_prob'].append(pred_data['model_win_prob_home'])
-                    if 'predicted_spread' in pred_data and pred_data['predicted_spread']:
-                        consensus['spread'].append(pred_data['predicted_spread'])
-                    if 'predicted_total' in pred_data and pred_data['predicted_total']:
-                        consensus['total'].append(pred_data['predicted_total'])
-        
-        # Calculate averages
-        result = {}
-        for key, values in consensus.items():
-            if values:
-                result[f'avg_{key}'] = np.mean(values)
-                result[f'std_{key}'] = np.std(values) if len(values) > 1 else 0
-                result[f'count_{key}'] = len(values)
+        return self.calculate_consensus_predictions([matched_game])[0]
+    
+    def calculate_consensus_predictions(self, matched_games: List[Dict]) -> List[Dict]:
+        """Calculate consensus predictions for all matched games at once."""
+        means, stds, counts = self.consensus_arrays(matched_games)
+        return [self._consensus_dict(means[:, i], stds[:, i], counts[:, i]) for i in range(len(matched_games))]
+    
+    def consensus_arrays(self, matched_games: List[Dict]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Consensus mean, std and source count as (metric, game) arrays.
         
+        Values are laid out as a (metric, game, source) array with NaN where a
+        source has no (or a zero) value, then reduced along the source axis.
+        """
+        sources = list(dict.fromkeys(source for game in matched_games for source in game['predictions']))
+        column = {source: j for j, source in enumerate(sources)}
+        fields = list(CONSENSUS_METRICS.values())
+        
+        values = np.full((len(fields), len(matched_games), len(sources)), np.nan)
+        for i, game in enumerate(matched_games):
+            for source, prediction in game['predictions'].items():
+                pred_data = prediction.get('predictions') if isinstance(prediction, dict) else None
+                if not isinstance(pred_data, dict):
+                    continue
+                for m, field in enumerate(fields):
+                    if pred_data.get(field):
+                        values[m, i, column[source]] = pred_data[field]
+        
+        # Population mean/std over the sources that reported each metric
+        present = ~np.isnan(values)
+        counts = present.sum(axis=2)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = np.where(present, values, 0).sum(axis=2) / counts
+            stds = np.sqrt(np.where(present, (values - means[..., None]) ** 2, 0).sum(axis=2) / counts)
+        
+        return means, stds, counts
+    
+    def _consensus_dict(self, means: np.ndarray, stds: np.ndarray, counts: np.ndarray) -> Dict:
+        """One game's consensus columns as avg/std/count keys for the metrics any source reported."""
+        result = {}
+        for m, key in enumerate(CONSENSUS_METRICS):
+            if counts[m]:
+                result[f'avg_{key}'] = float(means[m])
+                result[f'std_{key}'] = float(stds[m])
+                result[f'count_{key}'] = int(counts[m])
         return result
     
-    def find_edges(self, date: str = None, sources: List[str] = None, min_edge: float = 2.0) -> List[Dict]:
-        """Find betting edges across multiple sources."""
+    def find_edges(self, date: str = None, sources: List[str] = None, min_edge: float = 2.0,
+                   top: int = None) -> List[Dict]:
+        """Find betting edges across multiple sources, optionally only the top N games."""
         try:
             if date is None:
                 date = datetime.now().strftime('%Y-%m-%d')
@@ -280,26 +504,15 @@ class EdgeFinder:
             # Match games across sources
             matched_games = self.match_games_across_sources(predictions)
             
-            # Find edges for each game
-            edges = []
-            
-            for game in matched_games:
-                consensus = self.calculate_consensus_prediction(game)
-                game_edges = self.identify_game_edges(game, consensus, min_edge)
-                
-                if game_edges:
-                    edge_game = {
-                        'game': f"{game['away_team']} @ {game['home_team']}",
-                        'date': game['date'],
-                        'consensus': consensus,
-                        'edges': game_edges,
-                        'max_edge': max(edge['edge_percent'] for edge in game_edges),
-                        'sources_count': len(game['predictions'])
-                    }
-                    edges.append(edge_game)
+            # Consensus, edges and sizing for every game in one pass
+            edges = self.games_to_edges(matched_games, min_edge)
             
-            # Sort by edge strength and source agreement
-            edges.sort(key=lambda x: (x['max_edge'], x['sources_count']), reverse=True)
+            # Sort by edge strength and source agreement; a heap is enough when only the top N are wanted
+            if top:
+                keys = [(edge_game['max_edge'], edge_game['sources_count']) for edge_game in edges]
+                edges = [edges[i] for i in heapq.nlargest(top, range(len(edges)), key=keys.__getitem__)]
+            else:
+                edges.sort(key=lambda x: (x['max_edge'], x['sources_count']), reverse=True)
             
             return edges
             
@@ -307,62 +520,93 @@ class EdgeFinder:
             self.log(f"Error finding edges: {str(e)}")
             return []
     
+    def games_to_edges(self, matched_games: List[Dict], min_edge: float, bankroll: float = 1000) -> List[Dict]:
+        """Build the output entry of every game with an edge, in game order, from one consensus tensor.
+        
+        Consensus, edges, confidence and Kelly size all come from the same
+        (metric, game) arrays; consensus dicts are only built for games that
+        have an edge. Each game's edge array becomes a list of dicts here, so
+        callers get plain JSON-ready values.
+        """
+        means, stds, counts = self.consensus_arrays(matched_games)
+        edges_by_game, max_edges = self._edge_arrays(matched_games, means, stds, counts, min_edge, bankroll)
+        
+        results = []
+        for i in np.flatnonzero(np.isfinite(max_edges)):
+            game = matched_games[i]
+            results.append({
+                'game': f"{game['away_team']} @ {game['home_team']}",
+                'date': game['date'],
+                'consensus': self._consensus_dict(means[:, i], stds[:, i], counts[:, i]),
+                'edges': _edge_records(edges_by_game[i]),
+                'max_edge': float(max_edges[i]),
+                'sources_count': len(game['predictions'])
+            })
+        
+        return results
+    
     def identify_game_edges(self, game: Dict, consensus: Dict, min_edge: float) -> List[Dict]:
         """Identify specific betting edges for a game."""
-        edges = []
+        return _edge_records(self.identify_edges([game], [consensus], min_edge)[0])
+    
+    def identify_edges(self, matched_games: List[Dict], consensus_by_game: List[Dict], min_edge: float,
+                       bankroll: float = 1000) -> List[np.ndarray]:
+        """Identify moneyline edges from consensus dicts, returning one EDGE_DTYPE array per game."""
+        means, stds, counts = (
+            np.array([[consensus.get(f'{stat}_{key}', missing) for consensus in consensus_by_game]
+                      for key in CONSENSUS_METRICS], dtype=float).reshape(len(CONSENSUS_METRICS), -1)
+            for stat, missing in (('avg', np.nan), ('std', 0), ('count', 0))
+        )
+        return self._edge_arrays(matched_games, means, stds, counts, min_edge, bankroll)[0]
+    
+    def _edge_arrays(self, matched_games: List[Dict], means: np.ndarray, stds: np.ndarray, counts: np.ndarray,
+                     min_edge: float, bankroll: float) -> Tuple[List[np.ndarray], np.ndarray]:
+        """Moneyline edges per game as EDGE_DTYPE arrays, plus each game's max edge (-inf if none).
+        
+        Model and market probabilities form (game, side) arrays; edge, Kelly size
+        and confidence are computed element-wise and the rows that clear
+        min_edge are written to one structured buffer, sliced per game.
+        """
+        if not matched_games:
+            return [], np.empty(0)
+        
+        # Win probability rows of the consensus arrays, as (game, side)
+        rows = [list(CONSENSUS_METRICS).index(f'{side}_win_prob') for side in SIDES]
+        model = means[rows].T
         
         # Get market data (would need to implement odds scraping)
         # For now, use placeholder odds
-        placeholder_market = {
-            'away_ml_odds': 110,  # Even money
-            'home_ml_odds': -110,
-            'spread': 2.5,
-            'total': 145.0
-        }
-        
-        # Check moneyline edges
-        if 'avg_away_win_prob' in consensus:
-            model_prob = consensus['avg_away_win_prob']
-            market_prob = self.odds_to_probability(placeholder_market['away_ml_odds'])
-            edge = self.calculate_edge(model_prob, market_prob)
-            
-            if abs(edge) >= min_edge:
-                kelly_bet = self.kelly_criterion(model_prob, market_prob)
-                edges.append({
-                    'type': 'moneyline',
-                    'team': game['away_team'],
-                    'side': 'away',
-                    'model_prob': model_prob,
-                    'market_prob': market_prob,
-                    'edge_percent': edge,
-                    'kelly_bet_amount': kelly_bet,
-                    'confidence': self.calculate_confidence(consensus, 'away_win_prob'),
-                    'recommended': edge > 0
-                })
-        
-        if 'avg_home_win_prob' in consensus:
-            model_prob = consensus['avg_home_win_prob']
-            market_prob = self.odds_to_probability(placeholder_market['home_ml_odds'])
-            edge = self.calculate_edge(model_prob, market_prob)
-            
-            if abs(edge) >= min_edge:
-                kelly_bet = self.kelly_criterion(model_prob, market_prob)
-                edges.append({
-                    'type': 'moneyline',
-                    'team': game['home_team'],
-                    'side': 'home',
-                    'model_prob': model_prob,
-                    'market_prob': market_prob,
-                    'edge_percent': edge,
-                    'kelly_bet_amount': kelly_bet,
-                    'confidence': self.calculate_confidence(consensus, 'home_win_prob'),
-                    'recommended': edge > 0
-                })
+        market = np.broadcast_to(
+            _odds_to_probabilities([PLACEHOLDER_MARKET[f'{side}_ml_odds'] for side in SIDES]), model.shape
+        )
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            edge = np.where(market > 0, (model - market) / market * 100, 0)
+            # Kelly fraction edge / b with net decimal odds b = 1/p - 1, only for positive edges
+            kelly = bankroll * np.clip(np.where(model > market, (model - market) / (1 / market - 1), 0),
+                                       0, MAX_KELLY_FRACTION)
+            confidence = _confidences(counts[rows].T, stds[rows].T)
+        
+        # NaN (no source reported the metric) never clears the threshold; rows come out grouped by game
+        hits = np.abs(edge) >= min_edge
+        games, sides = np.nonzero(hits)
+        
+        edges = np.empty(len(games), dtype=EDGE_DTYPE)
+        edges['type'] = 'moneyline'
+        edges['team'] = [matched_games[i][f'{SIDES[j]}_team'] for i, j in zip(games, sides)]
+        edges['side'] = np.array(SIDES)[sides]
+        edges['model_prob'] = model[games, sides]
+        edges['market_prob'] = market[games, sides]
+        edges['edge_percent'] = edge[games, sides]
+        edges['kelly_bet_amount'] = kelly[games, sides]
+        edges['confidence'] = confidence[games, sides]
+        edges['recommended'] = edges['edge_percent'] > 0
         
         # Check spread and total edges (similar logic)
         # Implementation would compare predicted spreads/totals to market lines
         
-        return edges
+        return (np.split(edges, np.searchsorted(games, np.arange(1, len(matched_games)))),
+                np.where(hits, edge, -np.inf).max(axis=1))
     
     def calculate_confidence(self, consensus: Dict, metric_type: str) -> float:
         """Calculate confidence score based on source agreement."""
@@ -381,12 +625,31 @@ class EdgeFinder:
         
         return (source_score * 0.6 + agreement_score * 0.4) * 100
     
-    def scan_today(self, sources: List[str] = None, min_edge: float = 2.0) -> List[Dict]:
+    def scan_today(self, sources: List[str] = None, min_edge: float = 2.0, top: int = None) -> List[Dict]:
         """Scan today's games for edges."""
-        return self.find_edges('today', sources, min_edge)
+        return self.find_edges('today', sources, min_edge, top)
     
-    def backtest(self, start_date: str, end_date: str = None, sources: List[str] = None) -> Dict:
-        """Backtest edge finding performance over a date range."""
+    def days_with_games(self, dates: List[str]) -> set:
+        """Dates that are in season and have games on ESPN's scoreboard, checked in one concurrent batch."""
+        in_season = [date for date in dates if datetime.strptime(date, '%Y-%m-%d').month in SEASON_MONTHS]
+        if not in_season:
+            return set()
+        
+        try:
+            scores = self.get_scraper('espn').get_scores_batch(in_season)
+        except (Exception, SystemExit) as e:  # Scripts exit when their dependencies are missing
+            self.log(f"Error checking ESPN scoreboards, scanning every in-season day: {e!r}")
+            return set(in_season)
+        
+        # Only a scoreboard that was read and came back empty rules a day out; failed ones are still scanned
+        failed = [date for date, games in scores.items() if games is None]
+        if failed:
+            self.log(f"Could not check ESPN scoreboards for {', '.join(failed)}, scanning them anyway")
+        return {date for date, games in scores.items() if games is None or games}
+    
+    def backtest(self, start_date: str, end_date: str = None, sources: List[str] = None,
+                 skip_empty: bool = False) -> Dict:
+        """Backtest edge finding performance over a date range, optionally skipping days without games."""
         try:
             if end_date is None:
                 end_date = datetime.now().strftime('%Y-%m-%d')
@@ -396,30 +659,44 @@ class EdgeFinder:
             # Generate date range
             start = datetime.strptime(start_date, '%Y-%m-%d')
             end = datetime.strptime(end_date, '%Y-%m-%d')
-            current = start
+            dates = [(start + timedelta(days=i)).strftime('%Y-%m-%d') for i in range((end - start).days + 1)]
             
             results = {
                 'period': f"{start_date} to {end_date}",
                 'total_edges_found': 0,
                 'profitable_edges': 0,
                 'total_roi': 0.0,
+                # Only reported when --skip-empty is set, so the default output is unchanged
+                **({'days_skipped': 0} if skip_empty else {}),
                 'daily_results': []
             }
             
-            while current <= end:
-                date_str = current.strftime('%Y-%m-%d')
-                daily_edges = self.find_edges(date_str, sources)
-                
-                daily_result = {
-                    'date': date_str,
-                    'edges_found': len(daily_edges),
-                    'max_edge': max((edge['max_edge'] for edge in daily_edges), default=0)
-                }
-                
-                results['daily_results'].append(daily_result)
-                results['total_edges_found'] += len(daily_edges)
+            # Scoreboards for the whole range are fetched up front, concurrently, before any source fan-out
+            scheduled = self.days_with_games(dates) if skip_empty else None
+            
+            def scan(date_str: str) -> Optional[List[Dict]]:
+                if scheduled is not None and date_str not in scheduled:
+                    self.log(f"Skipping {date_str}: no games scheduled")
+                    return None
+                return self.find_edges(date_str, sources)
+            
+            # Days are independent and network-bound, so scrape several at once; map keeps date order
+            with ThreadPoolExecutor(max_workers=MAX_BACKTEST_WORKERS) as pool:
+                all_edges = pool.map(scan, dates)
                 
-                current += timedelta(days=1)
+                for date_str, daily_edges in zip(dates, all_edges):
+                    if daily_edges is None:
+                        results['days_skipped'] += 1
+                        daily_edges = []
+                    
+                    daily_result = {
+                        'date': date_str,
+                        'edges_found': len(daily_edges),
+                        'max_edge': max((edge['max_edge'] for edge in daily_edges), default=0)
+                    }
+                    
+                    results['daily_results'].append(daily_result)
+                    results['total_edges_found'] += len(daily_edges)
             
             return results
             
@@ -434,8 +711,10 @@ def main():
         epilog='''
 Examples:
   %(prog)s scan --date today --min-edge 3.0
+  %(prog)s scan --date today --top 10
   %(prog)s today --sources all --min-edge 5.0
   %(prog)s backtest --start-date 2025-03-01 --end-date 2025-03-15
+  %(prog)s backtest --start-date 2024-10-01 --end-date 2025-04-30 --skip-empty
         '''
     )
     
@@ -448,28 +727,34 @@ Examples:
     parser.add_argument('--end-date', help='End date for backtest (YYYY-MM-DD)')
     parser.add_argument('--sources', nargs='+', help='Prediction sources to use (or "all")')
     parser.add_argument('--min-edge', type=float, default=2.0, help='Minimum edge percentage (default: 2.0)')
+    parser.add_argument('--top', type=int, help='Only return the N strongest edges')
+    parser.add_argument('--skip-empty', action='store_true',
+                        help='Backtest: skip off-season days and days ESPN lists no games for')
     
     parser.add_argument('--pretty', action='store_true', help='Pretty print JSON output')
     parser.add_argument('--csv', action='store_true', help='Output in CSV format')
+    parser.add_argument('--no-cache', action='store_true', help='Bypass the source results cache')
     parser.add_argument('--debug', action='store_true', help='Enable debug output')
     
     args = parser.parse_args()
     
-    edge_finder = EdgeFinder(debug=args.debug)
+    edge_finder = EdgeFinder(debug=args.debug, use_cache=not args.no_cache)
     result = None
     
     try:
-        if args.command == 'scan':
-            result = edge_finder.find_edges(args.date, args.sources, args.min_edge)
-            
-        elif args.command == 'today':
-            result = edge_finder.scan_today(args.sources, args.min_edge)
-            
-        elif args.command == 'backtest':
-            if not args.start_date:
-                print("Error: --start-date is required for backtest command", file=sys.stderr)
-                sys.exit(1)
-            result = edge_finder.backtest(args.start_date, args.end_date, args.sources)
+        # Source scripts print install hints to stdout; keep them out of our JSON output
+        with contextlib.redirect_stdout(sys.stderr):
+            if args.command == 'scan':
+                result = edge_finder.find_edges(args.date, args.sources, args.min_edge, args.top)
+                
+            elif args.command == 'today':
+                result = edge_finder.scan_today(args.sources, args.min_edge, args.top)
+                
+            elif args.command == 'backtest':
+                if not args.start_date:
+                    print("Error: --start-date is required for backtest command", file=sys.stderr)
+                    sys.exit(1)
+                result = edge_finder.backtest(args.start_date, args.end_date, args.sources, args.skip_empty)
         
         # Output result
         if result is not None:
@@ -6,36 +6,71 @@ Scrapes ESPN college basketball data including BPI ratings, scores, standings.
 
 Usage:
     python3 espn_scraper.py scores --date today
+    python3 espn_scraper.py scores-batch --dates 2025-03-01 2025-03-02
     python3 espn_scraper.py bpi --top 25
     python3 espn_scraper.py schedule --team "Duke"
 """
 
 import argparse
+import asyncio
 import json
 import sys
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
 try:
     import requests
     from bs4 import BeautifulSoup
+    import soupsieve
     import pandas as pd
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry, make_headers
 except ImportError:
     print("Error: Required packages not installed. Install with: pip3 install requests beautifulsoup4 lxml pandas")
     sys.exit(1)
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Scoreboards fetched at once by get_scores_batch; matches the session's connection pool
+MAX_CONCURRENT_REQUESTS = 16
+
+# Precompiled selectors; [class*=... i] matches the class attribute case-insensitively in soupsieve, not per node in Python
+GAME_SELECTOR = soupsieve.compile("div[class*='game' i]")
+TEAM_SELECTOR = soupsieve.compile("span[class*='team' i], div[class*='team' i]")
+SCORE_SELECTOR = soupsieve.compile("span[class*='score' i], div[class*='score' i]")
+CELL_SELECTOR = soupsieve.compile("td, th")
+
 class ESPNScraper:
     """Scraper for ESPN college basketball data and BPI ratings."""
     
-    def __init__(self, debug: bool = False):
+    def __init__(self, debug: bool = False, use_cache: bool = True):
         self.debug = debug
+        self.use_cache = use_cache
         self.base_url = "https://www.espn.com"
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+            'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding']
         })
         
+        # Keep-alive pool shared by concurrent callers, retrying transient server errors with backoff
+        adapter = HTTPAdapter(
+            pool_connections=MAX_CONCURRENT_REQUESTS,
+            pool_maxsize=MAX_CONCURRENT_REQUESTS,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[500, 502, 503, 504]
+            )
+        )
+        self.session.mount('https://', adapter)
+        self._bpi = None  # (hour, full rankings) from the last BPI fetch
+        
     def log(self, message: str):
         if self.debug:
             print(f"[DEBUG] {message}", file=sys.stderr)
@@ -47,22 +82,32 @@ class ESPNScraper:
         return json.dumps(data, indent=2 if pretty else None, default=str)
     
     def get_bpi_rankings(self, top: int = None) -> List[Dict]:
-        """Get ESPN BPI rankings."""
+        """Get ESPN BPI rankings, refetched at most once per hour (every call without caching)."""
+        hour = datetime.now().strftime('%Y-%m-%d %H')
+        if not self.use_cache or self._bpi is None or self._bpi[0] != hour:
+            rankings = self.fetch_bpi_rankings()
+            if not rankings:
+                return []
+            self._bpi = (hour, rankings)
+        
+        rankings = self._bpi[1][:top] if top else self._bpi[1]
+        return [dict(row) for row in rankings]
+    
+    def fetch_bpi_rankings(self) -> List[Dict]:
+        """Fetch and parse the full BPI table."""
         try:
             url = f"{self.base_url}/mens-college-basketball/bpi"
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             rankings = []
             
             table = soup.find('table')
             if table:
                 rows = table.find_all('tr')[1:]
                 for i, row in enumerate(rows):
-                    if top and i >= top:
-                        break
-                    cells = row.find_all(['td', 'th'])
+                    cells = CELL_SELECTOR.select(row)
                     if len(cells) >= 4:
                         rankings.append({
                             'rank': i + 1,
@@ -76,64 +121,129 @@ class ESPNScraper:
             self.log(f"Error getting BPI: {str(e)}")
             return []
     
+    def scores_url(self, date: str = None) -> str:
+        """Scoreboard URL for a date (YYYY-MM-DD, or 'today'/None)."""
+        if date == 'today' or date is None:
+            return f"{self.base_url}/mens-college-basketball/scoreboard"
+        # Convert date format if needed
+        return f"{self.base_url}/mens-college-basketball/scoreboard/_/date/{date.replace('-', '')}"
+    
     def get_scores(self, date: str = None) -> List[Dict]:
         """Get scores for a specific date."""
         try:
-            if date == 'today' or date is None:
-                url = f"{self.base_url}/mens-college-basketball/scoreboard"
-            else:
-                # Convert date format if needed
-                url = f"{self.base_url}/mens-college-basketball/scoreboard/_/date/{date.replace('-', '')}"
-            
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            games = []
-            
-            # Parse game containers
-            game_containers = soup.find_all('div', class_=lambda x: x and 'game' in x.lower() if x else False)
+            return self.fetch_scores(date)
+        except Exception as e:
+            self.log(f"Error getting scores: {str(e)}")
+            return []
+    
+    def fetch_scores(self, date: str = None) -> List[Dict]:
+        """Fetch and parse a scoreboard, raising on failure."""
+        response = self.session.get(self.scores_url(date), timeout=30)
+        response.raise_for_status()
+        return self.parse_scores(response.content, date)
+    
+    def parse_scores(self, content: bytes, date: str = None) -> List[Dict]:
+        """Parse a scoreboard page into games."""
+        soup = BeautifulSoup(content, 'lxml')
+        games = []
+        
+        # Parse game containers
+        game_containers = GAME_SELECTOR.select(soup)
+        
+        for container in game_containers:
+            try:
+                game_data = {
+                    'date': date or datetime.now().strftime('%Y-%m-%d'),
+                    'away_team': None,
+                    'home_team': None,
+                    'away_score': None,
+                    'home_score': None,
+                    'status': None
+                }
+                
+                # Extract team and score info
+                teams = TEAM_SELECTOR.select(container)
+                if len(teams) >= 2:
+                    game_data['away_team'] = teams[0].get_text(strip=True)
+                    game_data['home_team'] = teams[1].get_text(strip=True)
+                
+                scores = SCORE_SELECTOR.select(container)
+                if len(scores) >= 2:
+                    try:
+                        game_data['away_score'] = int(scores[0].get_text(strip=True))
+                        game_data['home_score'] = int(scores[1].get_text(strip=True))
+                    except ValueError:
+                        pass
+                
+                games.append(game_data)
+            except Exception as e:
+                self.log(f"Error parsing game: {str(e)}")
+                continue
+        
+        return games
+    
+    async def _fetch(self, session, url: str, semaphore) -> bytes:
+        """Fetch a single URL under the shared concurrency limit."""
+        async with semaphore:
+            self.log(f"Fetching {url}")
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                response.raise_for_status()
+                return await response.read()
+    
+    async def _fetch_all(self, urls: List[str]) -> List[Any]:
+        """Fetch URLs concurrently; failed fetches come back as exceptions."""
+        semaphore = asyncio.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+        headers = {'User-Agent': self.session.headers['User-Agent']}
+        
+        async with aiohttp.ClientSession(headers=headers) as session:
+            return await asyncio.gather(
+                *(self._fetch(session, url, semaphore) for url in urls),
+                return_exceptions=True
+            )
+    
+    def get_scores_batch(self, dates: List[str]) -> Dict[str, Optional[List[Dict]]]:
+        """Get scores for several dates, fetched concurrently.
+        
+        A date whose scoreboard could not be fetched or parsed maps to None,
+        so callers can tell it apart from a day with no games ([]).
+        """
+        if aiohttp is None:
+            self.log("aiohttp not installed, fetching dates on a thread pool")
             
-            for container in game_containers:
+            def fetch(date):
                 try:
-                    game_data = {
-                        'date': date or datetime.now().strftime('%Y-%m-%d'),
-                        'away_team': None,
-                        'home_team': None,
-                        'away_score': None,
-                        'home_score': None,
-                        'status': None
-                    }
-                    
-                    # Extract team and score info
-                    teams = container.find_all(['span', 'div'], class_=lambda x: x and 'team' in x.lower() if x else False)
-                    if len(teams) >= 2:
-                        game_data['away_team'] = teams[0].get_text(strip=True)
-                        game_data['home_team'] = teams[1].get_text(strip=True)
-                    
-                    scores = container.find_all(['span', 'div'], class_=lambda x: x and 'score' in x.lower() if x else False)
-                    if len(scores) >= 2:
-                        try:
-                            game_data['away_score'] = int(scores[0].get_text(strip=True))
-                            game_data['home_score'] = int(scores[1].get_text(strip=True))
-                        except ValueError:
-                            pass
-                    
-                    games.append(game_data)
+                    return self.fetch_scores(date)
                 except Exception as e:
-                    self.log(f"Error parsing game: {str(e)}")
-                    continue
+                    self.log(f"Error getting scores for {date}: {str(e)}")
+                    return None
             
-            return games
-        except Exception as e:
-            self.log(f"Error getting scores: {str(e)}")
-            return []
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as pool:
+                return dict(zip(dates, pool.map(fetch, dates)))
+        
+        urls = [self.scores_url(date) for date in dates]
+        bodies = asyncio.run(self._fetch_all(urls))
+        
+        results = {}
+        for date, url, body in zip(dates, urls, bodies):
+            if isinstance(body, Exception):
+                self.log(f"Request failed for {url}: {str(body)}")
+                results[date] = None
+                continue
+            
+            try:
+                results[date] = self.parse_scores(body, date)
+            except Exception as e:
+                self.log(f"Error parsing scores for {date}: {str(e)}")
+                results[date] = None
+        
+        return results
 
 def main():
     parser = argparse.ArgumentParser(description='ESPN College Basketball Scraper')
-    parser.add_argument('command', choices=['bpi', 'scores', 'schedule'])
+    parser.add_argument('command', choices=['bpi', 'scores', 'scores-batch', 'schedule'])
     parser.add_argument('--top', type=int, help='Limit to top N teams')
     parser.add_argument('--date', help='Date for scores (YYYY-MM-DD or "today")')
+    parser.add_argument('--dates', nargs='+', help='Several dates, fetched concurrently (scores-batch)')
     parser.add_argument('--team', help='Team name for schedule')
     parser.add_argument('--pretty', action='store_true', help='Pretty print output')
     parser.add_argument('--csv', action='store_true', help='CSV format')
@@ -147,6 +257,11 @@ def main():
             result = scraper.get_bpi_rankings(args.top)
         elif args.command == 'scores':
             result = scraper.get_scores(args.date)
+        elif args.command == 'scores-batch':
+            if not args.dates:
+                print("Error: --dates is required for scores-batch command", file=sys.stderr)
+                sys.exit(1)
+            result = scraper.get_scores_batch(args.dates)
         else:
             result = []
         
@@ -5,119 +5,285 @@ Scrapes fantasypros.com for college basketball projections, DFS, and news.
 """
 
 import argparse
+import asyncio
+import functools
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 
 try:
     import requests
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer
+    import soupsieve
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry
 except ImportError:
-    print("Install dependencies: pip install requests beautifulsoup4", file=sys.stderr)
+    print("Install dependencies: pip install requests beautifulsoup4 lxml", file=sys.stderr)
     sys.exit(1)
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
 BASE_URL = "https://www.fantasypros.com/college-basketball"
+PROJECTIONS_URL = f"{BASE_URL}/stats/college-basketball-stats.php"
+PICKS_URL = f"{BASE_URL}/expert-picks.php"
+NEWS_URL = f"{BASE_URL}/news/"
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
     "Accept": "text/html,application/xhtml+xml",
 }
 
+# Pages change at most daily; cached responses are revalidated with ETag/Last-Modified once stale
+CACHE_EXPIRY = timedelta(hours=1)
+
+def _build_session(use_cache: bool = True) -> requests.Session:
+    """Session for every endpoint (same host): disk-cached when requests-cache is installed, keep-alive, retrying."""
+    if use_cache and requests_cache is not None:
+        session = requests_cache.CachedSession(
+            "fantasypros_cache",
+            backend="sqlite",
+            use_cache_dir=True,
+            expire_after=CACHE_EXPIRY,
+            allowable_codes=[200],
+            cache_control=True
+        )
+    else:
+        session = requests.Session()
+    session.headers.update(HEADERS)
+    # Retry rate limits and transient errors
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+    ))
+    return session
+
+_SESSION = _build_session()
+
+# Requests in flight at once when fetching several pages concurrently
+MAX_CONCURRENT_REQUESTS = 8
+
+# Items returned per endpoint; parsing stops once these are filled
+MAX_PLAYERS = 50
+MAX_ITEMS = 20
+
+# Precompiled so pick/news cards are walked lazily with iselect and abandoned early
+PICK_SELECTOR = soupsieve.compile("article, .pick-card, .expert-pick")
+NEWS_SELECTOR = soupsieve.compile("article, .news-item, .story")
+
+def parse_projections_table(content: bytes, limit: int = None) -> tuple:
+    """Extract (header names, row cell texts, data row count) from the stats table, with selectolax when installed.
+    
+    Empty rows are skipped; cell text is only extracted for the first `limit` data rows.
+    """
+    rows = []
+    total = 0
+    
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(content)
+        table = tree.css_first("table.table")
+        if table is None:
+            table = tree.css_first("table")
+        if table is None:
+            return [], [], 0
+        headers_row = [th.text(strip=True) for th in table.css("thead th")]
+        for tr in table.css("tbody tr"):
+            cells = tr.css("td")
+            if cells:
+                total += 1
+                if limit is None or len(rows) < limit:
+                    rows.append([td.text(strip=True) for td in cells])
+        return headers_row, rows, total
+    
+    # Only <table> subtrees are built; everything else on the page is skipped during the parse
+    soup = BeautifulSoup(content, "lxml", parse_only=SoupStrainer("table"))
+    table = soup.select_one("table.table") or soup.find("table")
+    if not table:
+        return [], [], 0
+    # Walk direct children rather than running the CSS engine once per row
+    thead = table.find("thead", recursive=False)
+    tbody = table.find("tbody", recursive=False) or table  # lxml doesn't insert an implied <tbody>
+    headers_row = [
+        th.get_text(strip=True)
+        for tr in (thead.find_all("tr", recursive=False) if thead else [])
+        for th in tr.find_all("th", recursive=False)
+    ]
+    for tr in tbody.find_all("tr", recursive=False):
+        cells = tr.find_all("td", recursive=False)
+        if cells:
+            total += 1
+            if limit is None or len(rows) < limit:
+                rows.append([td.get_text(strip=True) for td in cells])
+    return headers_row, rows, total
+
+def parse_projections(content: bytes, stat: str = "overall") -> dict:
+    """Build the projections result from a stats page."""
+    headers_row, rows, total = parse_projections_table(content, MAX_PLAYERS)
+    players = [dict(zip(headers_row, cells)) for cells in rows] if headers_row else rows
+    
+    return {
+        "type": "projections",
+        "stat": stat,
+        "players": players,
+        "total": total,
+        "source": "fantasypros.com"
+    }
+
 def get_projections(stat: str = "overall", pretty: bool = False) -> dict:
     """Get player projections/rankings."""
-    url = f"{BASE_URL}/stats/college-basketball-stats.php"
-    
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=15)
+        resp = _SESSION.get(PROJECTIONS_URL, timeout=15)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
-        
-        players = []
-        table = soup.select_one("table.table") or soup.select_one("#data table") or soup.select_one("table")
-        if table:
-            headers_row = [th.get_text(strip=True) for th in table.select("thead th")]
-            for row in table.select("tbody tr"):
-                cells = [td.get_text(strip=True) for td in row.select("td")]
-                if headers_row and cells:
-                    players.append(dict(zip(headers_row, cells)))
-                elif cells:
-                    players.append(cells)
-        
-        return {
-            "type": "projections",
-            "stat": stat,
-            "players": players[:50],
-            "total": len(players),
-            "source": "fantasypros.com"
-        }
+        return parse_projections(resp.content, stat)
     except Exception as e:
         return {"error": str(e), "source": "fantasypros.com"}
 
+def get_projections_multi(stats: list, pretty: bool = False) -> dict:
+    """Get projections for several stat names with a single page fetch and parse."""
+    stats = list(dict.fromkeys(stats))
+    # Every stat is served by the same stats page, so fetch and parse it once and relabel per stat
+    result = get_projections(stats[0] if stats else "overall")
+    if "error" in result:
+        return {stat: result for stat in stats}
+    return {stat: {**result, "stat": stat} for stat in stats}
+
+def parse_expert_picks(content: bytes) -> dict:
+    """Build the expert picks result from a picks page."""
+    soup = BeautifulSoup(content, "lxml")
+    
+    picks = []
+    for article in PICK_SELECTOR.iselect(soup):
+        pick = {}
+        title = article.select_one("h2, h3, .title")
+        if title:
+            pick["title"] = title.get_text(strip=True)
+        desc = article.select_one("p, .description, .summary")
+        if desc:
+            pick["description"] = desc.get_text(strip=True)
+        if pick:
+            picks.append(pick)
+            if len(picks) == MAX_ITEMS:
+                break
+    
+    return {
+        "type": "expert_picks",
+        "picks": picks,
+        "source": "fantasypros.com"
+    }
+
 def get_expert_picks(pretty: bool = False) -> dict:
     """Get expert CBB picks."""
-    url = f"{BASE_URL}/expert-picks.php"
-    
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=15)
+        resp = _SESSION.get(PICKS_URL, timeout=15)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
-        
-        picks = []
-        for article in soup.select("article, .pick-card, .expert-pick"):
-            pick = {}
-            title = article.select_one("h2, h3, .title")
-            if title:
-                pick["title"] = title.get_text(strip=True)
-            desc = article.select_one("p, .description, .summary")
-            if desc:
-                pick["description"] = desc.get_text(strip=True)
-            if pick:
-                picks.append(pick)
-        
-        return {
-            "type": "expert_picks",
-            "picks": picks[:20],
-            "source": "fantasypros.com"
-        }
+        return parse_expert_picks(resp.content)
     except Exception as e:
         return {"error": str(e), "source": "fantasypros.com"}
 
+def parse_news(content: bytes) -> dict:
+    """Build the news result from a news page."""
+    soup = BeautifulSoup(content, "lxml")
+    
+    articles = []
+    for item in NEWS_SELECTOR.iselect(soup):
+        article = {}
+        title = item.select_one("h2, h3, .headline, a")
+        if title:
+            article["title"] = title.get_text(strip=True)
+            link = title.get("href") or (title.select_one("a") or {}).get("href", "")
+            if link:
+                article["url"] = link if link.startswith("http") else f"https://www.fantasypros.com{link}"
+        date = item.select_one("time, .date, .timestamp")
+        if date:
+            article["date"] = date.get_text(strip=True)
+        if article.get("title"):
+            articles.append(article)
+            if len(articles) == MAX_ITEMS:
+                break
+    
+    return {
+        "type": "news",
+        "articles": articles,
+        "source": "fantasypros.com"
+    }
+
 def get_news(pretty: bool = False) -> dict:
     """Get latest NCAAB news from FantasyPros."""
-    url = f"{BASE_URL}/news/"
-    
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=15)
+        resp = _SESSION.get(NEWS_URL, timeout=15)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
-        
-        articles = []
-        for item in soup.select("article, .news-item, .story"):
-            article = {}
-            title = item.select_one("h2, h3, .headline, a")
-            if title:
-                article["title"] = title.get_text(strip=True)
-                link = title.get("href") or (title.select_one("a") or {}).get("href", "")
-                if link:
-                    article["url"] = link if link.startswith("http") else f"https://www.fantasypros.com{link}"
-            date = item.select_one("time, .date, .timestamp")
-            if date:
-                article["date"] = date.get_text(strip=True)
-            if article.get("title"):
-                articles.append(article)
-        
-        return {
-            "type": "news",
-            "articles": articles[:20],
-            "source": "fantasypros.com"
-        }
+        return parse_news(resp.content)
     except Exception as e:
         return {"error": str(e), "source": "fantasypros.com"}
 
+async def _fetch(session, url: str, semaphore) -> bytes:
+    """Fetch a single URL under the shared concurrency limit."""
+    async with semaphore:
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
+            resp.raise_for_status()
+            return await resp.read()
+
+async def _fetch_all(jobs: list) -> list:
+    """Fetch (url, parse) jobs concurrently, parsing on the default executor; failures come back as exceptions."""
+    semaphore = asyncio.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+    loop = asyncio.get_running_loop()
+    connector = aiohttp.TCPConnector(limit_per_host=MAX_CONCURRENT_REQUESTS, keepalive_timeout=30)
+    
+    async with aiohttp.ClientSession(headers=HEADERS, connector=connector) as session:
+        async def run(url, parse):
+            body = await _fetch(session, url, semaphore)
+            # HTML parsing is CPU-bound; keep it off the event loop so other responses keep streaming
+            return await loop.run_in_executor(None, parse, body)
+        
+        return await asyncio.gather(*(run(url, parse) for url, parse in jobs), return_exceptions=True)
+
+def get_all(stat: str = "overall", pretty: bool = False) -> dict:
+    """Get projections, expert picks and news, fetched concurrently."""
+    if aiohttp is None:
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = {
+                "projections": pool.submit(get_projections, stat),
+                "picks": pool.submit(get_expert_picks),
+                "news": pool.submit(get_news)
+            }
+            return {name: future.result() for name, future in futures.items()}
+    
+    jobs = {
+        "projections": (PROJECTIONS_URL, functools.partial(parse_projections, stat=stat)),
+        "picks": (PICKS_URL, parse_expert_picks),
+        "news": (NEWS_URL, parse_news)
+    }
+    results = asyncio.run(_fetch_all(list(jobs.values())))
+    return {
+        name: {"error": str(result), "source": "fantasypros.com"} if isinstance(result, Exception) else result
+        for name, result in zip(jobs, results)
+    }
+
 def main():
     parser = argparse.ArgumentParser(description="FantasyPros NCAAB Scraper")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the on-disk HTTP response cache")
     sub = parser.add_subparsers(dest="command")
     
     p = sub.add_parser("projections", help="Player projections/rankings")
-    p.add_argument("--stat", default="overall")
+    p.add_argument("--stat", default="overall", help="Stat name, or a comma-separated list")
     p.add_argument("--pretty", action="store_true")
     
     e = sub.add_parser("picks", help="Expert picks")
@@ -126,21 +292,39 @@ def main():
     n = sub.add_parser("news", help="Latest NCAAB news")
     n.add_argument("--pretty", action="store_true")
     
+    a = sub.add_parser("all", help="Projections, picks and news, fetched concurrently")
+    a.add_argument("--stat", default="overall")
+    a.add_argument("--pretty", action="store_true")
+    
     args = parser.parse_args()
     
     if not args.command:
         parser.print_help()
         sys.exit(1)
     
+    if args.no_cache:
+        global _SESSION
+        _SESSION = _build_session(use_cache=False)
+    
     if args.command == "projections":
-        result = get_projections(args.stat, args.pretty)
+        stats = [stat.strip() for stat in args.stat.split(",") if stat.strip()]
+        if len(stats) > 1:
+            result = get_projections_multi(stats, args.pretty)
+        else:
+            result = get_projections(stats[0] if stats else args.stat, args.pretty)
     elif args.command == "picks":
         result = get_expert_picks(args.pretty)
     elif args.command == "news":
         result = get_news(args.pretty)
+    elif args.command == "all":
+        result = get_all(args.stat, args.pretty)
     
-    indent = 2 if getattr(args, "pretty", False) else None
-    print(json.dumps(result, indent=indent, default=str))
+    pretty = getattr(args, "pretty", False)
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        print(orjson.dumps(result, default=str, option=option).decode())
+    else:
+        print(json.dumps(result, indent=2 if pretty else None, default=str))
 
 if __name__ == "__main__":
     main()
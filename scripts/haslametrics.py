@@ -10,24 +10,54 @@ Usage:
 """
 
 import argparse
+import io
 import json
 import sys
 import traceback
+from csv import DictWriter
+from datetime import timedelta
 from typing import Dict, List, Any
 
 try:
     import requests
     from bs4 import BeautifulSoup
-    import pandas as pd
+    import soupsieve
 except ImportError:
-    print("Error: Install with: pip3 install requests beautifulsoup4 lxml pandas")
+    print("Error: Install with: pip3 install requests beautifulsoup4 lxml")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# Prediction containers: any div whose class mentions 'prediction', matched case-insensitively by soupsieve
+PREDICTION_SELECTOR = soupsieve.compile("div[class*='prediction' i]")
+
+# Pages change at most daily; cached responses are revalidated with ETag/Last-Modified once stale
+CACHE_EXPIRY = timedelta(hours=1)
+
 class HaslametricsScraper:
-    def __init__(self, debug: bool = False):
+    def __init__(self, debug: bool = False, use_cache: bool = True):
         self.debug = debug
         self.base_url = "https://haslametrics.com"
-        self.session = requests.Session()
+        if use_cache and requests_cache is not None:
+            # Persist responses on disk so repeated CLI runs skip the network
+            self.session = requests_cache.CachedSession(
+                'haslametrics_cache',
+                backend='sqlite',
+                use_cache_dir=True,
+                expire_after=CACHE_EXPIRY,
+                allowable_codes=[200],
+                cache_control=True
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
@@ -38,7 +68,16 @@ class HaslametricsScraper:
     
     def format_output(self, data: Any, pretty: bool = False, csv: bool = False) -> str:
         if csv and isinstance(data, list) and len(data) > 0 and isinstance(data[0], dict):
-            return pd.DataFrame(data).to_csv(index=False)
+            buf = io.StringIO()
+            writer = DictWriter(buf, fieldnames=list(dict.fromkeys(k for row in data for k in row)), lineterminator='\n')
+            writer.writeheader()
+            writer.writerows(data)
+            return buf.getvalue()
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(data, default=str, option=option).decode()
         return json.dumps(data, indent=2 if pretty else None, default=str)
     
     def get_predictions(self, date: str = 'today') -> List[Dict]:
@@ -47,11 +86,11 @@ class HaslametricsScraper:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             predictions = []
             
             # Parse prediction data
-            game_containers = soup.find_all('div', class_=lambda x: x and 'prediction' in x.lower() if x else False)
+            game_containers = PREDICTION_SELECTOR.select(soup)
             
             for container in game_containers:
                 try:
@@ -76,10 +115,11 @@ def main():
     parser.add_argument('--top', type=int)
     parser.add_argument('--pretty', action='store_true')
     parser.add_argument('--csv', action='store_true')
+    parser.add_argument('--no-cache', action='store_true', help='Bypass the on-disk HTTP response cache')
     parser.add_argument('--debug', action='store_true')
     
     args = parser.parse_args()
-    scraper = HaslametricsScraper(debug=args.debug)
+    scraper = HaslametricsScraper(debug=args.debug, use_cache=not args.no_cache)
     
     try:
         if args.command == 'predictions':
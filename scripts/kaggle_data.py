@@ -12,10 +12,14 @@ Usage:
 """
 
 import argparse
+import io
 import json
 import sys
 import traceback
 import os
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any
 
 try:
@@ -31,24 +35,93 @@ try:
 except ImportError:
     KAGGLE_AVAILABLE = False
 
+try:
+    import pyarrow
+    import pyarrow.csv as pyarrow_csv
+except ImportError:
+    pyarrow = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Arrow CSV parsing with Arrow-backed columns (dtype_backend needs pandas 2)
+ARROW_CSV = pyarrow is not None and int(pd.__version__.split('.')[0]) >= 2
+
+# Dataset name -> CSV file name (matched as a suffix, so M/W-prefixed competition files are found)
+DATASET_FILES = {
+    'teams': 'Teams.csv',
+    'seeds': 'NCAATourneySeeds.csv',
+    'results': 'NCAATourneyCompactResults.csv',
+    'detailed_results': 'NCAATourneyDetailedResults.csv',
+    'regular_season': 'RegularSeasonCompactResults.csv',
+    'regular_season_detailed': 'RegularSeasonDetailedResults.csv',
+    'coaches': 'TeamCoaches.csv',
+    'conferences': 'Conferences.csv'
+}
+
+# Compact dtypes applied on load: seasons fit int16, and a few dozen distinct seed codes suit a category
+DATASET_DTYPES = {
+    'seeds': {'Season': 'int16', 'Seed': 'category'}
+}
+
+# Parsed datasets kept in memory per loader; the detailed results files run to hundreds of MB
+DF_CACHE_SIZE = 4
+
 class KaggleMarchMadnessData:
     def __init__(self, debug: bool = False):
         self.debug = debug
         self.data_dir = "kaggle_data"
+        self._df_cache = OrderedDict()  # dataset -> full DataFrame, least recently used first
         
         # Ensure data directory exists
         if not os.path.exists(self.data_dir):
             os.makedirs(self.data_dir)
         
+        self._refresh_index()
+        
     def log(self, message: str):
         if self.debug:
             print(f"[DEBUG] {message}", file=sys.stderr)
     
     def format_output(self, data: Any, pretty: bool = False, csv: bool = False) -> str:
+        # Frames are written directly, without a round trip through row dicts
+        if isinstance(data, pd.DataFrame):
+            if csv:
+                return self._frame_csv(data)
+            return data.to_json(orient='records', indent=2 if pretty else None, default_handler=str)
         if csv and isinstance(data, list) and len(data) > 0 and isinstance(data[0], dict):
+            if pyarrow is not None:
+                try:
+                    # Columns from every row, in first-seen order; missing keys become empty fields
+                    columns = list(dict.fromkeys(k for row in data for k in row))
+                    return self._arrow_csv(pyarrow.table({c: [row.get(c) for row in data] for c in columns}))
+                except pyarrow.ArrowException as e:
+                    self.log(f"Arrow CSV writer failed, using pandas: {str(e)}")
             return pd.DataFrame(data).to_csv(index=False)
+        if orjson is not None:
+            option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(data, default=str, option=option).decode()
         return json.dumps(data, indent=2 if pretty else None, default=str)
     
+    def _arrow_csv(self, table) -> str:
+        """Write an Arrow table as CSV in one native pass."""
+        buf = io.BytesIO()
+        pyarrow_csv.write_csv(table, buf)
+        return buf.getvalue().decode()
+    
+    def _frame_csv(self, df: pd.DataFrame) -> str:
+        """CSV for a frame, via Arrow's writer when pyarrow is installed."""
+        if pyarrow is not None:
+            try:
+                return self._arrow_csv(pyarrow.Table.from_pandas(df, preserve_index=False))
+            except pyarrow.ArrowException as e:
+                self.log(f"Arrow CSV writer failed, using pandas: {str(e)}")
+        return df.to_csv(index=False)
+    
     def check_kaggle_setup(self) -> bool:
         """Check if Kaggle API is properly configured."""
         if not KAGGLE_AVAILABLE:
@@ -61,8 +134,8 @@ class KaggleMarchMadnessData:
             self.log(f"Kaggle authentication failed: {str(e)}")
             return False
     
-    def download_competition_data(self, competition: str) -> Dict:
-        """Download March Madness competition data from Kaggle."""
+    def download_competition_data(self, competition: str, files: List[str] = None) -> Dict:
+        """Download March Madness competition data from Kaggle, optionally only the named files."""
         try:
             if not self.check_kaggle_setup():
                 return {
@@ -78,9 +151,18 @@ class KaggleMarchMadnessData:
             
             self.log(f"Downloading competition data: {competition}")
             
+            # New files may shadow ones already loaded
+            self._df_cache.clear()
+            
             # Download competition files
             download_path = os.path.join(self.data_dir, competition)
-            kaggle.api.competition_download_files(competition, path=download_path)
+            if files:
+                for file_name in files:
+                    kaggle.api.competition_download_file(competition, file_name, path=download_path)
+            else:
+                kaggle.api.competition_download_files(competition, path=download_path)
+            self._extract_archives(download_path)
+            self._refresh_index()
             
             # List downloaded files
             files = []
@@ -99,52 +181,87 @@ class KaggleMarchMadnessData:
             self.log(f"Error downloading competition data: {str(e)}")
             return {'error': str(e)}
     
-    def load_dataset(self, dataset: str, year: int = None) -> List[Dict]:
-        """Load a specific dataset (teams, seeds, results, etc.)."""
-        try:
-            # Map dataset names to file patterns
-            file_patterns = {
-                'teams': 'Teams.csv',
-                'seeds': 'NCAATourneySeeds.csv',
-                'results': 'NCAATourneyCompactResults.csv',
-                'detailed_results': 'NCAATourneyDetailedResults.csv',
-                'regular_season': 'RegularSeasonCompactResults.csv',
-                'regular_season_detailed': 'RegularSeasonDetailedResults.csv',
-                'coaches': 'TeamCoaches.csv',
-                'conferences': 'Conferences.csv'
-            }
-            
-            if dataset not in file_patterns:
-                return [{'error': f'Unknown dataset: {dataset}. Available: {list(file_patterns.keys())}'}]
-            
-            filename = file_patterns[dataset]
+    def _read_csv(self, file_path: str) -> pd.DataFrame:
+        """Read a CSV with the multithreaded Arrow parser and Arrow-backed columns when pyarrow is installed."""
+        if ARROW_CSV:
+            return pd.read_csv(file_path, engine='pyarrow', dtype_backend='pyarrow')
+        return pd.read_csv(file_path)
+    
+    def _extract_archives(self, download_path: str):
+        """Unpack downloaded zips next to them, inflating members on a thread pool (zlib releases the GIL)."""
+        for name in os.listdir(download_path):
+            if not name.endswith('.zip'):
+                continue
             
-            # Look for file in downloaded competition data
-            file_path = None
-            for root, dirs, files in os.walk(self.data_dir):
-                for file in files:
-                    if file.endswith(filename):
-                        file_path = os.path.join(root, file)
-                        break
-                if file_path:
-                    break
+            archive = os.path.join(download_path, name)
+            with zipfile.ZipFile(archive) as zf:
+                members = [member for member in zf.namelist() if not member.endswith('/')]
+            self.log(f"Extracting {len(members)} files from {archive}")
             
-            if not file_path:
-                return [{'error': f'File not found: {filename}. Run download command first.'}]
+            def extract(member: str):
+                # Each worker reads through its own handle
+                with zipfile.ZipFile(archive) as zf:
+                    zf.extract(member, download_path)
             
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                list(pool.map(extract, members))
+    
+    def _refresh_index(self):
+        """Walk the data directory once, indexing file name -> path (first found wins)."""
+        self._file_index = {}
+        for root, dirs, files in os.walk(self.data_dir):
+            for file in files:
+                self._file_index.setdefault(file, os.path.join(root, file))
+    
+    def _resolve_path(self, filename: str) -> str:
+        """Find a dataset file in the downloaded competition data via the file index."""
+        file_path = self._file_index.get(filename)
+        if not file_path:
+            # Competition files may carry a prefix (MNCAATourneySeeds.csv), so fall back to a suffix match
+            file_path = next((path for file, path in self._file_index.items() if file.endswith(filename)), None)
+        
+        if not file_path:
+            raise FileNotFoundError(f'File not found: {filename}. Run download command first.')
+        
+        return file_path
+    
+    def _load_df(self, dataset: str, year: int = None) -> pd.DataFrame:
+        """Load a dataset as a DataFrame, optionally filtered to one season.
+        
+        Parsed datasets are cached and shared between callers; they must not be modified in place.
+        """
+        if dataset not in DATASET_FILES:
+            raise ValueError(f'Unknown dataset: {dataset}. Available: {list(DATASET_FILES.keys())}')
+        
+        df = self._df_cache.get(dataset)
+        if df is not None:
+            self._df_cache.move_to_end(dataset)
+            self.log(f"Reusing loaded dataset: {dataset}")
+        else:
+            file_path = self._resolve_path(DATASET_FILES[dataset])
             self.log(f"Loading dataset from: {file_path}")
             
             # Load CSV data
-            df = pd.read_csv(file_path)
-            
-            # Filter by year if specified
-            if year and 'Season' in df.columns:
-                df = df[df['Season'] == year]
+            df = self._read_csv(file_path)
+            if dataset in DATASET_DTYPES:
+                df = df.astype(DATASET_DTYPES[dataset])
+            self._df_cache[dataset] = df
+            if len(self._df_cache) > DF_CACHE_SIZE:
+                self._df_cache.popitem(last=False)
+        
+        # Filter by year if specified
+        if year and 'Season' in df.columns:
+            df = df[df['Season'] == year]
+        
+        return df
+    
+    def load_dataset(self, dataset: str, year: int = None, as_frame: bool = False) -> Any:
+        """Load a specific dataset (teams, seeds, results, etc.) as row dicts, or the DataFrame itself."""
+        try:
+            df = self._load_df(dataset, year)
             
             # Convert to list of dictionaries
-            data = df.to_dict('records')
-            
-            return data
+            return df if as_frame else df.to_dict('records')
             
         except Exception as e:
             self.log(f"Error loading dataset: {str(e)}")
@@ -169,16 +286,9 @@ class KaggleMarchMadnessData:
     def analyze_seed_performance(self, years: str = None) -> Dict:
         """Analyze how different seeds perform historically."""
         try:
-            # Load tournament results
-            results = self.load_dataset('results')
-            seeds = self.load_dataset('seeds')
-            
-            if not results or not seeds:
-                return {'error': 'Could not load required datasets'}
-            
-            # Convert to DataFrames for analysis
-            results_df = pd.DataFrame(results)
-            seeds_df = pd.DataFrame(seeds)
+            # Load tournament results as frames; a missing dataset raises and is reported below
+            results_df = self._load_df('results')
+            seeds_df = self._load_df('seeds')
             
             # Parse years range
             year_list = []
@@ -200,18 +310,21 @@ class KaggleMarchMadnessData:
                 'championship_seeds': []
             }
             
-            # Calculate basic seed statistics
-            for seed in range(1, 17):
-                seed_teams = seeds_df[seeds_df['Seed'].str.contains(f'{seed:02d}', na=False)]
-                total_teams = len(seed_teams)
-                
-                if total_teams > 0:
-                    analysis['seed_win_rates'][f'seed_{seed}'] = {
-                        'total_appearances': total_teams,
-                        'avg_wins': f"Analysis would require game-by-game processing",
-                        'championship_rate': 0.0,
-                        'final_four_rate': 0.0
-                    }
+            # Calculate basic seed statistics: seed number from codes like 'W01'/'X16a', counted in one groupby.
+            # On the categorical Seed column the extract runs once per distinct code, not once per row.
+            seed_nums = seeds_df['Seed'].str.extract(r'(?P<SeedNum>\d{2})', expand=False)
+            seeds_df = seeds_df.assign(SeedNum=seed_nums.astype('Int8'))
+            counts = seeds_df.groupby('SeedNum').size()
+            
+            analysis['seed_win_rates'] = {
+                f'seed_{seed}': {
+                    'total_appearances': int(total_teams),
+                    'avg_wins': f"Analysis would require game-by-game processing",
+                    'championship_rate': 0.0,
+                    'final_four_rate': 0.0
+                }
+                for seed, total_teams in counts.items() if 1 <= seed <= 16
+            }
             
             return analysis
             
@@ -245,6 +358,7 @@ def main():
     parser = argparse.ArgumentParser(description='Kaggle March Madness Data Loader')
     parser.add_argument('command', choices=['download', 'load', 'analyze', 'list'])
     parser.add_argument('--competition', default='march-machine-learning-mania-2024')
+    parser.add_argument('--files', nargs='+', help='Only download these competition files (download)')
     parser.add_argument('--dataset', help='Dataset to load (teams, seeds, results, etc.)')
     parser.add_argument('--year', type=int, help='Filter by specific year')
     parser.add_argument('--type', help='Analysis type (seeds, upsets, conferences)')
@@ -258,12 +372,12 @@ def main():
     
     try:
         if args.command == 'download':
-            result = loader.download_competition_data(args.competition)
+            result = loader.download_competition_data(args.competition, args.files)
         elif args.command == 'load':
             if not args.dataset:
                 print("Error: --dataset required for load command", file=sys.stderr)
                 sys.exit(1)
-            result = loader.load_dataset(args.dataset, args.year)
+            result = loader.load_dataset(args.dataset, args.year, as_frame=True)
         elif args.command == 'analyze':
             if not args.type:
                 print("Error: --type required for analyze command", file=sys.stderr)
@@ -10,24 +10,62 @@ Usage:
 """
 
 import argparse
+import io
 import json
 import sys
 import traceback
+from csv import DictWriter
+from datetime import timedelta
 from typing import Dict, List, Any
 
 try:
     import requests
-    from bs4 import BeautifulSoup
-    import pandas as pd
+    from bs4 import BeautifulSoup, SoupStrainer
 except ImportError:
-    print("Error: Install with: pip3 install requests beautifulsoup4 lxml pandas")
+    print("Error: Install with: pip3 install requests beautifulsoup4 lxml")
     sys.exit(1)
 
+try:
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# Tags that hold a ratings row's values
+CELL_TAGS = ('td', 'th')
+
+# Rows of the main ratings table, or of the first table on the page if it has no id
+RATINGS_ROWS_XPATH = '//table[@id="ratingstable"]//tr'
+FALLBACK_ROWS_XPATH = '(//table)[1]//tr'
+
+# Pages change at most daily; cached responses are revalidated with ETag/Last-Modified once stale
+CACHE_EXPIRY = timedelta(hours=1)
+
 class MasseyRatingsScraper:
-    def __init__(self, debug: bool = False):
+    def __init__(self, debug: bool = False, use_cache: bool = True):
         self.debug = debug
         self.base_url = "https://masseyratings.com"
-        self.session = requests.Session()
+        if use_cache and requests_cache is not None:
+            # Persist responses on disk so repeated CLI runs skip the network
+            self.session = requests_cache.CachedSession(
+                'massey_cache',
+                backend='sqlite',
+                use_cache_dir=True,
+                expire_after=CACHE_EXPIRY,
+                allowable_codes=[200],
+                cache_control=True
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
@@ -38,7 +76,16 @@ class MasseyRatingsScraper:
     
     def format_output(self, data: Any, pretty: bool = False, csv: bool = False) -> str:
         if csv and isinstance(data, list) and len(data) > 0 and isinstance(data[0], dict):
-            return pd.DataFrame(data).to_csv(index=False)
+            buf = io.StringIO()
+            writer = DictWriter(buf, fieldnames=list(dict.fromkeys(k for row in data for k in row)), lineterminator='\n')
+            writer.writeheader()
+            writer.writerows(data)
+            return buf.getvalue()
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(data, default=str, option=option).decode()
         return json.dumps(data, indent=2 if pretty else None, default=str)
     
     def get_composite_ratings(self, top: int = None) -> List[Dict]:
@@ -47,32 +94,62 @@ class MasseyRatingsScraper:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            ratings = []
-            
-            # Look for main ratings table
-            table = soup.find('table', id='ratingstable')
-            if not table:
-                table = soup.find('table')
+            if lxml_html is not None:
+                try:
+                    return self.parse_ratings_xpath(response.content, top)
+                except Exception as e:
+                    self.log(f"XPath parse failed, falling back to BeautifulSoup: {str(e)}")
             
-            if table:
-                rows = table.find_all('tr')[1:]  # Skip header
-                for i, row in enumerate(rows):
-                    if top and i >= top:
-                        break
-                    cells = row.find_all(['td', 'th'])
-                    if len(cells) >= 4:
-                        ratings.append({
-                            'rank': cells[0].get_text(strip=True),
-                            'team': cells[1].get_text(strip=True),
-                            'rating': cells[2].get_text(strip=True),
-                            'record': cells[3].get_text(strip=True) if len(cells) > 3 else None
-                        })
-            
-            return ratings
+            return self.parse_ratings_soup(response.content, top)
         except Exception as e:
             self.log(f"Error: {str(e)}")
             return []
+    
+    def parse_ratings_xpath(self, content: bytes, top: int = None) -> List[Dict]:
+        """Parse the ratings table straight from the libxml2 tree, without building a soup."""
+        doc = lxml_html.fromstring(content)
+        rows = doc.xpath(RATINGS_ROWS_XPATH) or doc.xpath(FALLBACK_ROWS_XPATH)
+        rows = rows[1:top + 1] if top else rows[1:]  # Skip header
+        
+        ratings = []
+        for row in rows:
+            cells = row.xpath('./td|./th')
+            if len(cells) >= 4:
+                # Same text as get_text(strip=True): each text node stripped, then joined
+                rank, team, rating, record = (''.join(t.strip() for t in cell.itertext()) for cell in cells[:4])
+                ratings.append({
+                    'rank': rank,
+                    'team': team,
+                    'rating': rating,
+                    'record': record
+                })
+        return ratings
+    
+    def parse_ratings_soup(self, content: bytes, top: int = None) -> List[Dict]:
+        """Parse the ratings table with BeautifulSoup."""
+        ratings = []
+        
+        # Look for main ratings table, building only that subtree; fall back to the first table
+        table = BeautifulSoup(content, 'lxml', parse_only=SoupStrainer('table', id='ratingstable')).table
+        if not table:
+            table = BeautifulSoup(content, 'lxml', parse_only=SoupStrainer('table')).table
+        
+        if table:
+            # Stop the tree walk after the header plus `top` rows
+            rows = table.find_all('tr', limit=top + 1 if top else None)[1:]  # Skip header
+            for row in rows:
+                # Direct cell children in one pass, without a find_all per row
+                cells = [cell for cell in row.children if cell.name in CELL_TAGS]
+                if len(cells) >= 4:
+                    rank, team, rating, record = (cell.get_text(strip=True) for cell in cells[:4])
+                    ratings.append({
+                        'rank': rank,
+                        'team': team,
+                        'rating': rating,
+                        'record': record
+                    })
+        
+        return ratings
 
 def main():
     parser = argparse.ArgumentParser(description='Massey Ratings Scraper')
@@ -81,10 +158,11 @@ def main():
     parser.add_argument('--systems', type=int, help='Number of systems to compare')
     parser.add_argument('--pretty', action='store_true')
     parser.add_argument('--csv', action='store_true')
+    parser.add_argument('--no-cache', action='store_true', help='Bypass the on-disk HTTP response cache')
     parser.add_argument('--debug', action='store_true')
     
     args = parser.parse_args()
-    scraper = MasseyRatingsScraper(debug=args.debug)
+    scraper = MasseyRatingsScraper(debug=args.debug, use_cache=not args.no_cache)
     
     try:
         if args.command == 'composite':
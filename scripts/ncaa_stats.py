@@ -12,20 +12,85 @@ Usage:
 """
 
 import argparse
+import io
 import json
+import re
 import sys
 import traceback
 from datetime import datetime
+from itertools import islice
 from typing import Dict, List, Optional, Any
 
 try:
     import requests
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry, make_headers
+    import lxml.html
+    from lxml import etree
     import pandas as pd
 except ImportError:
     print("Error: Required packages not installed. Install with: pip3 install requests beautifulsoup4 lxml pandas")
     sys.exit(1)
 
+try:
+    import pyarrow
+    import pyarrow.csv as pyarrow_csv
+except ImportError:
+    pyarrow = None
+
+# Row count above which CSV output goes through Arrow's native writer instead of a DataFrame
+ARROW_CSV_MIN_ROWS = 500
+
+# Case-insensitive class-name substrings, matched by bs4's regex path instead of a Python callback per element
+RANKING_CLASS_RE = re.compile('ranking', re.I)
+RANK_CLASS_RE = re.compile('rank', re.I)
+TEAM_CLASS_RE = re.compile('team', re.I)
+STANDING_CLASS_RE = re.compile('standing', re.I)
+REGION_CLASS_RES = {region: re.compile(region, re.I) for region in ('south', 'west', 'east', 'midwest')}
+
+# Numeric stat cell: integer, or decimal with optional leading digits (".833"); a decimal group means float
+NUMBER_RE = re.compile(r'-?(?:\d+(\.\d+)?|(\.\d+))')
+
+# Compiled XPath for table extraction straight from the lxml tree
+TABLES_XPATH = etree.XPath('//table')
+ROWS_XPATH = etree.XPath('.//tr')
+ROW_CELLS_XPATH = etree.XPath('./td|./th')
+
+def _current_year() -> int:
+    """Default season/tournament year."""
+    return datetime.now().year
+
+def _find_table(doc, class_re):
+    """First <table> whose class matches class_re, else the first <table>, else None."""
+    tables = TABLES_XPATH(doc)
+    for table in tables:
+        if class_re.search(table.get('class', '')):
+            return table
+    return tables[0] if tables else None
+
+def _text(element) -> str:
+    """Element text with each text node stripped and joined, like get_text(strip=True)."""
+    return ''.join(text.strip() for text in element.itertext())
+
+def _row_texts(row) -> List[str]:
+    """Text of a row's cells."""
+    return [_text(cell) for cell in ROW_CELLS_XPATH(row)]
+
+def _region_sections(doc) -> Dict[str, Any]:
+    """First <div>/<section> whose class matches each region, found in a single walk of the tree."""
+    sections = {}
+    for node in doc.iter('div', 'section'):
+        class_name = node.get('class')
+        if not class_name:
+            continue
+        for region, region_re in REGION_CLASS_RES.items():
+            if region not in sections and region_re.search(class_name):
+                sections[region] = node
+        if len(sections) == len(REGION_CLASS_RES):
+            break
+    return sections
+
 class NCAAStatsScraper:
     """Scraper for official NCAA basketball statistics and NET rankings."""
     
@@ -35,9 +100,24 @@ class NCAAStatsScraper:
         self.ncaa_url = "https://www.ncaa.com"
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml',
+            'Accept-Language': 'en-US,en;q=0.9',
+            'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding']
         })
         
+        # Keep-alive pool sized for concurrent requests to stats.ncaa.org and ncaa.com, retrying rate limits and transient errors
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        self.session.mount('https://', adapter)
+        
     def log(self, message: str):
         """Log debug messages if debug mode enabled."""
         if self.debug:
@@ -47,6 +127,10 @@ class NCAAStatsScraper:
         """Format output data as JSON, pretty JSON, or CSV."""
         if csv and isinstance(data, list) and len(data) > 0:
             if isinstance(data[0], dict):
+                if pyarrow is not None and len(data) > ARROW_CSV_MIN_ROWS:
+                    output = self._arrow_csv(data)
+                    if output is not None:
+                        return output
                 df = pd.DataFrame(data)
                 return df.to_csv(index=False)
         
@@ -55,6 +139,19 @@ class NCAAStatsScraper:
         else:
             return json.dumps(data, default=str)
     
+    def _arrow_csv(self, data: List[Dict]) -> Optional[str]:
+        """CSV for row dicts via Arrow's writer; None if Arrow can't type a column."""
+        # Columns from every row, in first-seen order; missing keys become empty fields
+        columns = list(dict.fromkeys(k for row in data for k in row))
+        try:
+            table = pyarrow.table({c: [row.get(c) for row in data] for c in columns})
+            buf = io.BytesIO()
+            pyarrow_csv.write_csv(table, buf)
+        except pyarrow.ArrowException as e:
+            self.log(f"Arrow CSV writer failed, using pandas: {str(e)}")
+            return None
+        return buf.getvalue().decode()
+    
     def get_net_rankings(self, top: int = None) -> List[Dict]:
         """Get NCAA NET rankings."""
         try:
@@ -66,46 +163,42 @@ class NCAAStatsScraper:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Tables are read straight from the lxml tree, without building a soup
+            doc = lxml.html.fromstring(response.content)
             
             rankings = []
             
-            # Look for rankings table or list
-            table = soup.find('table', class_=lambda x: x and 'ranking' in x.lower() if x else False)
-            if not table:
-                # Try alternative selectors
-                table = soup.find('table')
-                if not table:
-                    # Try looking for div-based rankings
-                    ranking_items = soup.find_all('div', class_=lambda x: x and 'team' in x.lower() if x else False)
-                    return self.parse_ranking_divs(ranking_items, top)
-            
-            if table:
-                rows = table.find_all('tr')[1:]  # Skip header
+            # Look for rankings table, then any table
+            table = _find_table(doc, RANKING_CLASS_RE)
+            if table is None:
+                # Try looking for div-based rankings
+                soup = BeautifulSoup(response.content, 'lxml')
+                ranking_items = soup.find_all('div', class_=TEAM_CLASS_RE)
+                return self.parse_ranking_divs(ranking_items, top)
+            
+            # Skip the header and stop after `top` rows without copying the row list
+            rows = islice(ROWS_XPATH(table), 1, top + 1 if top else None)
+            
+            for i, row in enumerate(rows):
+                cells = _row_texts(row)
+                if len(cells) < 3:
+                    continue
                 
-                for i, row in enumerate(rows):
-                    if top and i >= top:
-                        break
-                        
-                    cells = row.find_all(['td', 'th'])
-                    if len(cells) < 3:
-                        continue
-                    
-                    try:
-                        rank_data = {
-                            'net_rank': int(cells[0].get_text(strip=True)),
-                            'team': cells[1].get_text(strip=True),
-                            'record': cells[2].get_text(strip=True) if len(cells) > 2 else None,
-                            'conference': cells[3].get_text(strip=True) if len(cells) > 3 else None,
-                            'quadrant_1_record': cells[4].get_text(strip=True) if len(cells) > 4 else None,
-                            'quadrant_2_record': cells[5].get_text(strip=True) if len(cells) > 5 else None,
-                            'quadrant_3_record': cells[6].get_text(strip=True) if len(cells) > 6 else None,
-                            'quadrant_4_record': cells[7].get_text(strip=True) if len(cells) > 7 else None,
-                        }
-                        rankings.append(rank_data)
-                    except (ValueError, IndexError) as e:
-                        self.log(f"Error parsing NET ranking row {i}: {str(e)}")
-                        continue
+                try:
+                    rank_data = {
+                        'net_rank': int(cells[0]),
+                        'team': cells[1],
+                        'record': cells[2] if len(cells) > 2 else None,
+                        'conference': cells[3] if len(cells) > 3 else None,
+                        'quadrant_1_record': cells[4] if len(cells) > 4 else None,
+                        'quadrant_2_record': cells[5] if len(cells) > 5 else None,
+                        'quadrant_3_record': cells[6] if len(cells) > 6 else None,
+                        'quadrant_4_record': cells[7] if len(cells) > 7 else None,
+                    }
+                    rankings.append(rank_data)
+                except (ValueError, IndexError) as e:
+                    self.log(f"Error parsing NET ranking row {i}: {str(e)}")
+                    continue
             
             return rankings
             
@@ -117,14 +210,11 @@ class NCAAStatsScraper:
         """Parse rankings from div-based layout."""
         rankings = []
         
-        for i, item in enumerate(ranking_items):
-            if top and i >= top:
-                break
-                
+        for i, item in enumerate(islice(ranking_items, top or None)):
             try:
                 # Extract rank and team name from div structure
-                rank_elem = item.find(['span', 'div'], class_=lambda x: x and 'rank' in x.lower() if x else False)
-                team_elem = item.find(['span', 'div'], class_=lambda x: x and 'team' in x.lower() if x else False)
+                rank_elem = item.find(['span', 'div'], class_=RANK_CLASS_RE)
+                team_elem = item.find(['span', 'div'], class_=TEAM_CLASS_RE)
                 
                 if rank_elem and team_elem:
                     rank_data = {
@@ -144,7 +234,7 @@ class NCAAStatsScraper:
         """Get official team statistics."""
         try:
             if season is None:
-                season = str(datetime.now().year)
+                season = str(_current_year())
             
             self.log(f"Getting team stats for {team}")
             
@@ -153,7 +243,7 @@ class NCAAStatsScraper:
             response = self.session.get(search_url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=SoupStrainer('table'))
             
             team_data = {
                 'team': team,
@@ -181,21 +271,17 @@ class NCAAStatsScraper:
                         table_type = 'rebounding'
                 
                 # Parse table rows
-                rows = table.find_all('tr')[1:]  # Skip header
+                rows = islice(table.find_all('tr'), 1, None)  # Skip header
                 for row in rows:
                     cells = row.find_all(['td', 'th'])
                     if len(cells) >= 2:
                         stat_name = cells[0].get_text(strip=True)
                         stat_value = cells[1].get_text(strip=True)
                         
-                        # Try to convert to number if possible
-                        try:
-                            if '.' in stat_value:
-                                stat_value = float(stat_value)
-                            elif stat_value.isdigit():
-                                stat_value = int(stat_value)
-                        except ValueError:
-                            pass
+                        # Convert to number if the whole cell is one; labels fall through as strings
+                        match = NUMBER_RE.fullmatch(stat_value)
+                        if match:
+                            stat_value = float(stat_value) if match.group(1) or match.group(2) else int(stat_value)
                         
                         if table_type not in team_data['stats']:
                             team_data['stats'][table_type] = {}
@@ -211,7 +297,7 @@ class NCAAStatsScraper:
         """Get conference standings."""
         try:
             if season is None:
-                season = str(datetime.now().year)
+                season = str(_current_year())
             
             self.log(f"Getting {conference} standings")
             
@@ -220,30 +306,28 @@ class NCAAStatsScraper:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            doc = lxml.html.fromstring(response.content)
             
             standings = []
             
-            # Look for standings table
-            table = soup.find('table', class_=lambda x: x and 'standing' in x.lower() if x else False)
-            if not table:
-                table = soup.find('table')
+            # Look for standings table, then any table
+            table = _find_table(doc, STANDING_CLASS_RE)
             
-            if table:
-                rows = table.find_all('tr')[1:]  # Skip header
+            if table is not None:
+                rows = islice(ROWS_XPATH(table), 1, None)  # Skip header
                 
                 for row in rows:
-                    cells = row.find_all(['td', 'th'])
+                    cells = _row_texts(row)
                     if len(cells) < 4:
                         continue
                     
                     try:
                         team_data = {
                             'rank': len(standings) + 1,
-                            'team': cells[0].get_text(strip=True),
-                            'conference_record': cells[1].get_text(strip=True),
-                            'overall_record': cells[2].get_text(strip=True),
-                            'conference_win_pct': cells[3].get_text(strip=True) if len(cells) > 3 else None,
+                            'team': cells[0],
+                            'conference_record': cells[1],
+                            'overall_record': cells[2],
+                            'conference_win_pct': cells[3] if len(cells) > 3 else None,
                             'conference': conference,
                             'season': season
                         }
@@ -262,7 +346,7 @@ class NCAAStatsScraper:
         """Get March Madness tournament bracket."""
         try:
             if year is None:
-                year = datetime.now().year
+                year = _current_year()
             
             self.log(f"Getting {year} tournament bracket")
             
@@ -270,7 +354,7 @@ class NCAAStatsScraper:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            doc = lxml.html.fromstring(response.content)
             
             bracket = {
                 'year': year,
@@ -279,10 +363,10 @@ class NCAAStatsScraper:
                 'championship': None
             }
             
-            # Look for bracket structure
-            regions = ['south', 'west', 'east', 'midwest']
+            # Look for bracket structure, locating every region in one pass
+            sections = _region_sections(doc)
             
-            for region in regions:
+            for region in REGION_CLASS_RES:
                 region_data = {
                     'name': region.title(),
                     'teams': [],
@@ -290,12 +374,13 @@ class NCAAStatsScraper:
                 }
                 
                 # Find region-specific elements
-                region_section = soup.find(['div', 'section'], class_=lambda x: x and region in x.lower() if x else False)
-                if region_section:
+                region_section = sections.get(region)
+                if region_section is not None:
                     # Extract teams and games from region
-                    teams = region_section.find_all(['span', 'div'], class_=lambda x: x and 'team' in x.lower() if x else False)
-                    for team in teams:
-                        team_name = team.get_text(strip=True)
+                    for team in region_section.iterdescendants('span', 'div'):
+                        if not TEAM_CLASS_RE.search(team.get('class', '')):
+                            continue
+                        team_name = _text(team)
                         if team_name:
                             region_data['teams'].append(team_name)
                 
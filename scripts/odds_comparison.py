@@ -11,19 +11,36 @@ Usage:
 """
 
 import argparse
+import io
 import json
+import re
 import sys
 import traceback
-from typing import Dict, List, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any
 
 try:
     import requests
     from bs4 import BeautifulSoup
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry, make_headers
     import pandas as pd
 except ImportError:
     print("Error: Install with: pip3 install requests beautifulsoup4 lxml pandas")
     sys.exit(1)
 
+try:
+    import pyarrow
+    import pyarrow.csv as pyarrow_csv
+except ImportError:
+    pyarrow = None
+
+# Row count above which CSV output goes through Arrow's native writer instead of a DataFrame
+ARROW_CSV_MIN_ROWS = 500
+
+# Case-insensitive class-name match for game containers, without a Python callback per element
+GAME_CLASS_RE = re.compile('game', re.I)
+
 class OddsComparison:
     def __init__(self, debug: bool = False):
         self.debug = debug
@@ -34,32 +51,69 @@ class OddsComparison:
         }
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+            'Accept': 'text/html,application/xhtml+xml',
+            'Accept-Language': 'en-US,en;q=0.9',
+            'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding']
         })
         
+        # Keep-alive pool sized for concurrent requests to every odds source, retrying rate limits and transient errors
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        self.session.mount('https://', adapter)
+        
     def log(self, message: str):
         if self.debug:
             print(f"[DEBUG] {message}", file=sys.stderr)
     
     def format_output(self, data: Any, pretty: bool = False, csv: bool = False) -> str:
         if csv and isinstance(data, list) and len(data) > 0 and isinstance(data[0], dict):
+            if pyarrow is not None and len(data) > ARROW_CSV_MIN_ROWS:
+                output = self._arrow_csv(data)
+                if output is not None:
+                    return output
             return pd.DataFrame(data).to_csv(index=False)
         return json.dumps(data, indent=2 if pretty else None, default=str)
     
+    def _arrow_csv(self, data: List[Dict]) -> Optional[str]:
+        """CSV for row dicts via Arrow's writer; None if Arrow can't type a column."""
+        # Columns from every row, in first-seen order; missing keys become empty fields
+        columns = list(dict.fromkeys(k for row in data for k in row))
+        try:
+            table = pyarrow.table({c: [row.get(c) for row in data] for c in columns})
+            buf = io.BytesIO()
+            pyarrow_csv.write_csv(table, buf)
+        except pyarrow.ArrowException as e:
+            self.log(f"Arrow CSV writer failed, using pandas: {str(e)}")
+            return None
+        return buf.getvalue().decode()
+    
     def get_today_odds(self) -> List[Dict]:
         """Get today's odds from multiple sources."""
         try:
             all_odds = []
             
-            # Get odds from each source
-            for source, base_url in self.sources.items():
-                try:
-                    source_odds = self.scrape_source_odds(source, base_url)
-                    for odds in source_odds:
-                        odds['source'] = source
-                    all_odds.extend(source_odds)
-                except Exception as e:
-                    self.log(f"Error getting odds from {source}: {str(e)}")
+            # Fetch every source at once; results are collected in source order so output stays stable
+            with ThreadPoolExecutor(max_workers=len(self.sources)) as executor:
+                futures = {
+                    source: executor.submit(self.scrape_source_odds, source, base_url)
+                    for source, base_url in self.sources.items()
+                }
+                for source, future in futures.items():
+                    try:
+                        source_odds = future.result()
+                        for odds in source_odds:
+                            odds['source'] = source
+                        all_odds.extend(source_odds)
+                    except Exception as e:
+                        self.log(f"Error getting odds from {source}: {str(e)}")
             
             # Group by game
             games = {}
@@ -101,13 +155,13 @@ class OddsComparison:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             # Parse odds based on source format
             odds = []
             
             # Generic parsing - would need to be customized per source
-            game_containers = soup.find_all(['div', 'tr'], class_=lambda x: x and 'game' in x.lower() if x else False)
+            game_containers = soup.find_all(['div', 'tr'], class_=GAME_CLASS_RE)
             
             for container in game_containers[:5]:  # Limit to prevent errors
                 try:
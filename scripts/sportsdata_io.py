@@ -10,37 +10,81 @@ import argparse
 import json
 import os
 import sys
+from datetime import date, timedelta
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
 except ImportError:
     print("Install: pip install requests", file=sys.stderr)
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
 BASE_URL = "https://api.sportsdata.io/v3/cbb"
 API_KEY = os.environ.get("SPORTSDATA_API_KEY", "")
 
+# Near-static endpoints kept on disk; once stale they are revalidated with ETag/Last-Modified.
+# Everything else (today's games, odds, season stats) always goes to the network.
+CACHE_EXPIRY = {
+    "*/scores/json/teams": timedelta(days=1),
+    "*/scores/json/Games/*": timedelta(hours=1),
+    "*/scores/json/Standings/*": timedelta(hours=1),
+}
+
+def _build_session(use_cache: bool = True) -> requests.Session:
+    """Keep-alive session for every call, disk-cached for static endpoints when requests-cache is installed."""
+    if use_cache and requests_cache is not None:
+        session = requests_cache.CachedSession(
+            "sportsdata_io_cache",
+            backend="sqlite",
+            use_cache_dir=True,
+            urls_expire_after={**CACHE_EXPIRY, "*": requests_cache.DO_NOT_CACHE},
+            allowable_codes=[200],
+            # Keep the subscription key out of the cached request data
+            ignored_parameters=["Ocp-Apim-Subscription-Key"]
+        )
+    else:
+        session = requests.Session()
+    session.headers.update({"Ocp-Apim-Subscription-Key": API_KEY})
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
+    return session
+
+# One session for every call, so repeated requests skip the TCP/TLS handshake
+_SESSION = _build_session()
+
 def _get(endpoint: str, params: dict = None) -> dict:
     """Make API request to SportsDataIO."""
     if not API_KEY:
         return {"error": "Set SPORTSDATA_API_KEY environment variable. Get free key at sportsdata.io"}
     
     url = f"{BASE_URL}/{endpoint}"
-    headers = {"Ocp-Apim-Subscription-Key": API_KEY}
     
     try:
-        resp = requests.get(url, headers=headers, params=params, timeout=15)
+        resp = _SESSION.get(url, params=params, timeout=15)
         resp.raise_for_status()
-        return resp.json()
+        # Decode the raw body with orjson when available; stdlib json otherwise
+        return orjson.loads(resp.content) if orjson is not None else resp.json()
     except requests.exceptions.HTTPError as e:
         return {"error": f"HTTP {resp.status_code}: {str(e)}", "url": url}
     except Exception as e:
         return {"error": str(e)}
 
+def _today() -> str:
+    """Today's date as the API expects it (YYYY-MM-DD)."""
+    return date.today().strftime("%Y-%m-%d")
+
 def get_games_today(pretty: bool = False) -> dict:
     """Get today's games."""
-    from datetime import date
-    today = date.today().strftime("%Y-%m-%d")
+    today = _today()
     result = _get(f"scores/json/GamesByDate/{today}")
     return {"date": today, "games": result, "source": "sportsdata.io"}
 
@@ -66,8 +110,7 @@ def get_player_stats(season: int = 2026, pretty: bool = False) -> dict:
 
 def get_odds(pretty: bool = False) -> dict:
     """Get current game odds."""
-    from datetime import date
-    today = date.today().strftime("%Y-%m-%d")
+    today = _today()
     result = _get(f"odds/json/GameOddsByDate/{today}")
     return {"date": today, "odds": result, "source": "sportsdata.io"}
 
@@ -79,6 +122,7 @@ def get_schedule(season: int = 2026, pretty: bool = False) -> dict:
 def main():
     parser = argparse.ArgumentParser(description="SportsData.io NCAAB API")
     parser.add_argument("--key", help="API key (or set SPORTSDATA_API_KEY env var)")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the on-disk cache for teams/standings/schedule")
     sub = parser.add_subparsers(dest="command")
     
     sub.add_parser("today", help="Today's games")
@@ -103,9 +147,13 @@ def main():
     
     args = parser.parse_args()
     
+    global API_KEY, _SESSION
     if args.key:
-        global API_KEY
         API_KEY = args.key
+        _SESSION.headers["Ocp-Apim-Subscription-Key"] = API_KEY
+    
+    if args.no_cache:
+        _SESSION = _build_session(use_cache=False)
     
     if not args.command:
         parser.print_help()
@@ -123,8 +171,12 @@ def main():
     }
     
     result = commands[args.command]()
-    indent = 2 if getattr(args, "pretty", False) else None
-    print(json.dumps(result, indent=indent, default=str))
+    pretty = getattr(args, "pretty", False)
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        print(orjson.dumps(result, default=str, option=option).decode())
+    else:
+        print(json.dumps(result, indent=2 if pretty else None, default=str))
 
 if __name__ == "__main__":
     main()
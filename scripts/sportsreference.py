@@ -5,98 +5,229 @@ Scrapes basketball-reference.com/cbb for college basketball stats.
 """
 
 import argparse
+import functools
+import inspect
 import json
+import os
+import socketserver
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 
 try:
     import requests
-    from bs4 import BeautifulSoup
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry, make_headers
+    import lxml.html
+    from lxml import etree
 except ImportError:
-    print("Install dependencies: pip install requests beautifulsoup4", file=sys.stderr)
+    print("Install dependencies: pip install requests lxml", file=sys.stderr)
     sys.exit(1)
 
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from diskcache import Cache
+except ImportError:
+    Cache = None
+
 BASE_URL = "https://www.sports-reference.com/cbb"
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+    "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"],
 }
 
+# Stats pages change a few times a day; cached responses are revalidated with ETag/Last-Modified once stale
+CACHE_EXPIRY = timedelta(hours=6)
+
+def _build_session(use_cache: bool = True) -> requests.Session:
+    """Keep-alive session for every request (same host): disk-cached when requests-cache is installed."""
+    if use_cache and requests_cache is not None:
+        session = requests_cache.CachedSession(
+            "sportsreference_cache",
+            backend="sqlite",
+            use_cache_dir=True,
+            expire_after=CACHE_EXPIRY,
+            allowable_codes=[200],
+            cache_control=True
+        )
+    else:
+        session = requests.Session()
+    session.headers.update(HEADERS)
+    # sports-reference answers bursts with 429 and a Retry-After; wait it out instead of failing the page
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=4,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            respect_retry_after_header=True
+        )
+    ))
+    return session
+
+_SESSION = _build_session()
+
+# Parsed results kept on disk (with diskcache), so a repeat run skips both the fetch and the parse
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "sportsreference")
+RESULT_TTL = 3600
+
+_RESULTS = Cache(CACHE_DIR) if Cache is not None else None
+
+def _cached_result(func):
+    """Cache func's successful results on disk, keyed by its name and normalized arguments (team names match case-insensitively)."""
+    signature = inspect.signature(func)
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _RESULTS is None:
+            return func(*args, **kwargs)
+        
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = (func.__name__,) + tuple(
+            " ".join(value.lower().split()) if isinstance(value, str) else value
+            for name, value in bound.arguments.items() if name != "pretty"
+        )
+        result = _RESULTS.get(key)
+        if result is None:
+            result = func(*args, **kwargs)
+            if "error" not in result:
+                _RESULTS.set(key, result, expire=RESULT_TTL)
+        return result
+    
+    return wrapper
+
+# Pages in flight at once for batch fetches; higher risks sports-reference's rate limiting
+MAX_CONCURRENT_REQUESTS = 8
+
+# Daemon mode: default socket, and the CLI defaults filled in for fields a request leaves out
+DEFAULT_SOCKET = "/tmp/sportsreference.sock"
+REQUEST_DEFAULTS = {"season": 2026, "poll": "ap", "conference": "big-12", "concurrency": MAX_CONCURRENT_REQUESTS, "pretty": False}
+
+# Compiled once at import; tables are read straight from the lxml tree with no per-cell wrapper objects
+ROWS_XPATH = etree.XPath("./tbody/tr")
+FIRST_ROW_XPATH = etree.XPath("./tbody/tr[1]")
+# Only cells with a non-empty data-stat name; the rest are skipped inside lxml rather than in Python
+CELLS_WITH_STAT_XPATH = etree.XPath("./td[@data-stat != '']|./th[@data-stat != '']")
+DATA_CELLS_WITH_STAT_XPATH = etree.XPath("./td[@data-stat != '']")
+RECORD_XPATH = etree.XPath("(//*[@data-stat='overall_record'])[1]")
+RECORD_TEXT_XPATH = etree.XPath("(//text()[contains(., 'Record:')])[1]")
+SEARCH_LINKS_XPATH = etree.XPath("//*[contains(concat(' ', normalize-space(@class), ' '), ' search-item ')]//a")
+TABLE_ROWS_XPATH = etree.XPath("//table/tbody/tr")
+# Body rows with at least one named cell, i.e. the rows _row_stats turns into a non-empty dict
+STAT_ROWS_XPATH = etree.XPath("./tbody/tr[td[@data-stat != ''] or th[@data-stat != '']]")
+
+# Rows kept per result; parsing stops once these are filled
+RECENT_GAMES = 10
+MAX_RANKINGS = 25
+MAX_STANDINGS = 50
+
+def _text(element) -> str:
+    """Element text with each text node stripped and joined, like BeautifulSoup's get_text(strip=True)."""
+    return "".join(text.strip() for text in element.itertext())
+
+def _row_stats(row, cells_xpath=CELLS_WITH_STAT_XPATH) -> dict:
+    """Map each cell's data-stat name to its text, skipping cells without one."""
+    return {cell.get("data-stat"): _text(cell) for cell in cells_xpath(row)}
+
+def team_url(team: str, season: int = 2026) -> str:
+    """School season page URL for a team name."""
+    team_slug = team.lower().replace(" ", "-")
+    return f"{BASE_URL}/schools/{team_slug}/men/{season}.html"
+
+def parse_team_stats(content: bytes, team: str, season: int, url: str) -> dict:
+    """Build the team stats result from a school season page."""
+    tree = lxml.html.fromstring(content)
+    
+    # Team info
+    info = {"team": team, "season": season, "url": url}
+    
+    # Overall record
+    record_el = RECORD_XPATH(tree)
+    if record_el:
+        info["record"] = _text(record_el[0])
+    else:
+        record_text = RECORD_TEXT_XPATH(tree)
+        if record_text:
+            info["record"] = str(record_text[0]).strip()
+    
+    # Per game stats table
+    per_game = tree.get_element_by_id("per_game", None)
+    if per_game is not None:
+        # The team's own row comes first; later rows share its data-stat names and would overwrite it
+        row = FIRST_ROW_XPATH(per_game)
+        info["per_game_stats"] = _row_stats(row[0], DATA_CELLS_WITH_STAT_XPATH) if row else {}
+    
+    # Schedule/results
+    schedule = tree.get_element_by_id("schedule", None)
+    if schedule is not None:
+        rows = STAT_ROWS_XPATH(schedule)
+        # Only the most recent games are parsed, walking back from the end of the season
+        games = [_row_stats(row) for row in rows[:-RECENT_GAMES - 1:-1]]
+        games.reverse()
+        info["games"] = games  # Last 10 games
+        info["total_games"] = len(rows)
+    
+    info["source"] = "sports-reference.com"
+    return info
+
+@_cached_result
 def get_team_stats(team: str, season: int = 2026, pretty: bool = False) -> dict:
     """Get team stats from sports-reference."""
-    team_slug = team.lower().replace(" ", "-")
-    url = f"{BASE_URL}/schools/{team_slug}/men/{season}.html"
+    url = team_url(team, season)
     
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=15)
+        resp = _SESSION.get(url, timeout=15)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
-        
-        # Team info
-        info = {"team": team, "season": season, "url": url}
-        
-        # Overall record
-        record_el = soup.select_one("[data-stat='overall_record']") or soup.find(string=lambda s: s and "Record:" in str(s))
-        if record_el:
-            info["record"] = record_el.get_text(strip=True) if hasattr(record_el, 'get_text') else str(record_el).strip()
-        
-        # Per game stats table
-        per_game = soup.select_one("#per_game")
-        if per_game:
-            stats = {}
-            for row in per_game.select("tbody tr"):
-                cells = row.select("td")
-                if cells:
-                    for cell in cells:
-                        stat_name = cell.get("data-stat", "")
-                        if stat_name:
-                            stats[stat_name] = cell.get_text(strip=True)
-            info["per_game_stats"] = stats
-        
-        # Schedule/results
-        schedule = soup.select_one("#schedule")
-        if schedule:
-            games = []
-            for row in schedule.select("tbody tr"):
-                game = {}
-                for cell in row.select("td, th"):
-                    stat = cell.get("data-stat", "")
-                    if stat:
-                        game[stat] = cell.get_text(strip=True)
-                if game:
-                    games.append(game)
-            info["games"] = games[:10]  # Last 10 games
-            info["total_games"] = len(games)
-        
-        info["source"] = "sports-reference.com"
-        return info
-        
+        return parse_team_stats(resp.content, team, season, url)
     except Exception as e:
         return {"team": team, "error": str(e), "source": "sports-reference.com"}
 
+def get_team_stats_batch(teams: list, season: int = 2026, limit: int = MAX_CONCURRENT_REQUESTS) -> list:
+    """Get team stats for several teams, fetched concurrently; results keep the input order.
+    
+    Each team goes through get_team_stats, so cached teams skip the network and rate limits are retried with backoff.
+    """
+    with ThreadPoolExecutor(max_workers=limit) as pool:
+        return list(pool.map(lambda team: get_team_stats(team, season), teams))
+
+@_cached_result
 def get_rankings(season: int = 2026, poll: str = "ap", pretty: bool = False) -> dict:
     """Get AP or Coaches poll rankings."""
     url = f"{BASE_URL}/seasons/{season}-polls.html"
     
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=15)
+        resp = _SESSION.get(url, timeout=15)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
+        tree = lxml.html.fromstring(resp.content)
         
         rankings = []
-        table = soup.select_one(f"#{poll}-poll") or soup.select_one("table")
-        if table:
-            for row in table.select("tbody tr"):
-                entry = {}
-                for cell in row.select("td, th"):
-                    stat = cell.get("data-stat", "")
-                    if stat:
-                        entry[stat] = cell.get_text(strip=True)
+        table = tree.get_element_by_id(f"{poll}-poll", None)
+        if table is None:
+            table = tree.find(".//table")
+        if table is not None:
+            for row in ROWS_XPATH(table):
+                entry = _row_stats(row)
                 if entry:
                     rankings.append(entry)
+                    if len(rankings) == MAX_RANKINGS:
+                        break
         
         return {
             "poll": poll.upper(),
             "season": season,
-            "rankings": rankings[:25],
+            "rankings": rankings,
             "source": "sports-reference.com"
         }
     except Exception as e:
@@ -107,23 +238,19 @@ def get_player_stats(player: str, pretty: bool = False) -> dict:
     search_url = f"{BASE_URL}/search/search.fcgi?search={player.replace(' ', '+')}"
     
     try:
-        resp = requests.get(search_url, headers=HEADERS, timeout=15, allow_redirects=True)
+        resp = _SESSION.get(search_url, timeout=15, allow_redirects=True)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
+        tree = lxml.html.fromstring(resp.content)
         
         # Check if redirected to player page
         if "/players/" in resp.url:
             info = {"player": player, "url": resp.url}
             
-            per_game = soup.select_one("#per_game")
-            if per_game:
+            per_game = tree.get_element_by_id("per_game", None)
+            if per_game is not None:
                 seasons = []
-                for row in per_game.select("tbody tr"):
-                    season = {}
-                    for cell in row.select("td, th"):
-                        stat = cell.get("data-stat", "")
-                        if stat:
-                            season[stat] = cell.get_text(strip=True)
+                for row in ROWS_XPATH(per_game):
+                    season = _row_stats(row)
                     if season:
                         seasons.append(season)
                 info["seasons"] = seasons
@@ -133,43 +260,91 @@ def get_player_stats(player: str, pretty: bool = False) -> dict:
         
         # Search results
         results = []
-        for link in soup.select(".search-item a"):
-            results.append({"name": link.get_text(strip=True), "url": link.get("href", "")})
+        for link in SEARCH_LINKS_XPATH(tree):
+            results.append({"name": _text(link), "url": link.get("href", "")})
         
         return {"player": player, "search_results": results[:10], "source": "sports-reference.com"}
         
     except Exception as e:
         return {"player": player, "error": str(e), "source": "sports-reference.com"}
 
+@_cached_result
 def get_conference_standings(conference: str = "big-12", season: int = 2026, pretty: bool = False) -> dict:
     """Get conference standings."""
     url = f"{BASE_URL}/seasons/{season}.html"
     
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=15)
+        resp = _SESSION.get(url, timeout=15)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
+        tree = lxml.html.fromstring(resp.content)
         
         teams = []
-        for row in soup.select("table tbody tr"):
-            team = {}
-            for cell in row.select("td, th"):
-                stat = cell.get("data-stat", "")
-                if stat:
-                    team[stat] = cell.get_text(strip=True)
+        for row in TABLE_ROWS_XPATH(tree):
+            team = _row_stats(row)
             if team:
                 teams.append(team)
+                if len(teams) == MAX_STANDINGS:
+                    break
         
         return {
             "season": season,
-            "teams": teams[:50],
+            "teams": teams,
             "source": "sports-reference.com"
         }
     except Exception as e:
         return {"error": str(e), "source": "sports-reference.com"}
 
+def _dumps(result, pretty: bool = False) -> str:
+    """Serialize a result as JSON, with orjson when installed."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(result, default=str, option=option).decode()
+    return json.dumps(result, indent=2 if pretty else None, default=str)
+
+def run_command(args: argparse.Namespace):
+    """Run a CLI command and return its result."""
+    if args.command == "team":
+        return get_team_stats(args.name, args.season, args.pretty)
+    elif args.command == "rankings":
+        return get_rankings(args.season, args.poll, args.pretty)
+    elif args.command == "player":
+        return get_player_stats(args.name, args.pretty)
+    elif args.command == "standings":
+        return get_conference_standings(args.conference, args.season, args.pretty)
+    elif args.command == "batch":
+        with (sys.stdin if args.file == "-" else open(args.file)) as f:
+            teams = [line.strip() for line in f if line.strip()]
+        return get_team_stats_batch(teams, args.season, args.concurrency)
+    raise ValueError(f"Unknown command: {args.command}")
+
+def serve(socket_path: str = DEFAULT_SOCKET):
+    """Answer commands over a Unix socket, one JSON request per line (e.g. {"command": "team", "name": "Duke"}).
+    
+    Imports, the HTTP session and the result cache live for the whole daemon, so repeat queries skip start-up.
+    """
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for line in self.rfile:
+                try:
+                    request = argparse.Namespace(**{**REQUEST_DEFAULTS, **json.loads(line)})
+                    reply = run_command(request)
+                except Exception as e:
+                    reply = {"error": str(e), "source": "sports-reference.com"}
+                self.wfile.write(_dumps(reply).encode() + b"\n")
+    
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    
+    with socketserver.UnixStreamServer(socket_path, Handler) as server:
+        print(f"Serving on {socket_path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        finally:
+            os.unlink(socket_path)
+
 def main():
     parser = argparse.ArgumentParser(description="Sports-Reference NCAAB Scraper")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the on-disk HTTP response cache")
     sub = parser.add_subparsers(dest="command")
     
     t = sub.add_parser("team", help="Team stats")
@@ -191,23 +366,32 @@ def main():
     c.add_argument("--season", type=int, default=2026)
     c.add_argument("--pretty", action="store_true")
     
+    b = sub.add_parser("batch", help="Team stats for every team listed in a file, fetched concurrently")
+    b.add_argument("file", help="File with one team name per line ('-' for stdin)")
+    b.add_argument("--season", type=int, default=2026)
+    b.add_argument("--concurrency", type=int, default=MAX_CONCURRENT_REQUESTS, help="Pages in flight at once")
+    b.add_argument("--pretty", action="store_true")
+    
+    d = sub.add_parser("serve", help="Run as a daemon answering JSON-line commands on a Unix socket")
+    d.add_argument("--socket", default=DEFAULT_SOCKET, help="Unix socket path")
+    
     args = parser.parse_args()
     
     if not args.command:
         parser.print_help()
         sys.exit(1)
     
-    if args.command == "team":
-        result = get_team_stats(args.name, args.season, args.pretty)
-    elif args.command == "rankings":
-        result = get_rankings(args.season, args.poll, args.pretty)
-    elif args.command == "player":
-        result = get_player_stats(args.name, args.pretty)
-    elif args.command == "standings":
-        result = get_conference_standings(args.conference, args.season, args.pretty)
+    if args.no_cache:
+        global _SESSION, _RESULTS
+        _SESSION = _build_session(use_cache=False)
+        _RESULTS = None
+    
+    if args.command == "serve":
+        serve(args.socket)
+        return
     
-    indent = 2 if getattr(args, "pretty", False) else None
-    print(json.dumps(result, indent=indent, default=str))
+    result = run_command(args)
+    print(_dumps(result, getattr(args, "pretty", False)))
 
 if __name__ == "__main__":
     main()
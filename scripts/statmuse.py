@@ -6,48 +6,179 @@ StatMuse lets you ask questions in plain English and get stats back.
 """
 
 import argparse
+import functools
+import inspect
 import json
+import os
+import socketserver
 import sys
 import re
+import time
 import urllib.parse
+from datetime import timedelta
 
 try:
     import requests
-    from bs4 import BeautifulSoup
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry, make_headers
+    import lxml.html
+    from lxml import etree
 except ImportError:
-    print("Install dependencies: pip install requests beautifulsoup4", file=sys.stderr)
+    print("Install dependencies: pip install requests lxml", file=sys.stderr)
     sys.exit(1)
 
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from diskcache import Cache
+except ImportError:
+    Cache = None
+
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
     "Accept": "text/html,application/xhtml+xml",
+    "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"],
 }
 
+# Stats pages change a few times a day; cached responses are revalidated with ETag/Last-Modified once stale
+CACHE_EXPIRY = timedelta(hours=6)
+
+def _build_session(use_cache: bool = True) -> requests.Session:
+    """Keep-alive session for every request (same host): disk-cached when requests-cache is installed."""
+    if use_cache and requests_cache is not None:
+        session = requests_cache.CachedSession(
+            "statmuse_cache",
+            backend="sqlite",
+            use_cache_dir=True,
+            expire_after=CACHE_EXPIRY,
+            allowable_codes=[200],
+            cache_control=True
+        )
+    else:
+        session = requests.Session()
+    session.headers.update(HEADERS)
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=4,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            respect_retry_after_header=True
+        )
+    ))
+    return session
+
+_SESSION = _build_session()
+
+# Daemon mode: default socket, and the CLI defaults filled in for fields a request leaves out
+DEFAULT_SOCKET = "/tmp/statmuse.sock"
+REQUEST_DEFAULTS = {"season": "2025-26", "pretty": False}
+
+# Parsed results kept on disk (with diskcache), so a repeat run skips both the fetch and the parse
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "statmuse")
+RESULT_TTL = 3600
+
+_RESULTS = Cache(CACHE_DIR) if Cache is not None else None
+
+# Successful results also kept in memory for the life of the process (e.g. a serve daemon), so helpers
+# asking the same question again skip even the disk read; oldest entries are dropped past MEMO_SIZE
+MEMO_SIZE = 1024
+_MEMO = {}
+
+def _cached_result(func):
+    """Cache func's successful results in memory and on disk, keyed by its name and normalized arguments (questions match case- and whitespace-insensitively)."""
+    signature = inspect.signature(func)
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _RESULTS is None and _MEMO is None:
+            return func(*args, **kwargs)
+        
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = (func.__name__,) + tuple(
+            " ".join(value.lower().split()) if isinstance(value, str) else value
+            for name, value in bound.arguments.items() if name != "pretty"
+        )
+        if _MEMO is not None:
+            expires, result = _MEMO.get(key, (0, None))
+            if expires > time.monotonic():
+                return result
+        
+        result = _RESULTS.get(key) if _RESULTS is not None else None
+        if result is None:
+            result = func(*args, **kwargs)
+            if "error" in result:
+                return result
+            if _RESULTS is not None:
+                _RESULTS.set(key, result, expire=RESULT_TTL)
+        if _MEMO is not None:
+            if len(_MEMO) >= MEMO_SIZE:
+                del _MEMO[next(iter(_MEMO))]
+            _MEMO[key] = (time.monotonic() + RESULT_TTL, result)
+        return result
+    
+    return wrapper
+
+# Compiled once at import; answer and tables are read straight from the lxml tree
+ANSWER_XPATH = etree.XPath("(//*[contains(@class, 'answer')])[1]")
+TABLES_XPATH = etree.XPath("//table")
+# Column names from <thead>, or from the first row's <th> cells when there is no <thead>
+HEADER_CELLS_XPATH = etree.XPath(".//thead//th")
+FIRST_ROW_HEADERS_XPATH = etree.XPath("(.//tr)[1]/th")
+BODY_ROWS_XPATH = etree.XPath(".//tbody//tr")
+ROW_CELLS_XPATH = etree.XPath("./td|./th")
+
+def _text(element) -> str:
+    """Element text with each text node stripped and joined, like BeautifulSoup's get_text(strip=True)."""
+    return "".join(text.strip() for text in element.itertext())
+
+@functools.lru_cache(maxsize=1024)
+def _statmuse_url(question: str) -> str:
+    """Answer page URL for a question; the helper queries repeat the same phrasings."""
+    return f"https://www.statmuse.com/cbb/ask/{urllib.parse.quote(question)}"
+
+@_cached_result
 def query_statmuse(question: str, pretty: bool = False) -> dict:
     """Ask StatMuse a natural language question about NCAAB stats."""
-    encoded = urllib.parse.quote(question)
-    url = f"https://www.statmuse.com/cbb/ask/{encoded}"
+    url = _statmuse_url(question)
     
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=15)
+        resp = _SESSION.get(url, timeout=15)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
+        tree = lxml.html.fromstring(resp.content)
         
-        # Extract the answer
-        answer_el = soup.select_one("[class*='answer']") or soup.select_one("[class*='nlg-answer']")
-        answer_text = answer_el.get_text(strip=True) if answer_el else None
+        # Extract the answer (any class containing 'answer', which covers 'nlg-answer')
+        answer_el = ANSWER_XPATH(tree)
+        answer_text = _text(answer_el[0]) if answer_el else None
         
         # Extract stats table if present
         tables = []
-        for table in soup.select("table"):
-            headers = [th.get_text(strip=True) for th in table.select("th")]
-            rows = []
-            for tr in table.select("tbody tr"):
-                cells = [td.get_text(strip=True) for td in tr.select("td")]
-                if headers and cells:
-                    rows.append(dict(zip(headers, cells)))
-                elif cells:
-                    rows.append(cells)
+        for table in TABLES_XPATH(tree):
+            body_rows = BODY_ROWS_XPATH(table)
+            header_cells = HEADER_CELLS_XPATH(table)
+            if not header_cells:
+                header_cells = FIRST_ROW_HEADERS_XPATH(table)
+                # A header row inside <tbody> is not data
+                if header_cells and body_rows and body_rows[0] is header_cells[0].getparent():
+                    body_rows = body_rows[1:]
+            headers = [_text(th) for th in header_cells]
+            # Row header cells (<th>, e.g. rank) are kept so values line up with the column names
+            row_cells = ([_text(cell) for cell in ROW_CELLS_XPATH(tr)] for tr in body_rows)
+            if headers:
+                rows = [dict(zip(headers, cells)) for cells in row_cells if cells]
+            else:
+                rows = [cells for cells in row_cells if cells]
             if rows:
                 tables.append({"headers": headers, "rows": rows})
         
@@ -80,8 +211,56 @@ def leader_query(stat: str, season: str = "2025-26", pretty: bool = False) -> di
     """Find stat leaders."""
     return query_statmuse(f"who leads ncaa basketball in {stat} {season}", pretty)
 
+def _dumps(result, pretty: bool = False) -> str:
+    """Serialize a result as JSON, with orjson when installed."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(result, default=str, option=option).decode()
+    return json.dumps(result, indent=2 if pretty else None, default=str)
+
+def run_command(args: argparse.Namespace) -> dict:
+    """Run a CLI command and return its result."""
+    if args.command == "query":
+        question = args.question if isinstance(args.question, str) else " ".join(args.question)
+        return query_statmuse(question, args.pretty)
+    elif args.command == "team":
+        return team_stats(args.name, args.season, args.pretty)
+    elif args.command == "player":
+        return player_stats(args.name, args.season, args.pretty)
+    elif args.command == "h2h":
+        return head_to_head(args.team1, args.team2, args.pretty)
+    elif args.command == "leaders":
+        return leader_query(args.stat, args.season, args.pretty)
+    raise ValueError(f"Unknown command: {args.command}")
+
+def serve(socket_path: str = DEFAULT_SOCKET):
+    """Answer commands over a Unix socket, one JSON request per line (e.g. {"command": "query", "question": "..."}).
+    
+    Imports, the HTTP session and the result cache live for the whole daemon, so repeat queries skip start-up.
+    """
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for line in self.rfile:
+                try:
+                    request = argparse.Namespace(**{**REQUEST_DEFAULTS, **json.loads(line)})
+                    reply = run_command(request)
+                except Exception as e:
+                    reply = {"error": str(e), "source": "statmuse.com"}
+                self.wfile.write(_dumps(reply).encode() + b"\n")
+    
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    
+    with socketserver.UnixStreamServer(socket_path, Handler) as server:
+        print(f"Serving on {socket_path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        finally:
+            os.unlink(socket_path)
+
 def main():
     parser = argparse.ArgumentParser(description="StatMuse NCAAB Query Tool")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the on-disk HTTP response cache")
     sub = parser.add_subparsers(dest="command", help="Command to run")
     
     # Query command
@@ -113,25 +292,28 @@ def main():
     l.add_argument("--season", default="2025-26")
     l.add_argument("--pretty", action="store_true")
     
+    # Daemon
+    d = sub.add_parser("serve", help="Run as a daemon answering JSON-line commands on a Unix socket")
+    d.add_argument("--socket", default=DEFAULT_SOCKET, help="Unix socket path")
+    
     args = parser.parse_args()
     
     if not args.command:
         parser.print_help()
         sys.exit(1)
     
-    if args.command == "query":
-        result = query_statmuse(" ".join(args.question), args.pretty)
-    elif args.command == "team":
-        result = team_stats(args.name, args.season, args.pretty)
-    elif args.command == "player":
-        result = player_stats(args.name, args.season, args.pretty)
-    elif args.command == "h2h":
-        result = head_to_head(args.team1, args.team2, args.pretty)
-    elif args.command == "leaders":
-        result = leader_query(args.stat, args.season, args.pretty)
+    if args.no_cache:
+        global _SESSION, _RESULTS, _MEMO
+        _SESSION = _build_session(use_cache=False)
+        _RESULTS = None
+        _MEMO = None
+    
+    if args.command == "serve":
+        serve(args.socket)
+        return
     
-    indent = 2 if getattr(args, "pretty", False) else None
-    print(json.dumps(result, indent=indent, default=str))
+    result = run_command(args)
+    print(_dumps(result, getattr(args, "pretty", False)))
 
 if __name__ == "__main__":
     main()
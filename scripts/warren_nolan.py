@@ -8,47 +8,151 @@ Usage:
     python3 warren_nolan.py net --top 25
     python3 warren_nolan.py bracket-projection
     python3 warren_nolan.py nitty-gritty --team "Duke"
+    python3 warren_nolan.py --serve --socket /tmp/warren_nolan.sock
 """
 
 import argparse
+import io
 import json
+import os
+import socketserver
 import sys
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from csv import DictWriter
+from datetime import timedelta
 from typing import Dict, List, Any
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry, make_headers
     from bs4 import BeautifulSoup
-    import pandas as pd
 except ImportError:
-    print("Error: Install with: pip3 install requests beautifulsoup4 lxml pandas")
+    print("Error: Install with: pip3 install requests beautifulsoup4 lxml")
     sys.exit(1)
 
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from diskcache import Cache
+except ImportError:
+    Cache = None
+
+# Rankings change a few times a day; cached responses are revalidated with ETag/Last-Modified once stale
+CACHE_EXPIRY = timedelta(hours=6)
+
+# Parsed results kept on disk (with diskcache), so a repeat run skips both the fetch and the parse
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'warren_nolan')
+RESULT_TTL = 3600
+
+# Pages fetched at once by _fetch_many; matches the session's connection pool
+MAX_CONCURRENT_REQUESTS = 8
+
+# Daemon mode: default socket, and the CLI defaults filled in for fields a request leaves out
+DEFAULT_SOCKET = '/tmp/warren_nolan.sock'
+REQUEST_DEFAULTS = {'top': None, 'team': None}
+
 class WarrenNolanScraper:
-    def __init__(self, debug: bool = False):
+    def __init__(self, debug: bool = False, use_cache: bool = True):
         self.debug = debug
         self.base_url = "https://www.warrennolan.com"
-        self.session = requests.Session()
+        if use_cache and requests_cache is not None:
+            # Persist responses on disk so repeated CLI runs skip the network
+            self.session = requests_cache.CachedSession(
+                'warren_nolan_cache',
+                backend='sqlite',
+                use_cache_dir=True,
+                expire_after=CACHE_EXPIRY,
+                allowable_codes=[200],
+                cache_control=True
+            )
+        else:
+            self.session = requests.Session()
+        self.cache = Cache(CACHE_DIR) if use_cache and Cache is not None else None
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+            'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding']
         })
         
+        adapter = HTTPAdapter(
+            pool_maxsize=MAX_CONCURRENT_REQUESTS,
+            max_retries=Retry(
+                total=4,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=['GET'],
+                respect_retry_after_header=True
+            )
+        )
+        self.session.mount('https://', adapter)
+        
     def log(self, message: str):
         if self.debug:
             print(f"[DEBUG] {message}", file=sys.stderr)
     
     def format_output(self, data: Any, pretty: bool = False, csv: bool = False) -> str:
         if csv and isinstance(data, list) and len(data) > 0 and isinstance(data[0], dict):
-            return pd.DataFrame(data).to_csv(index=False)
+            buf = io.StringIO()
+            writer = DictWriter(buf, fieldnames=list(dict.fromkeys(k for row in data for k in row)), lineterminator='\n')
+            writer.writeheader()
+            writer.writerows(data)
+            return buf.getvalue()
+        if orjson is not None:
+            option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(data, default=str, option=option).decode()
         return json.dumps(data, indent=2 if pretty else None, default=str)
     
+    def cached(self, key: tuple, fetch):
+        """Return the cached result for key, or call fetch() and cache it if it found anything."""
+        if self.cache is None:
+            return fetch()
+        
+        result = self.cache.get(key)
+        if result is not None:
+            self.log(f"Cache hit for {key}")
+            return result
+        
+        result = fetch()
+        if result:
+            self.cache.set(key, result, expire=RESULT_TTL)
+        return result
+    
+    def _fetch_many(self, urls: List[str]) -> List[Any]:
+        """Fetch independent pages on a thread pool; bodies keep the input order, failures come back as exceptions."""
+        def fetch(url):
+            try:
+                response = self.session.get(url, timeout=30)
+                response.raise_for_status()
+                return response.content
+            except Exception as e:
+                self.log(f"Request failed for {url}: {str(e)}")
+                return e
+        
+        # requests releases the GIL while waiting on sockets, so total time follows the slowest page
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as pool:
+            return list(pool.map(fetch, urls))
+    
     def get_net_rankings(self, top: int = None) -> List[Dict]:
+        return self.cached(('net', top), lambda: self.fetch_net_rankings(top))
+    
+    def fetch_net_rankings(self, top: int = None) -> List[Dict]:
         try:
             url = f"{self.base_url}/basketball/2024/net"
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             rankings = []
             
             table = soup.find('table')
@@ -73,24 +177,63 @@ class WarrenNolanScraper:
             self.log(f"Error: {str(e)}")
             return []
 
+def run_command(scraper: WarrenNolanScraper, args: argparse.Namespace) -> Any:
+    """Run a CLI command against the scraper and return its result."""
+    if args.command == 'net':
+        return scraper.get_net_rankings(args.top)
+    return {'error': 'Command not implemented yet'}
+
+def serve(scraper: WarrenNolanScraper, socket_path: str):
+    """Answer commands over a Unix socket, one JSON request per line (e.g. {"command": "net", "top": 25}).
+    
+    The scraper (HTTP session and result cache) lives for the whole daemon, so repeat queries skip start-up.
+    """
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for line in self.rfile:
+                try:
+                    request = argparse.Namespace(**{**REQUEST_DEFAULTS, **json.loads(line)})
+                    reply = run_command(scraper, request)
+                except Exception as e:
+                    scraper.log(f"Request failed: {str(e)}")
+                    reply = {'error': str(e)}
+                self.wfile.write(scraper.format_output(reply).encode() + b'\n')
+    
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    
+    with socketserver.UnixStreamServer(socket_path, Handler) as server:
+        print(f"Serving on {socket_path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        finally:
+            os.unlink(socket_path)
+
 def main():
     parser = argparse.ArgumentParser(description='Warren Nolan Data Scraper')
-    parser.add_argument('command', choices=['net', 'bracket-projection', 'nitty-gritty'])
+    parser.add_argument('command', nargs='?', choices=['net', 'bracket-projection', 'nitty-gritty'])
     parser.add_argument('--top', type=int, help='Limit results')
     parser.add_argument('--team', help='Team name')
     parser.add_argument('--pretty', action='store_true')
     parser.add_argument('--csv', action='store_true')
+    parser.add_argument('--no-cache', action='store_true', help='Bypass the on-disk HTTP response cache')
     parser.add_argument('--debug', action='store_true')
+    parser.add_argument('--serve', action='store_true', help='Run as a daemon answering commands on --socket')
+    parser.add_argument('--socket', default=DEFAULT_SOCKET, help='Unix socket path for --serve')
     
     args = parser.parse_args()
-    scraper = WarrenNolanScraper(debug=args.debug)
+    
+    if not args.serve and not args.command:
+        parser.error("a command is required unless --serve is given")
+    
+    scraper = WarrenNolanScraper(debug=args.debug, use_cache=not args.no_cache)
     
     try:
-        if args.command == 'net':
-            result = scraper.get_net_rankings(args.top)
-        else:
-            result = {'error': 'Command not implemented yet'}
+        if args.serve:
+            serve(scraper, args.socket)
+            return
         
+        result = run_command(scraper, args)
         print(scraper.format_output(result, args.pretty, args.csv))
     except Exception as e:
         print(f"Error: {str(e)}", file=sys.stderr)